@@ -3,6 +3,8 @@ import time
 import turtle
 import pdb
 
+from sprites import SpritePool
+
 #python3 -m pdb space.py
 #n execute une ligne
 #s entre dans une fonction
@@ -16,6 +18,9 @@ LASER_LENGTH = 20
 LASER_SPEED = 20
 ALIEN_SPAWN_INTERVAL = 0.5 #temps en secondes
 ALIEN_SPEED = 0.8
+#nombre maximal de tortues pour les lasers et les aliens
+LASER_POOL_SIZE = 256
+ALIEN_POOL_SIZE = 64
 
 window = turtle.Screen()
 window.tracer(0)
@@ -48,7 +53,21 @@ text.color(1, 1, 1)
 
 lasers = []
 aliens = []
-remove_list = []
+
+#les tortues retirées sont recyclées : turtle ne sait pas les supprimer
+def new_sprite():
+    sprite = turtle.Turtle()
+    sprite.hideturtle()
+    sprite.penup()
+    return sprite
+
+def hide_sprite(sprite):
+    sprite.clear()
+    sprite.hideturtle()
+    sprite.penup()
+
+laser_pool = SpritePool(new_sprite, hide_sprite, LASER_POOL_SIZE)
+alien_pool = SpritePool(new_sprite, hide_sprite, ALIEN_POOL_SIZE)
 
 def draw_cannon():
     cannon.clear()
@@ -65,13 +84,15 @@ def draw_cannon():
     cannon.sety(FLOOR_LEVEL)
 
 def create_alien():
-    alien = turtle.Turtle()
-    alien.penup()
+    alien = alien_pool.acquire()
+    if alien is None:
+        return
     alien.turtlesize(1.5)
     alien.setposition(random.randint(int(LEFT + GUTTER), int(RIGHT - GUTTER), ), TOP, )
     alien.shape("turtle")
     alien.setheading(-90)
     alien.color(random.random(), random.random(), random.random())
+    alien.showturtle()
     aliens.append(alien)
 
 
@@ -90,10 +111,10 @@ def move_right():
         draw_cannon()
 
 def create_lasers():
-    laser = turtle.Turtle()
-    laser.penup()
+    laser = laser_pool.acquire()
+    if laser is None:
+        return
     laser.color(1, 0, 0)
-    laser.hideturtle()
     laser.setposition(cannon.xcor(), cannon.ycor())
     laser.setheading(90)
     laser.forward(20)
@@ -103,10 +124,10 @@ def create_lasers():
     lasers.append(laser)
 
 def create_lasers2(x, y):
-    laser = turtle.Turtle()
-    laser.penup()
+    laser = laser_pool.acquire()
+    if laser is None:
+        return
     laser.color(1, 0, 0)
-    laser.hideturtle()
     laser.setposition(x, y)
     laser.setheading(90)
     laser.forward(20)
@@ -121,13 +142,10 @@ def move_laser(laser):
     laser.forward(LASER_LENGTH)
     laser.forward(-LASER_LENGTH)
         
-def remove_sprite(sprite, sprite_list):
-    sprite.clear()
-    sprite.hideturtle()
-    #window.update()
+def remove_sprite(sprite, sprite_list, pool):
+    #cache la tortue et la rend a son pool pour un prochain laser ou alien
     sprite_list.remove(sprite)
-    #turtle.turtles().remove(sprite)
-    remove_list.append(sprite)
+    pool.release(sprite)
 
 def atomic():
     #envoie des lasers sur toute la largeure de l'ecrant tout les x pixels
@@ -166,15 +184,15 @@ while game_running:
         move_laser(laser)
         if laser.ycor() > TOP:
             #pdb.set_trace()
-            remove_sprite(laser, lasers)
+            remove_sprite(laser, lasers, laser_pool)
             #break
         else:
 #verification de collision avec les aliens        
             for alien in aliens.copy():
                 if laser.distance(alien) < 20:
                     #pdb.set_trace()
-                    remove_sprite(laser, lasers)
-                    remove_sprite(alien, aliens)
+                    remove_sprite(laser, lasers, laser_pool)
+                    remove_sprite(alien, aliens, alien_pool)
                     score += 1
 
     if time.time() - alien_timer > ALIEN_SPAWN_INTERVAL :
@@ -187,9 +205,6 @@ while game_running:
             game_running = False
             break    
     window.update()
-    for sprite in remove_list:
-        turtle.turtles().remove(sprite)
-    remove_list.clear()
     time.sleep(0.01)
 
 print(tic)    
@@ -7,6 +7,8 @@ import random
 import time
 import turtle
 
+from sprites import SpritePool
+
 # ---------------------- Configuration ----------------------
 WINDOW_TITLE = "Space Invador+"
 WIDTH_RATIO = 0.7
@@ -21,6 +23,9 @@ ALIEN_SPAWN_INTERVAL = 1.2
 
 MAX_LIVES = 3
 STAR_COUNT = 60
+# Tortues recyclées : au-delà de 18 rangs, une vague déborde de l'écran
+LASER_POOL_SIZE = 64
+ALIEN_POOL_SIZE = 128
 
 # Couleurs à fort contraste
 COLOR_BG = "#0A0E2A"  # bleu très foncé
@@ -150,6 +155,23 @@ class AlienFormation:
 formation = AlienFormation()
 
 
+def new_sprite() -> turtle.Turtle:
+    sprite = turtle.Turtle()
+    sprite.hideturtle()
+    sprite.penup()
+    return sprite
+
+
+def hide_sprite(sprite: turtle.Turtle) -> None:
+    sprite.clear()
+    sprite.hideturtle()
+    sprite.penup()
+
+
+laser_pool = SpritePool(new_sprite, hide_sprite, LASER_POOL_SIZE)
+alien_pool = SpritePool(new_sprite, hide_sprite, ALIEN_POOL_SIZE)
+
+
 def spawn_wave() -> None:
     rows = 3 + level
     cols = 7
@@ -159,19 +181,21 @@ def spawn_wave() -> None:
     spacing_y = 50
     for row in range(rows):
         for col in range(cols):
-            alien = turtle.Turtle()
-            alien.penup()
+            alien = alien_pool.acquire()
+            if alien is None:
+                return
             alien.shape("circle")
             alien.color(COLOR_ALIEN)
             alien.shapesize(1.2, 1.2)
             alien.setposition(start_x + col * spacing_x, start_y - row * spacing_y)
+            alien.showturtle()
             aliens.append(alien)
 
 
 def shoot_laser() -> None:
-    laser = turtle.Turtle()
-    laser.hideturtle()
-    laser.penup()
+    laser = laser_pool.acquire()
+    if laser is None:
+        return
     laser.color(COLOR_LASER)
     laser.setposition(player.xcor(), player.ycor() + 10)
     laser.setheading(90)
@@ -187,14 +211,13 @@ def move_lasers() -> None:
         laser.forward(LASER_LENGTH)
         laser.forward(-LASER_LENGTH)
         if laser.ycor() > TOP:
-            laser.clear()
-            laser.hideturtle()
             lasers.remove(laser)
+            laser_pool.release(laser)
 
 
 def remove_alien(alien: turtle.Turtle) -> None:
-    alien.hideturtle()
     aliens.remove(alien)
+    alien_pool.release(alien)
 
 
 # ---------------------- Contrôles ----------------------
@@ -248,10 +271,9 @@ while running:
     for laser in lasers[:]:
         for alien in aliens[:]:
             if laser.distance(alien) < 20:
-                laser.clear()
-                laser.hideturtle()
                 if laser in lasers:
                     lasers.remove(laser)
+                    laser_pool.release(laser)
                 remove_alien(alien)
                 score += 10
                 update_hud()
@@ -269,7 +291,7 @@ while running:
             lives -= 1
             update_hud()
             for a in aliens:
-                a.hideturtle()
+                alien_pool.release(a)
             aliens.clear()
             if lives <= 0:
                 running = False
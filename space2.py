@@ -2,126 +2,231 @@
 
 from __future__ import annotations
 
+import argparse
 import math
-import os
 import random
-import struct
 import subprocess
 import tempfile
+import threading
 import time
 import turtle
-import wave
+
+from space2_engine import (
+    COLLISION_MODES,
+    COLOR_BOSS,
+    COLOR_PLAYER,
+    COLOR_PLAYER_SHIELD,
+    DEFAULT_TICK_RATE,
+    ENEMY_LASER_LENGTH,
+    ENGINE_STAGES,
+    FIRE_MODES,
+    LASER_LENGTH,
+    MAX_LIVES,
+    Game,
+    Inputs,
+    sweep_inputs,
+)
+from space2_audio import Mixer, WavFileSink, build_sound_files, open_sink
+from space2_canvas import CanvasRenderer
+from space2_input import InputLatency, KeyState
+from space2_loop import FixedTimestepLoop
+from space2_particles import FLASH_COLOR
+from space2_profiler import FrameProfiler
+from space2_replay import Recorder
+from space2_scores import SCORES_PATH, ScoreBoard, format_table
+from space2_visuals import (
+    BOSS_PULSE_SPEED,
+    COLOR_BG,
+    COLOR_GRID,
+    ENEMY_LASER_TRAIL,
+    HEALTH_BAR_BACK,
+    HEALTH_BAR_HEIGHT,
+    HEALTH_BAR_WIDTH,
+    LASER_TRAIL,
+    SHAPES,
+    STAR_COUNT,
+    TWINKLE_SPEED,
+    boss_pulse,
+    health_color,
+    shield_radius,
+    twinkle_brightness,
+)
+from sprites import SpritePool, sync_sprites
+
+# Début du démarrage, référence de --startup-trace
+STARTUP_TIME = time.perf_counter()
 
 # ---------------------- Configuration ----------------------
 WINDOW_TITLE = "Space Invaders 2.0"
 WIDTH_RATIO = 0.8
 HEIGHT_RATIO = 0.9
 
-PLAYER_SPEED = 28
-LASER_SPEED = 20
-LASER_LENGTH = 20
-ALIEN_DROP = 22
-ALIEN_STEP = 1.5
-ALIEN_SHOOT_CHANCE = 0.006
-
-MAX_LIVES = 5
-STAR_COUNT = 80
+LASER_POOL_SIZE = 256
+LASER_POOL_PREFILL = 32
+# Tortues de laser préparées par image pendant le menu
+LASER_PREFILL_STEP = 4
+# La plus grande formation compte 6x9 aliens
+ALIEN_POOL_SIZE = 64
+POWERUP_POOL_SIZE = 32
+
+# Pulsation du boss : formes pré-agrandies parcourues en boucle
+BOSS_PULSE_STEPS = 12
+
+# Étapes de la boucle principale mesurées par le profileur, en plus de celles du moteur
+FRONT_STAGES = ("window_update", "events", "stars", "draw_player", "draw_lasers",
+                "draw_explosions", "draw_aliens", "draw_boss", "draw_powerups", "hud", "overlay")
+# Les compteurs pool_* sont ceux du pool de lasers (SpritePool.stats)
+PROFILE_COUNTERS = ("ticks", "aliens", "lasers", "enemy_lasers", "particles", "powerups",
+                    "turtles", "pool_size", "pool_in_use", "pool_reused", "pool_exhausted")
+# Taille du terrain exporté sans fenêtre ni enregistrement
+EXPORT_SIZE = (960, 720)
+# Intervalle de rafraîchissement de l'overlay du profileur, en secondes
+OVERLAY_REFRESH = 0.5
 
 # Couleurs
-COLOR_BG = "#0A0E2A"
-COLOR_GRID = "#15204B"
 COLOR_TEXT = "#F8F8F2"
 COLOR_ACCENT = "#FFB703"
-COLOR_PLAYER = "#00E5FF"
-COLOR_PLAYER_SHIELD = "#00FF88"
-COLOR_LASER = "#F72585"
-COLOR_LASER_POWERED = "#FFD700"
-COLOR_ENEMY_LASER = "#FF4444"
-COLOR_BOSS = "#FF00FF"
 
-# Couleurs aliens
-ALIEN_COLORS = ["#9BFF56", "#FF6B35", "#F7B32B", "#4ECDC4", "#FF3366"]
+# ---------------------- Options ----------------------
+parser = argparse.ArgumentParser(description="Space Invaders 2.0")
+parser.add_argument("--collisions", choices=COLLISION_MODES, default="loop",
+                    help="résolution des collisions lasers/aliens")
+parser.add_argument("--alien-fire", choices=FIRE_MODES, default="roll",
+                    help="tirs des aliens : tirage par alien à chaque tick, ou tirs planifiés "
+                         "depuis le premier rang")
+parser.add_argument("--audio", choices=("auto", "aplay", "afplay", "null"), default="auto",
+                    help="sortie son : mixeur en flux (aplay, null) ou un afplay par son")
+parser.add_argument("--audio-dump", metavar="WAV",
+                    help="enregistre le son mixé dans un fichier au lieu de le jouer")
+parser.add_argument("--renderer", choices=("turtle", "canvas"), default="turtle",
+                    help="dessin par tortues, ou éléments persistants du Canvas Tk")
+parser.add_argument("--tick-rate", type=float, default=DEFAULT_TICK_RATE,
+                    help="fréquence de la simulation en ticks par seconde")
+parser.add_argument("--profile-dump", metavar="FICHIER",
+                    help="écrit les durées de chaque image (CSV, ou JSONL si .jsonl) et "
+                         "affiche les percentiles en quittant")
+parser.add_argument("--record", metavar="FICHIER",
+                    help="enregistre la graine et les entrées de la partie (rejeu: space2_replay.py)")
+parser.add_argument("--seed", type=int, help="graine de la partie (tirée au hasard si --record)")
+parser.add_argument("--scores", metavar="FICHIER", default=SCORES_PATH,
+                    help="journal des meilleurs scores (chaîne vide : aucun)")
+parser.add_argument("--export", metavar="FICHIER",
+                    help="joue sans fenêtre et enregistre les images : GIF animé, ou suite "
+                         "de PNG/PPM (frame.png donne frame_00000.png...)")
+parser.add_argument("--export-frames", type=int, default=600, metavar="N",
+                    help="nombre d'images à exporter")
+parser.add_argument("--export-every", type=int, default=2, metavar="TICKS",
+                    help="une image tous les TICKS ticks de simulation")
+parser.add_argument("--export-scale", type=float, default=0.5,
+                    help="taille des images par rapport au terrain")
+parser.add_argument("--replay", metavar="FICHIER",
+                    help="avec --export, rejoue cet enregistrement au lieu du pilote automatique")
+parser.add_argument("--startup-trace", action="store_true",
+                    help="affiche la durée de chaque phase du démarrage")
+parser.add_argument("--soak", type=int, metavar="VAGUES",
+                    help="joue seul et sans attente jusqu'à ce nombre de vagues en affichant "
+                         "tortues, éléments du canevas et durée des images")
+options = parser.parse_args()
+if options.soak and options.record:
+    parser.error("--soak modifie la partie hors des entrées : incompatible avec --record")
+if options.replay and not options.export:
+    parser.error("--replay s'utilise avec --export")
+
+# ---------------------- Démarrage ----------------------
+# Seul ce qui est nécessaire au menu est fait avant la première image : les
+# sons sont prêts en arrière-plan, les étoiles et les formes à la demande.
+startup_mark = STARTUP_TIME
+
+
+def trace_startup(phase: str, elapsed: float | None = None):
+    """Avec --startup-trace, affiche la durée d'une phase du démarrage.
+
+    Sans ``elapsed``, la phase court depuis la fin de la précédente.
+    """
+    global startup_mark
+    now = time.perf_counter()
+    if elapsed is None:
+        elapsed = now - startup_mark
+        startup_mark = now
+    if options.startup_trace:
+        # Une seule écriture : le fil des sons trace aussi
+        print(f"[démarrage] {phase:<22}{elapsed * 1000:>8.1f} ms   t = {(now - STARTUP_TIME) * 1000:.0f} ms\n",
+              end="")
+
+# ---------------------- Export sans fenêtre ----------------------
+# Ni son ni fenêtre : la partie est tramée en mémoire puis le programme s'arrête.
+if options.export:
+    from space2_raster import export
+    from space2_replay import game_from_header, read_header, tick_inputs
+
+    if options.replay:
+        with open(options.replay, "rb") as stream:
+            exported_game = game_from_header(read_header(stream))
+            written = export(exported_game, options.export, SHAPES, options.export_frames,
+                             options.export_every, options.export_scale,
+                             (inputs for inputs, _ in tick_inputs(stream)),
+                             LASER_TRAIL, ENEMY_LASER_TRAIL)
+    else:
+        exported_game = Game(*EXPORT_SIZE, seed=options.seed if options.seed is not None else 0,
+                             collision_mode=options.collisions, tick_rate=options.tick_rate,
+                             fire_mode=options.alien_fire)
+        written = export(exported_game, options.export, SHAPES, options.export_frames,
+                         options.export_every, options.export_scale,
+                         laser_trail=LASER_TRAIL, enemy_laser_trail=ENEMY_LASER_TRAIL)
+    print(f"{written} images exportées vers {options.export} ({exported_game.tick} ticks, "
+          f"score {exported_game.score})")
+    raise SystemExit
+
+trace_startup("options")
 
 # ---------------------- Sons ----------------------
 SOUND_ENABLED = True
 TEMP_DIR = tempfile.gettempdir()
 
-
-def create_wav_file(filename: str, frequency: float, duration: float, envelope: str = "none"):
-    """Crée un fichier WAV avec une fréquence et durée données."""
-    sample_rate = 22050
-    num_samples = int(sample_rate * duration)
-
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            if envelope == "sweep_down":
-                freq = frequency - (frequency * 0.7 * t / duration)
-                value = math.sin(2 * math.pi * freq * t)
-                value *= math.exp(-t * 10)
-            elif envelope == "sweep_up":
-                freq = frequency + (frequency * 0.5 * t / duration)
-                value = math.sin(2 * math.pi * freq * t)
-                value *= math.exp(-t * 8)
-            elif envelope == "noise":
-                value = random.uniform(-1, 1)
-                value *= math.exp(-t * 8)
-            elif envelope == "game_over":
-                freq = frequency - (frequency * 0.5 * t / duration)
-                value = math.sin(2 * math.pi * freq * t)
-                value *= math.exp(-t * 3)
-            elif envelope == "powerup":
-                freq = frequency + (frequency * t / duration)
-                value = math.sin(2 * math.pi * freq * t)
-                value *= 1 - (t / duration)
-            elif envelope == "boss":
-                value = math.sin(2 * math.pi * frequency * t)
-                value += 0.5 * math.sin(2 * math.pi * frequency * 1.5 * t)
-                value *= math.exp(-t * 5)
-            elif envelope == "level_up":
-                freq = frequency * (1 + t / duration)
-                value = math.sin(2 * math.pi * freq * t)
-                value *= 1 - (t / duration) * 0.5
-            else:
-                value = math.sin(2 * math.pi * frequency * t)
-
-            data = int(value * 32767 * 0.5)
-            data = max(-32767, min(32767, data))
-            wav_file.writeframes(struct.pack('<h', data))
+sound_files = {}
+mixer = None
+sounds_ready = threading.Event()
+
+
+def create_mixer():
+    """Mixeur en flux, ou None pour retomber sur un ``afplay`` par son (macOS)."""
+    if not SOUND_ENABLED or options.audio == "afplay":
+        return None
+    sink = WavFileSink(options.audio_dump) if options.audio_dump else open_sink(options.audio)
+    if sink is None:
+        return None
+    sound_mixer = Mixer(sound_files, sink)
+    sound_mixer.start()
+    return sound_mixer
+
+
+def load_sounds():
+    """Crée les fichiers sons (réutilisés depuis le cache s'ils existent déjà)
+    puis le mixeur, pendant que la fenêtre s'ouvre."""
+    global SOUND_ENABLED, sound_files, mixer
+    start = time.perf_counter()
+    try:
+        sound_files = build_sound_files(TEMP_DIR)
+        mixer = create_mixer()
+    except Exception as e:
+        print(f"Erreur lors de la création des sons: {e}")
+        SOUND_ENABLED = False
+    trace_startup("sons (arrière-plan)", time.perf_counter() - start)
+    sounds_ready.set()
 
 
-# Créer les fichiers sons
-sound_files = {}
-try:
-    sound_files['laser'] = os.path.join(TEMP_DIR, "laser.wav")
-    sound_files['explosion'] = os.path.join(TEMP_DIR, "explosion.wav")
-    sound_files['game_over'] = os.path.join(TEMP_DIR, "game_over.wav")
-    sound_files['powerup'] = os.path.join(TEMP_DIR, "powerup.wav")
-    sound_files['boss_hit'] = os.path.join(TEMP_DIR, "boss_hit.wav")
-    sound_files['level_up'] = os.path.join(TEMP_DIR, "level_up.wav")
-    sound_files['shield'] = os.path.join(TEMP_DIR, "shield.wav")
-
-    create_wav_file(sound_files['laser'], 800, 0.1, "sweep_down")
-    create_wav_file(sound_files['explosion'], 200, 0.25, "noise")
-    create_wav_file(sound_files['game_over'], 300, 0.8, "game_over")
-    create_wav_file(sound_files['powerup'], 600, 0.3, "powerup")
-    create_wav_file(sound_files['boss_hit'], 150, 0.2, "boss")
-    create_wav_file(sound_files['level_up'], 500, 0.5, "level_up")
-    create_wav_file(sound_files['shield'], 400, 0.15, "sweep_up")
-except Exception as e:
-    print(f"Erreur lors de la création des sons: {e}")
-    SOUND_ENABLED = False
+threading.Thread(target=load_sounds, name="sons", daemon=True).start()
 
 
 def play_sound(sound_type: str):
     """Joue un son selon le type."""
+    # Le premier son attend au besoin la fin de la synthèse
+    sounds_ready.wait()
     if not SOUND_ENABLED or sound_type not in sound_files:
         return
+    if mixer:
+        mixer.play(sound_type)
+        return
     try:
         subprocess.Popen(["afplay", sound_files[sound_type]],
                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -141,106 +246,157 @@ RIGHT = window.window_width() / 2
 TOP = window.window_height() / 2
 BOTTOM = -window.window_height() / 2
 FLOOR_LEVEL = BOTTOM + 80
-GUTTER = 40
+trace_startup("fenêtre")
 
 # ---------------------- État du jeu ----------------------
-score = 0
-high_score = 0
-lives = MAX_LIVES
-level = 1
-combo = 0
-combo_timer = 0
-game_state = "menu"
-
-# Power-ups actifs
-shield_active = False
-shield_timer = 0
-rapid_fire = False
-rapid_timer = 0
-triple_shot = False
-triple_timer = 0
-
-# Listes d'objets
-lasers = []
-enemy_lasers = []
-aliens = []
-explosions = []
-powerups = []
-stars = []
-
-boss = None
-alien_direction = 1
-last_shot_time = 0
-
-# ---------------------- Formes personnalisées ----------------------
+seed = options.seed
+if seed is None and options.record:
+    seed = random.randrange(2 ** 32)
+game = Game(window.window_width(), window.window_height(), seed=seed,
+            collision_mode=options.collisions, tick_rate=options.tick_rate,
+            fire_mode=options.alien_fire)
+# Avec --record, chaque tick passe par l'enregistreur
+recorder = Recorder(game, options.record) if options.record else None
+advance_game = recorder.step if recorder else game.step
+loop = FixedTimestepLoop(options.tick_rate)
+profiler = FrameProfiler(FRONT_STAGES + ENGINE_STAGES, PROFILE_COUNTERS)
+game.profiler = profiler
+input_latency = InputLatency()
+if options.profile_dump:
+    profiler.open_dump(options.profile_dump)
+stars = None
+shapes_registered = False
+trace_startup("état du jeu")
+
+# ---------------------- Scores ----------------------
+# Journal lu une fois ici ; les ajouts sont écrits par un fil en arrière-plan.
+# Le record enregistré reste côté affichage : l'état du moteur (et donc
+# un enregistrement --record) n'en dépend pas.
+SCORES_SHOWN = 5
+scores = ScoreBoard(options.scores) if options.scores and not options.soak else None
+game_start_time = 0.0
+
+
+def best_score() -> int:
+    """Record affiché : celui de la session ou celui du journal."""
+    return max(game.high_score, scores.best()) if scores else game.high_score
+
+
+def record_score() -> int | None:
+    """Ajoute la partie en cours au tableau et renvoie son rang."""
+    if scores is None or not game.score:
+        return None
+    return scores.add(game.score, game.level, game.time - game_start_time)
+
+
+trace_startup("scores")
 
-def create_alien_shapes():
-    """Crée des formes personnalisées pour les aliens."""
-    alien1 = (
-        (-10, 8), (-8, 12), (-6, 12), (-4, 8), (-2, 12), (2, 12), (4, 8),
-        (6, 12), (8, 12), (10, 8), (12, 4), (10, 0), (12, -4), (8, -8),
-        (4, -4), (2, -8), (-2, -8), (-4, -4), (-8, -8), (-12, -4),
-        (-10, 0), (-12, 4)
-    )
-    window.register_shape("alien1", alien1)
-
-    alien2 = (
-        (-8, 10), (-4, 12), (0, 12), (4, 12), (8, 10), (10, 6), (10, 2),
-        (8, -2), (10, -6), (8, -10), (6, -8), (4, -12), (2, -8), (0, -6),
-        (-2, -8), (-4, -12), (-6, -8), (-8, -10), (-10, -6), (-8, -2),
-        (-10, 2), (-10, 6)
-    )
-    window.register_shape("alien2", alien2)
 
-    alien3 = (
-        (0, 12), (4, 8), (8, 8), (10, 4), (12, 0), (10, -4), (6, -8),
-        (2, -8), (0, -12), (-2, -8), (-6, -8), (-10, -4), (-12, 0),
-        (-10, 4), (-8, 8), (-4, 8)
-    )
-    window.register_shape("alien3", alien3)
-
-    # Forme du boss
-    boss_shape = (
-        (0, 25), (15, 20), (25, 10), (30, 0), (25, -10), (20, -20),
-        (10, -25), (5, -20), (0, -25), (-5, -20), (-10, -25), (-20, -20),
-        (-25, -10), (-30, 0), (-25, 10), (-15, 20)
-    )
-    window.register_shape("boss_shape", boss_shape)
+def create_alien_shapes():
+    """Crée des formes personnalisées pour les aliens, le boss et les power-ups.
 
-    # Forme power-up
-    powerup_shape = (
-        (0, 10), (3, 3), (10, 0), (3, -3), (0, -10), (-3, -3), (-10, 0), (-3, 3)
-    )
-    window.register_shape("powerup_shape", powerup_shape)
+    Appelée par le premier sprite qui en a besoin : le menu n'en a pas l'usage.
+    """
+    global shapes_registered
+    if shapes_registered:
+        return
+    start = time.perf_counter()
+    for name, points in SHAPES.items():
+        window.register_shape(name, points)
+    for step in range(BOSS_PULSE_STEPS):
+        scale = boss_pulse_scale(step)
+        window.register_shape(f"boss_pulse_{step}", tuple((x * scale, y * scale) for x, y in SHAPES["boss_shape"]))
+    shapes_registered = True
+    trace_startup("formes (à la demande)", time.perf_counter() - start)
 
 
 # ---------------------- Étoiles ----------------------
+# Chaque étoile parcourt la même courbe de scintillement précalculée, avec
+# son propre décalage de phase et sa propre vitesse. La luminosité est
+# quantifiée : une étoile n'est repeinte que lorsque son niveau de gris
+# change réellement.
+TWINKLE_STEPS = 64
+TWINKLE_LEVELS = 16
+# Temps maximal de repeinte par image ; le reste attend l'image suivante
+STAR_BUDGET = 0.001
+
+
+def _twinkle_level(step: int) -> int:
+    brightness = twinkle_brightness(2 * math.pi * step / TWINKLE_STEPS)
+    return round((brightness - 0.2) / 0.8 * (TWINKLE_LEVELS - 1))
+
+
+TWINKLE_TABLE = [_twinkle_level(step) for step in range(TWINKLE_STEPS)]
+STAR_COLORS = []
+for _level in range(TWINKLE_LEVELS):
+    _grey = int((0.2 + 0.8 * _level / (TWINKLE_LEVELS - 1)) * 255)
+    STAR_COLORS.append(f"#{_grey:02x}{_grey:02x}{_grey:02x}")
+
+
+class StarField:
+    """Toutes les étoiles, dessinées une fois par une seule tortue puis
+    recolorées sur place dans le canevas."""
+
+    def __init__(self, count: int):
+        self.layer = turtle.Turtle()
+        self.layer.hideturtle()
+        self.layer.penup()
+        self.items = []
+        self.offsets = []
+        self.rates = []
+        self.levels = []
+        self.cursor = 0
+
+        for _ in range(count):
+            x = random.randint(int(LEFT) + 10, int(RIGHT) - 10)
+            y = random.randint(int(FLOOR_LEVEL) + 20, int(TOP) - 20)
+            size = random.randint(1, 3)
+            speed_mult = random.uniform(0.5, 2)
+            offset = random.randrange(TWINKLE_STEPS)
+            level = TWINKLE_TABLE[offset]
+
+            self.layer.setposition(x, y)
+            self.layer.dot(size, STAR_COLORS[level])
+            self.items.append(self.layer.items[-1])
+            self.offsets.append(offset)
+            # Une période complète dure 2π / (TWINKLE_SPEED * speed_mult) secondes
+            self.rates.append(TWINKLE_STEPS * TWINKLE_SPEED * speed_mult / (2 * math.pi))
+            self.levels.append(level)
+
+    def update(self, budget: float = STAR_BUDGET):
+        count = len(self.items)
+        if not count:
+            return
+        canvas = window.getcanvas()
+        now = time.perf_counter()
+        deadline = now + budget
+        items, offsets, rates, levels = self.items, self.offsets, self.rates, self.levels
+
+        i = self.cursor
+        for _ in range(count):
+            level = TWINKLE_TABLE[int(offsets[i] + now * rates[i]) % TWINKLE_STEPS]
+            if level != levels[i]:
+                levels[i] = level
+                color = STAR_COLORS[level]
+                canvas.itemconfig(items[i], fill=color, outline=color)
+                if time.perf_counter() > deadline:
+                    i = (i + 1) % count
+                    break
+            i = (i + 1) % count
+        self.cursor = i
+
 
 def create_stars():
     global stars
-    stars = []
-    for _ in range(STAR_COUNT):
-        star = turtle.Turtle()
-        star.hideturtle()
-        star.penup()
-        star.color(COLOR_TEXT)
-        x = random.randint(int(LEFT) + 10, int(RIGHT) - 10)
-        y = random.randint(int(FLOOR_LEVEL) + 20, int(TOP) - 20)
-        star.setposition(x, y)
-        star.size = random.randint(1, 3)
-        star.brightness = random.random()
-        star.speed_mult = random.uniform(0.5, 2)
-        stars.append(star)
+    start = time.perf_counter()
+    stars = StarField(STAR_COUNT)
+    trace_startup("étoiles (à la demande)", time.perf_counter() - start)
 
 
 def update_stars():
-    for star in stars:
-        star.clear()
-        star.brightness += math.sin(time.time() * star.speed_mult * 3) * 0.03
-        star.brightness = max(0.2, min(1.0, star.brightness))
-        brightness = int(star.brightness * 255)
-        color = f"#{brightness:02x}{brightness:02x}{brightness:02x}"
-        star.dot(star.size, color)
+    if stars is None:
+        create_stars()
+    stars.update()
 
 
 # ---------------------- Grille ----------------------
@@ -264,63 +420,117 @@ def draw_grid():
 
 
 # ---------------------- HUD ----------------------
-hud = turtle.Turtle()
-hud.hideturtle()
-hud.penup()
-hud.color(COLOR_TEXT)
-
 message = turtle.Turtle()
 message.hideturtle()
 message.penup()
 message.color(COLOR_ACCENT)
 
 
+class HudField:
+    """Un texte du HUD, redessiné seulement quand son contenu change.
+
+    Le texte est écrit une fois par turtle ; ensuite, le même élément du
+    canevas Tk est modifié sur place au lieu d'être effacé et recréé.
+    """
+
+    def __init__(self, x: float, y: float, font: tuple, align: str = "left"):
+        self.t = turtle.Turtle()
+        self.t.hideturtle()
+        self.t.penup()
+        self.t.setposition(x, y)
+        self.font = font
+        self.align = align
+        self.value = None
+        self.item = None
+
+    def show(self, text: str, color: str = COLOR_TEXT):
+        value = (text, color)
+        if value == self.value:
+            return
+        self.value = value
+        if self.item is None:
+            self.t.color(color)
+            self.t.write(text, align=self.align, font=self.font)
+            self.item = self.t.items[-1]
+        else:
+            window.getcanvas().itemconfig(self.item, text=text, fill=color)
+
+
+hud_score = HudField(LEFT + 20, TOP - 40, ("Courier", 16, "bold"))
+hud_high = HudField(LEFT + 20, TOP - 62, ("Courier", 12, "normal"))
+hud_level = HudField(0, TOP - 40, ("Courier", 16, "bold"), "center")
+hud_combo = HudField(0, TOP - 62, ("Courier", 14, "bold"), "center")
+hud_lives = HudField(RIGHT - 180, TOP - 40, ("Courier", 14, "normal"))
+# Les power-ups actifs s'empilent dans ces lignes, dans l'ordre bouclier, rapide, triple
+hud_powerups = [HudField(RIGHT - 180, TOP - 65 - 18 * i, ("Courier", 11, "normal")) for i in range(3)]
+
+
 def update_hud():
-    hud.clear()
-
-    # Score
-    hud.setposition(LEFT + 20, TOP - 40)
-    hud.color(COLOR_TEXT)
-    hud.write(f"Score: {score}", font=("Courier", 16, "bold"))
-
-    # High Score
-    hud.setposition(LEFT + 20, TOP - 62)
-    hud.color(COLOR_ACCENT)
-    hud.write(f"High: {high_score}", font=("Courier", 12, "normal"))
-
-    # Niveau
-    hud.setposition(0, TOP - 40)
-    hud.color(COLOR_TEXT)
-    hud.write(f"Niveau {level}", align="center", font=("Courier", 16, "bold"))
-
-    # Combo
-    if combo > 1:
-        hud.setposition(0, TOP - 62)
-        hud.color("#FFD700")
-        hud.write(f"x{combo} COMBO!", align="center", font=("Courier", 14, "bold"))
-
-    # Vies
-    hud.setposition(RIGHT - 180, TOP - 40)
-    hud.color("#FF6B6B")
-    hearts = "❤ " * lives + "♡ " * (MAX_LIVES - lives)
-    hud.write(hearts, font=("Courier", 14, "normal"))
-
-    # Power-ups actifs
-    y_offset = TOP - 65
-    if shield_active:
-        hud.setposition(RIGHT - 180, y_offset)
-        hud.color(COLOR_PLAYER_SHIELD)
-        hud.write(f"🛡 {shield_timer // 60}s", font=("Courier", 11, "normal"))
-        y_offset -= 18
-    if rapid_fire:
-        hud.setposition(RIGHT - 180, y_offset)
-        hud.color("#FF00FF")
-        hud.write(f"⚡ {rapid_timer // 60}s", font=("Courier", 11, "normal"))
-        y_offset -= 18
-    if triple_shot:
-        hud.setposition(RIGHT - 180, y_offset)
-        hud.color("#FFD700")
-        hud.write(f"🔱 {triple_timer // 60}s", font=("Courier", 11, "normal"))
+    hud_score.show(f"Score: {game.score}")
+    hud_high.show(f"High: {best_score()}", COLOR_ACCENT)
+    hud_level.show(f"Niveau {game.level}")
+    hud_combo.show(f"x{game.combo} COMBO!" if game.combo > 1 else "", "#FFD700")
+    hud_lives.show("❤ " * game.lives + "♡ " * (MAX_LIVES - game.lives), "#FF6B6B")
+
+    # Les compteurs n'affichent que la seconde entamée : le texte ne change
+    # qu'une fois par seconde.
+    active = []
+    if game.shield_active:
+        active.append((f"🛡 {int(game.shield_timer)}s", COLOR_PLAYER_SHIELD))
+    if game.rapid_fire:
+        active.append((f"⚡ {int(game.rapid_timer)}s", "#FF00FF"))
+    if game.triple_shot:
+        active.append((f"🔱 {int(game.triple_timer)}s", "#FFD700"))
+    for i, field in enumerate(hud_powerups):
+        if i < len(active):
+            field.show(*active[i])
+        else:
+            field.show("")
+
+
+# Overlay du profileur (F3) : percentiles des étapes et nombre d'entités
+hud_profile = HudField(LEFT + 20, FLOOR_LEVEL + 20, ("Courier", 10, "normal"))
+overlay_visible = False
+overlay_refreshed = 0.0
+
+
+def update_overlay():
+    global overlay_refreshed
+    if not overlay_visible:
+        return
+    now = time.perf_counter()
+    if now - overlay_refreshed < OVERLAY_REFRESH:
+        return
+    overlay_refreshed = now
+    stats = loop.stats()
+    header = (f"{stats['render_rate']:.0f} img/s  {stats['tick_rate']:.0f} ticks/s  "
+              f"ticks perdus {stats['dropped_ticks']}")
+    hud_profile.show(header + "\n" + profiler.format_overlay() + "\n" + input_latency.format_line(), "#9BFF56")
+
+
+def toggle_overlay():
+    global overlay_visible, overlay_refreshed
+    overlay_visible = not overlay_visible
+    overlay_refreshed = 0.0
+    if not overlay_visible:
+        hud_profile.show("")
+
+
+def frame_counts() -> dict:
+    pool = (canvas_view.line_pool if canvas_view else laser_pool).stats()
+    return {
+        "ticks": ticks,
+        "aliens": len(game.aliens),
+        "lasers": len(game.lasers),
+        "enemy_lasers": len(game.enemy_lasers),
+        "particles": game.particles.count,
+        "powerups": len(game.powerups),
+        "turtles": len(window.turtles()),
+        "pool_size": pool["size"],
+        "pool_in_use": pool["in_use"],
+        "pool_reused": pool["allocations_avoided"],
+        "pool_exhausted": pool["exhausted"],
+    }
 
 
 def show_message(text: str, size: int = 32, color: str = COLOR_ACCENT):
@@ -330,6 +540,31 @@ def show_message(text: str, size: int = 32, color: str = COLOR_ACCENT):
     message.write(text, align="center", font=("Courier", size, "bold"))
 
 
+def show_scores(y: float):
+    """Les meilleurs scores, sous la position ``y``."""
+    if not scores or not scores.table():
+        return
+    message.color("#9BFF56")
+    message.setposition(0, y)
+    message.write("Meilleurs scores", align="center", font=("Courier", 14, "bold"))
+    message.color(COLOR_TEXT)
+    for i, line in enumerate(format_table(scores.table()[:SCORES_SHOWN])):
+        message.setposition(0, y - 28 - 20 * i)
+        message.write(line, align="center", font=("Courier", 12, "normal"))
+
+
+def show_game_over(rank: int | None):
+    if rank == 1:
+        placed = "\nNouveau record !"
+    elif rank:
+        placed = f"\n{rank}e au classement"
+    else:
+        placed = ""
+    show_message(f"GAME OVER\n\nScore: {game.score}\nRecord: {best_score()}{placed}\n\nR pour rejouer",
+                 24, "#FF4444")
+    show_scores(-50)
+
+
 def show_menu():
     message.clear()
     message.color(COLOR_ACCENT)
@@ -357,6 +592,10 @@ def show_menu():
     message.setposition(0, -125)
     message.write("❤ Vie extra   💣 Bombe atomique", align="center", font=("Courier", 11, "normal"))
 
+    show_scores(-180)
+
+
+trace_startup("hud")
 
 # ---------------------- Joueur ----------------------
 player = turtle.Turtle()
@@ -375,539 +614,380 @@ shield_visual.pensize(2)
 
 def draw_player_effects():
     shield_visual.clear()
-    if shield_active:
+    if game.shield_active:
         shield_visual.setposition(player.xcor(), player.ycor() - 25)
         shield_visual.color(COLOR_PLAYER_SHIELD)
         shield_visual.pendown()
-        shield_visual.circle(25 + 3 * math.sin(time.time() * 8))
+        shield_visual.circle(shield_radius(time.time()))
         shield_visual.penup()
 
 
-# ---------------------- Explosions ----------------------
+# ---------------------- Sprites ----------------------
+# Chaque entité du moteur est associée à sa tortue ; les tortues dont
+# l'entité a disparu retournent à leur pool au rendu suivant.
+alien_sprites = {}
+laser_sprites = {}
+enemy_laser_sprites = {}
+powerup_sprites = {}
 
-def create_explosion(x: float, y: float, color: str, count: int = 12):
-    """Crée une explosion avec des particules."""
-    particles = []
-    for i in range(count):
-        particle = turtle.Turtle()
-        particle.hideturtle()
-        particle.penup()
-        particle.color(color)
-        particle.setposition(x, y)
-        particle.pensize(random.randint(2, 4))
-        angle = (360 / count) * i + random.uniform(-15, 15)
-        particle.setheading(angle)
-        particle.speed_val = random.uniform(3, 6)
-        particles.append(particle)
-
-    flash = turtle.Turtle()
-    flash.hideturtle()
-    flash.penup()
-    flash.setposition(x, y)
-    flash.color("#FFFFFF")
-
-    explosion = {
-        "particles": particles,
-        "flash": flash,
-        "life": 18,
-        "color": color
-    }
-    explosions.append(explosion)
 
+def hide_sprite(sprite):
+    sprite.clear()
+    sprite.hideturtle()
 
-def animate_explosions():
-    for explosion in explosions[:]:
-        explosion["life"] -= 1
-        if explosion["life"] <= 0:
-            for particle in explosion["particles"]:
-                particle.clear()
-            explosion["flash"].clear()
-            explosions.remove(explosion)
-        else:
-            if explosion["life"] > 12:
-                flash_size = (explosion["life"] - 12) * 5
-                explosion["flash"].clear()
-                explosion["flash"].dot(flash_size)
-
-            for particle in explosion["particles"]:
-                particle.clear()
-                particle.pendown()
-                particle.forward(particle.speed_val)
-                particle.dot(max(1, explosion["life"] // 3))
-                particle.penup()
-                particle.speed_val *= 0.92
-
-
-# ---------------------- Power-ups ----------------------
-
-class PowerUp:
-    TYPES = ['shield', 'rapid', 'triple', 'life', 'bomb']
-    COLORS = {
-        'shield': '#00FF88',
-        'rapid': '#FF00FF',
-        'triple': '#FFD700',
-        'life': '#FF6B6B',
-        'bomb': '#FF4500'
-    }
 
-    def __init__(self, x: float, y: float):
-        self.t = turtle.Turtle()
-        self.t.penup()
-        self.t.shape("powerup_shape")
-        self.type = random.choice(self.TYPES)
-        self.t.color(self.COLORS[self.type])
-        self.t.shapesize(1.2, 1.2)
-        self.t.setposition(x, y)
-        self.speed = 2.5
-        self.angle = 0
+def new_shape_turtle():
+    create_alien_shapes()
+    sprite = turtle.Turtle()
+    sprite.hideturtle()
+    sprite.penup()
+    return sprite
 
-    def update(self) -> bool:
-        self.t.sety(self.t.ycor() - self.speed)
-        self.angle += 5
-        self.t.setheading(self.angle)
-        return self.t.ycor() > FLOOR_LEVEL - 30
 
-    def destroy(self):
-        self.t.hideturtle()
+alien_pool = SpritePool(new_shape_turtle, hide_sprite, ALIEN_POOL_SIZE)
+powerup_pool = SpritePool(new_shape_turtle, hide_sprite, POWERUP_POOL_SIZE)
+# Un seul boss à la fois : sa tortue sert d'un combat à l'autre
+boss_pool = SpritePool(new_shape_turtle, hide_sprite, 1)
+
+
+def create_alien_sprite(alien):
+    alien_t = alien_pool.acquire()
+    if alien_t is not None:
+        alien_t.shape(alien.shape)
+        alien_t.color(alien.color)
+        alien_t.shapesize(1.0, 1.0)
+        alien_t.showturtle()
+    return alien_t
+
+
+def draw_alien(alien, alien_t):
+    alien_t.setposition(alien.x, alien.y)
+
+
+def new_laser_turtle():
+    laser_t = turtle.Turtle()
+    laser_t.hideturtle()
+    laser_t.penup()
+    return laser_t
 
 
-def apply_powerup(powerup_type: str):
-    global shield_active, shield_timer, rapid_fire, rapid_timer
-    global triple_shot, triple_timer, lives
+def reset_laser_turtle(laser_t):
+    laser_t.clear()
 
-    play_sound("powerup")
 
-    if powerup_type == 'shield':
-        shield_active = True
-        shield_timer = 600
-    elif powerup_type == 'rapid':
-        rapid_fire = True
-        rapid_timer = 480
-    elif powerup_type == 'triple':
-        triple_shot = True
-        triple_timer = 420
-    elif powerup_type == 'life':
-        lives = min(lives + 1, MAX_LIVES)
-    elif powerup_type == 'bomb':
-        atomic_explosion()
+# Lasers du joueur et des ennemis partagent le même pool, préparé pendant le menu
+laser_pool = SpritePool(new_laser_turtle, reset_laser_turtle, LASER_POOL_SIZE)
 
 
-def update_powerup_timers():
-    global shield_active, shield_timer, rapid_fire, rapid_timer
-    global triple_shot, triple_timer
+def create_laser_sprite(laser):
+    laser_t = laser_pool.acquire()
+    if laser_t is not None:
+        laser_t.color(laser.color)
+        laser_t.pensize(laser.width)
+    return laser_t
 
-    if shield_active:
-        shield_timer -= 1
-        if shield_timer <= 0:
-            shield_active = False
 
-    if rapid_fire:
-        rapid_timer -= 1
-        if rapid_timer <= 0:
-            rapid_fire = False
+def draw_laser(laser, laser_t):
+    laser_t.clear()
+    laser_t.setposition(laser.x, laser.y - LASER_TRAIL)
+    laser_t.pendown()
+    laser_t.sety(laser.y + LASER_LENGTH)
+    laser_t.penup()
 
-    if triple_shot:
-        triple_timer -= 1
-        if triple_timer <= 0:
-            triple_shot = False
+
+def draw_enemy_laser(laser, laser_t):
+    laser_t.clear()
+    laser_t.setposition(laser.x, laser.y + ENEMY_LASER_TRAIL)
+    laser_t.pendown()
+    laser_t.sety(laser.y - ENEMY_LASER_LENGTH)
+    laser_t.penup()
+
+
+def create_powerup_sprite(powerup):
+    powerup_t = powerup_pool.acquire()
+    if powerup_t is not None:
+        powerup_t.shape("powerup_shape")
+        powerup_t.color(powerup.color)
+        powerup_t.shapesize(1.2, 1.2)
+        powerup_t.showturtle()
+    return powerup_t
+
+
+def draw_powerup(powerup, powerup_t):
+    powerup_t.setposition(powerup.x, powerup.y)
+    powerup_t.setheading(powerup.angle)
+
+
+# ---------------------- Explosions ----------------------
+# Une seule tortue dessine toutes les particules et tous les flashs.
+explosion_layer = turtle.Turtle()
+explosion_layer.hideturtle()
+explosion_layer.penup()
+
+
+def animate_explosions():
+    explosion_layer.clear()
+    particles = game.particles
+    for x, y, size in particles.visible_flashes():
+        explosion_layer.setposition(x, y)
+        explosion_layer.dot(size, FLASH_COLOR)
+
+    for x0, y0, x1, y1, size, width, color in particles.visible():
+        explosion_layer.setposition(x0, y0)
+        explosion_layer.pensize(width)
+        explosion_layer.pencolor(color)
+        explosion_layer.pendown()
+        explosion_layer.setposition(x1, y1)
+        explosion_layer.dot(size)
+        explosion_layer.penup()
 
 
 # ---------------------- Boss ----------------------
 
-class Boss:
-    def __init__(self, y: float):
-        self.t = turtle.Turtle()
-        self.t.penup()
-        self.t.shape("boss_shape")
-        self.t.color(COLOR_BOSS)
-        self.t.shapesize(2, 2)
-        self.t.setposition(0, y)
-        self.health = 30 + level * 10
-        self.max_health = self.health
-        self.direction = 1
-        self.speed = 3
-        self.shoot_timer = 0
-        self.active = True
-
-        self.health_bar = turtle.Turtle()
-        self.health_bar.hideturtle()
-        self.health_bar.penup()
-        self.health_bar.pensize(1)
+def boss_pulse_scale(step: int) -> float:
+    return boss_pulse(2 * math.pi * step / BOSS_PULSE_STEPS)
+
+
+def boss_pulse_step() -> int:
+    """Forme de pulsation du moment, au rythme de ``boss_pulse(BOSS_PULSE_SPEED * t)``."""
+    return int(time.time() * BOSS_PULSE_SPEED / (2 * math.pi) * BOSS_PULSE_STEPS) % BOSS_PULSE_STEPS
 
-    def update(self):
-        if not self.active:
-            return
 
-        new_x = self.t.xcor() + self.speed * self.direction
-        if new_x > RIGHT - 80 or new_x < LEFT + 80:
-            self.direction *= -1
-        self.t.setx(new_x)
+class BossSprite:
+    """Boss et barre de vie, sans remplissage ni transformation par image.
 
-        scale = 1.8 + 0.3 * math.sin(time.time() * 4)
-        self.t.shapesize(scale, scale)
+    La pulsation passe d'une forme pré-agrandie à la suivante. La barre de
+    vie est faite de deux rectangles du canevas, déplacés avec le boss et
+    redimensionnés seulement quand sa vie change.
+    """
+
+    def __init__(self, boss):
+        self.boss = boss
+        create_alien_shapes()
+        self.pulse = boss_pulse_step()
+        self.flash = False
+        self.t = boss_pool.acquire()
+        self.t.shape(f"boss_pulse_{self.pulse}")
         self.t.color(COLOR_BOSS)
+        self.t.setposition(boss.x, boss.y)
+        self.t.showturtle()
+
+        self.canvas = window.getcanvas()
+        self.health_back = self.canvas.create_rectangle(0, 0, 0, 0, fill=HEALTH_BAR_BACK, outline=HEALTH_BAR_BACK)
+        self.health_front = self.canvas.create_rectangle(0, 0, 0, 0)
+        self.health = None
+        self.bar_x = 0.0
+        self.bar_y = 0.0
+
+    def update(self):
+        boss = self.boss
+        self.t.setposition(boss.x, boss.y)
+
+        pulse = boss_pulse_step()
+        if pulse != self.pulse:
+            self.pulse = pulse
+            self.t.shape(f"boss_pulse_{pulse}")
+        if boss.flash != self.flash:
+            self.flash = boss.flash
+            self.t.color("white" if boss.flash else COLOR_BOSS)
 
         self.draw_health_bar()
 
     def draw_health_bar(self):
-        self.health_bar.clear()
-        bar_width = 150
-        bar_height = 12
-        x = self.t.xcor() - bar_width / 2
-        y = self.t.ycor() + 50
-
-        self.health_bar.setposition(x, y)
-        self.health_bar.pendown()
-        self.health_bar.color("#333333")
-        self.health_bar.begin_fill()
-        for _ in range(2):
-            self.health_bar.forward(bar_width)
-            self.health_bar.left(90)
-            self.health_bar.forward(bar_height)
-            self.health_bar.left(90)
-        self.health_bar.end_fill()
-        self.health_bar.penup()
-
-        health_width = max(0, (self.health / self.max_health) * bar_width)
-        self.health_bar.setposition(x, y)
-        health_color = "#00FF00" if self.health > self.max_health * 0.5 else "#FFFF00" if self.health > self.max_health * 0.25 else "#FF0000"
-        self.health_bar.pendown()
-        self.health_bar.color(health_color)
-        self.health_bar.begin_fill()
-        for _ in range(2):
-            self.health_bar.forward(health_width)
-            self.health_bar.left(90)
-            self.health_bar.forward(bar_height)
-            self.health_bar.left(90)
-        self.health_bar.end_fill()
-        self.health_bar.penup()
-
-    def hit(self, damage: int = 1) -> bool:
-        self.health -= damage
-        self.t.color("white")
-        play_sound("boss_hit")
-        if self.health <= 0:
-            self.active = False
-            return True
-        return False
-
-    def should_shoot(self) -> bool:
-        self.shoot_timer += 1
-        if self.shoot_timer > 25:
-            self.shoot_timer = 0
-            return random.random() < 0.6
-        return False
+        canvas = self.canvas
+        boss = self.boss
+        x = boss.x - HEALTH_BAR_WIDTH / 2
+        y = boss.y + 50
+
+        health, max_health = boss.health, boss.max_health
+        if health != self.health:
+            self.health = health
+            health_width = max(0, (health / max_health) * HEALTH_BAR_WIDTH)
+            bar_color = health_color(health, max_health)
+            canvas.coords(self.health_back, x, -y, x + HEALTH_BAR_WIDTH, -(y + HEALTH_BAR_HEIGHT))
+            canvas.coords(self.health_front, x, -y, x + health_width, -(y + HEALTH_BAR_HEIGHT))
+            canvas.itemconfig(self.health_front, fill=bar_color, outline=bar_color)
+        elif x != self.bar_x or y != self.bar_y:
+            # Le canevas a son axe y vers le bas
+            canvas.move(self.health_back, x - self.bar_x, self.bar_y - y)
+            canvas.move(self.health_front, x - self.bar_x, self.bar_y - y)
+        self.bar_x = x
+        self.bar_y = y
 
     def destroy(self):
-        self.t.hideturtle()
-        self.health_bar.clear()
+        boss_pool.release(self.t)
+        self.canvas.delete(self.health_back)
+        self.canvas.delete(self.health_front)
 
 
-# ---------------------- Aliens ----------------------
+boss_sprite = None
 
-class AlienFormation:
-    def __init__(self):
-        self.direction = 1
-        self.speed = 1.0
 
-    def update(self):
-        global alien_direction
-        if boss and boss.active:
-            return
+def draw_boss():
+    global boss_sprite
+    boss = game.boss
+    if boss_sprite and (boss_sprite.boss is not boss or not boss.active):
+        boss_sprite.destroy()
+        boss_sprite = None
+    if boss and boss.active:
+        if boss_sprite is None:
+            boss_sprite = BossSprite(boss)
+        boss_sprite.update()
 
-        shift = ALIEN_STEP * self.direction * (1 + level * 0.08)
-        edge_hit = False
 
-        for alien in aliens:
-            alien['turtle'].setx(alien['turtle'].xcor() + shift)
-            if alien['turtle'].xcor() > RIGHT - GUTTER or alien['turtle'].xcor() < LEFT + GUTTER:
-                edge_hit = True
+def draw_player():
+    player.setx(game.player_x)
+    draw_player_effects()
 
-        if edge_hit:
-            self.direction *= -1
-            for alien in aliens:
-                alien['turtle'].sety(alien['turtle'].ycor() - ALIEN_DROP)
 
+def draw_lasers():
+    sync_sprites(laser_sprites, game.lasers, create_laser_sprite, draw_laser, laser_pool.release)
+    sync_sprites(enemy_laser_sprites, game.enemy_lasers, create_laser_sprite, draw_enemy_laser,
+                 laser_pool.release)
 
-formation = AlienFormation()
 
+def draw_aliens():
+    sync_sprites(alien_sprites, game.aliens, create_alien_sprite, draw_alien, alien_pool.release)
 
-def spawn_wave():
-    global aliens, boss
 
-    for alien in aliens:
-        alien['turtle'].hideturtle()
-    aliens = []
-    boss = None
+def draw_powerups():
+    sync_sprites(powerup_sprites, game.powerups, create_powerup_sprite, draw_powerup,
+                 powerup_pool.release)
 
-    if level % 5 == 0:
-        boss = Boss(TOP - 150)
-        return
 
-    rows = min(3 + level // 2, 6)
-    cols = min(6 + level // 3, 9)
-    start_x = LEFT + 90
-    start_y = TOP - 130
-    spacing_x = 68
-    spacing_y = 52
-
-    shapes = ["alien1", "alien2", "alien3"]
-
-    for row in range(rows):
-        for col in range(cols):
-            alien_t = turtle.Turtle()
-            alien_t.penup()
-            alien_t.shape(shapes[row % 3])
-            alien_t.color(ALIEN_COLORS[row % len(ALIEN_COLORS)])
-            alien_t.shapesize(1.0, 1.0)
-            alien_t.setposition(start_x + col * spacing_x, start_y - row * spacing_y)
-
-            alien = {
-                'turtle': alien_t,
-                'health': 1 + row // 2,
-                'points': 10 * (row + 1),
-                'color': ALIEN_COLORS[row % len(ALIEN_COLORS)]
-            }
-            aliens.append(alien)
-
-
-def remove_alien(alien: dict):
-    create_explosion(alien['turtle'].xcor(), alien['turtle'].ycor(), alien['color'])
-    play_sound("explosion")
-    alien['turtle'].hideturtle()
-    aliens.remove(alien)
-
-    if random.random() < 0.12:
-        powerups.append(PowerUp(alien['turtle'].xcor(), alien['turtle'].ycor()))
-
-
-def alien_shoot():
-    if not aliens:
-        return
+trace_startup("joueur et sprites")
 
-    for alien in aliens:
-        if random.random() < ALIEN_SHOOT_CHANCE * (1 + level * 0.05):
-            laser = turtle.Turtle()
-            laser.hideturtle()
-            laser.penup()
-            laser.color(COLOR_ENEMY_LASER)
-            laser.setposition(alien['turtle'].xcor(), alien['turtle'].ycor() - 15)
-            laser.setheading(270)
-            laser.pendown()
-            laser.pensize(3)
-            enemy_lasers.append(laser)
-
-    if boss and boss.active and boss.should_shoot():
-        for offset in [-25, 0, 25]:
-            laser = turtle.Turtle()
-            laser.hideturtle()
-            laser.penup()
-            laser.color(COLOR_ENEMY_LASER)
-            laser.setposition(boss.t.xcor() + offset, boss.t.ycor() - 40)
-            laser.setheading(270)
-            laser.pendown()
-            laser.pensize(4)
-            enemy_lasers.append(laser)
-
-
-# ---------------------- Lasers ----------------------
-
-def shoot_laser():
-    global last_shot_time, game_state
-
-    if game_state == "menu":
-        start_game()
-        return
+# ---------------------- Rendu ----------------------
+# Les deux moteurs de rendu exposent les mêmes étapes, mesurées une à une
+# par le profileur. Le HUD, les étoiles et les messages sont communs.
+if options.renderer == "canvas":
+    canvas_view = CanvasRenderer(window.getcanvas(), game, SHAPES, LASER_TRAIL, ENEMY_LASER_TRAIL,
+                                 LASER_POOL_SIZE)
+    player.hideturtle()
+    render_stages = (
+        ("draw_player", canvas_view.draw_player),
+        ("draw_lasers", canvas_view.draw_lasers),
+        ("draw_explosions", canvas_view.draw_explosions),
+        ("draw_aliens", canvas_view.draw_aliens),
+        ("draw_boss", canvas_view.draw_boss),
+        ("draw_powerups", canvas_view.draw_powerups),
+    )
+    draw_explosions = canvas_view.draw_explosions
+else:
+    canvas_view = None
+    render_stages = (
+        ("draw_player", draw_player),
+        ("draw_lasers", draw_lasers),
+        ("draw_explosions", animate_explosions),
+        ("draw_aliens", draw_aliens),
+        ("draw_boss", draw_boss),
+        ("draw_powerups", draw_powerups),
+    )
+    draw_explosions = animate_explosions
 
-    if game_state != "playing":
-        return
 
-    cooldown = 120 if rapid_fire else 250
-    current_time = time.time() * 1000
-    if current_time - last_shot_time < cooldown:
-        return
+def render():
+    """Dessine l'état courant du moteur."""
+    for stage, draw in render_stages:
+        draw()
+        profiler.lap(stage)
+    update_hud()
+    profiler.lap("hud")
+
 
-    last_shot_time = current_time
-    play_sound("laser")
-
-    positions = [0]
-    if triple_shot:
-        positions = [-18, 0, 18]
-
-    for offset in positions:
-        laser = turtle.Turtle()
-        laser.hideturtle()
-        laser.penup()
-        laser.color(COLOR_LASER_POWERED if rapid_fire else COLOR_LASER)
-        laser.setposition(player.xcor() + offset, player.ycor() + 15)
-        laser.setheading(90)
-        laser.pendown()
-        laser.pensize(5 if rapid_fire else 4)
-        laser.damage = 2 if rapid_fire else 1
-        lasers.append(laser)
-
-
-def move_lasers():
-    for laser in lasers[:]:
-        laser.clear()
-        laser.forward(LASER_SPEED)
-        laser.forward(LASER_LENGTH)
-        laser.forward(-LASER_LENGTH)
-        if laser.ycor() > TOP:
-            laser.clear()
-            laser.hideturtle()
-            lasers.remove(laser)
-
-    for laser in enemy_lasers[:]:
-        laser.clear()
-        laser.forward(12)
-        laser.forward(15)
-        laser.forward(-15)
-        if laser.ycor() < FLOOR_LEVEL - 20:
-            laser.clear()
-            laser.hideturtle()
-            enemy_lasers.remove(laser)
-
-
-def atomic():
-    """Tire des lasers sur toute la largeur."""
-    if game_state != "playing":
+def clear_wave():
+    """Efface les sprites de la vague terminée avant l'écran de transition."""
+    global boss_sprite
+    if canvas_view:
+        canvas_view.clear_wave()
         return
-    atomic_explosion()
-
-
-def atomic_explosion():
-    """Déclenche une explosion atomique."""
-    cursor = LEFT + 20
-    step = 25
-    while cursor < RIGHT - 20:
-        laser = turtle.Turtle()
-        laser.hideturtle()
-        laser.penup()
-        laser.color(COLOR_LASER_POWERED)
-        laser.setposition(cursor, FLOOR_LEVEL + 15)
-        laser.setheading(90)
-        laser.pendown()
-        laser.pensize(3)
-        laser.damage = 1
-        lasers.append(laser)
-        cursor += step
-    play_sound("laser")
-
-
-# ---------------------- Collisions ----------------------
-
-def check_collisions():
-    global score, combo, combo_timer, lives, shield_active, high_score
-
-    # Lasers joueur vs boss
-    if boss and boss.active:
-        for laser in lasers[:]:
-            if laser.distance(boss.t) < 50:
-                damage = getattr(laser, 'damage', 1)
-                laser.clear()
-                laser.hideturtle()
-                if laser in lasers:
-                    lasers.remove(laser)
-                if boss.hit(damage):
-                    create_explosion(boss.t.xcor(), boss.t.ycor(), COLOR_BOSS, 25)
-                    score += 500 * level
-                    boss.destroy()
-                else:
-                    create_explosion(laser.xcor(), laser.ycor(), COLOR_BOSS, 5)
-
-    # Lasers joueur vs aliens
-    for laser in lasers[:]:
-        for alien in aliens[:]:
-            if laser.distance(alien['turtle']) < 22:
-                damage = getattr(laser, 'damage', 1)
-                laser.clear()
-                laser.hideturtle()
-                if laser in lasers:
-                    lasers.remove(laser)
-
-                alien['health'] -= damage
-                if alien['health'] <= 0:
-                    combo += 1
-                    combo_timer = 60
-                    score += alien['points'] * combo
-                    remove_alien(alien)
-                else:
-                    alien['turtle'].color("white")
-                break
-
-    # Restaurer couleurs aliens
-    for alien in aliens:
-        alien['turtle'].color(alien['color'])
-
-    # Lasers ennemis vs joueur
-    for laser in enemy_lasers[:]:
-        if laser.distance(player) < 22:
-            laser.clear()
-            laser.hideturtle()
-            enemy_lasers.remove(laser)
-
-            if shield_active:
-                play_sound("shield")
-                create_explosion(player.xcor(), player.ycor(), COLOR_PLAYER_SHIELD, 8)
+    sync_sprites(alien_sprites, [], create_alien_sprite, draw_alien, alien_pool.release)
+    if boss_sprite:
+        boss_sprite.destroy()
+        boss_sprite = None
+
+
+trace_startup("rendu")
+
+# ---------------------- Événements ----------------------
+
+def play_events():
+    """Réagit aux événements du dernier tick du moteur."""
+    global game_start_time
+    for event in game.events:
+        kind = event[0]
+        if kind == "sound":
+            play_sound(event[1])
+        elif kind == "started":
+            game_start_time = game.time
+            message.clear()
+        elif kind == "paused":
+            show_message("PAUSE\n\nAppuie sur P pour continuer", 24)
+        elif kind == "resumed":
+            message.clear()
+        elif kind == "gameover":
+            show_game_over(record_score())
+        elif kind == "level_up":
+            clear_wave()
+            if options.soak:
+                soak_wave_done()
+                continue
+            if event[2]:
+                show_message(f"BOSS VAINCU!\n\nNiveau {event[1]}", 30, "#00FF00")
             else:
-                lives -= 1
-                create_explosion(player.xcor(), player.ycor(), COLOR_PLAYER, 15)
-                if lives <= 0:
-                    return "gameover"
-
-    # Power-ups vs joueur
-    for powerup in powerups[:]:
-        if powerup.t.distance(player) < 28:
-            apply_powerup(powerup.type)
-            powerup.destroy()
-            powerups.remove(powerup)
-
-    # Aliens touchent le sol
-    for alien in aliens:
-        if alien['turtle'].ycor() < FLOOR_LEVEL + 25:
-            if not shield_active:
-                lives -= 1
-            for a in aliens:
-                a['turtle'].hideturtle()
-            aliens.clear()
-            if lives <= 0:
-                return "gameover"
-            spawn_wave()
-            break
-
-    if score > high_score:
-        high_score = score
-
-    return None
+                show_message(f"NIVEAU {event[1]}", 36)
+            window.update()
+            time.sleep(1.5)
+            message.clear()
+            loop.reset()
+            profiler.skip()
+
+
+# ---------------------- Endurance ----------------------
+# Avec --soak, la partie se joue seule, un tick par image et sans attente :
+# toutes les vagues sont détruites au bout de SOAK_CLEAR_TICKS ticks et les
+# vies restent au maximum. Le nombre de tortues, d'éléments du canevas et
+# la durée des images doivent rester stables d'un rapport à l'autre.
+SOAK_CLEAR_TICKS = 20
+SOAK_REPORT = 100
+soak_waves = 0
+
+
+def soak_step():
+    game.lives = MAX_LIVES
+    if game.state == "playing" and game.tick % SOAK_CLEAR_TICKS == 0:
+        for alien in game.aliens.backwards():
+            game.hit_alien(alien, alien.health)
+        if game.boss and game.boss.active:
+            game.boss.hit(game.boss.health)
+
+
+def soak_wave_done():
+    global soak_waves, running
+    soak_waves += 1
+    if soak_waves % SOAK_REPORT == 0 or soak_waves >= options.soak:
+        frame = profiler.summary()["frame"]
+        print(f"vagues {soak_waves:>6}  tortues {len(window.turtles()):>5}  "
+              f"éléments {len(window.getcanvas().find_all()):>6}  "
+              f"image {frame['mean']:.2f} ms (p99 {frame['p99']:.2f})", flush=True)
+    if soak_waves >= options.soak:
+        running = False
 
 
 # ---------------------- Contrôles ----------------------
-
-def move_left():
-    if game_state != "playing":
-        return
-    new_x = player.xcor() - PLAYER_SPEED
-    if new_x > LEFT + GUTTER:
-        player.setx(new_x)
-
-
-def move_right():
-    if game_state != "playing":
-        return
-    new_x = player.xcor() + PLAYER_SPEED
-    if new_x < RIGHT - GUTTER:
-        player.setx(new_x)
-
-
-def toggle_pause():
-    global game_state
-    if game_state == "playing":
-        game_state = "paused"
-        show_message("PAUSE\n\nAppuie sur P pour continuer", 24)
-    elif game_state == "paused":
-        game_state = "playing"
-        message.clear()
+# Les touches de jeu ne font que tenir à jour ``keys``, lu à chaque tick :
+# déplacement continu tant qu'une flèche est tenue, tir répété tant que
+# ESPACE l'est (à la cadence du moteur). Pause, redémarrage et bombe
+# atomique ne réagissent qu'aux nouveaux appuis.
+KEY_ACTIONS = {
+    "Left": "left", "a": "left",
+    "Right": "right", "d": "right",
+    "space": "shoot",
+    "w": "atomic", "W": "atomic",
+    "p": "pause",
+    "r": "restart",
+}
+keys = KeyState(KEY_ACTIONS, input_latency)
 
 
 def quit_game():
@@ -915,144 +995,103 @@ def quit_game():
     running = False
 
 
-def start_game():
-    global game_state, score, lives, level, combo
-    global shield_active, rapid_fire, triple_shot
-    global shield_timer, rapid_timer, triple_timer
-
-    game_state = "playing"
-    score = 0
-    lives = MAX_LIVES
-    level = 1
-    combo = 0
-    shield_active = False
-    rapid_fire = False
-    triple_shot = False
-    shield_timer = 0
-    rapid_timer = 0
-    triple_timer = 0
-
-    for laser in lasers:
-        laser.clear()
-        laser.hideturtle()
-    lasers.clear()
-
-    for laser in enemy_lasers:
-        laser.clear()
-        laser.hideturtle()
-    enemy_lasers.clear()
-
-    for alien in aliens:
-        alien['turtle'].hideturtle()
-    aliens.clear()
-
-    for explosion in explosions:
-        for particle in explosion["particles"]:
-            particle.clear()
-        explosion["flash"].clear()
-    explosions.clear()
-
-    for powerup in powerups:
-        powerup.destroy()
-    powerups.clear()
-
-    player.setposition(0, FLOOR_LEVEL)
-    message.clear()
-    spawn_wave()
-
-
-def restart_game():
-    global game_state
-    if game_state == "gameover":
-        start_game()
+def take_inputs() -> Inputs:
+    held, pressed = keys.poll()
+    return Inputs(steer=("right" in held) - ("left" in held), shoot="shoot" in held,
+                  atomic="atomic" in pressed, pause="pause" in pressed, restart="restart" in pressed)
 
 
 # ---------------------- Binding ----------------------
+# Appuis et relâchements de toutes les touches, avec l'heure de l'événement ;
+# Tk préfère les liaisons précises de turtle (q, F3) à celles-ci.
+window.getcanvas().bind("<KeyPress>", lambda event: keys.press(event.keysym, event.time))
+window.getcanvas().bind("<KeyRelease>", lambda event: keys.release(event.keysym))
+window.getcanvas().bind("<FocusOut>", lambda event: keys.clear())
 window.listen()
-window.onkeypress(move_left, "Left")
-window.onkeypress(move_right, "Right")
-window.onkeypress(move_left, "a")
-window.onkeypress(move_right, "d")
-window.onkeypress(shoot_laser, "space")
-window.onkeypress(toggle_pause, "p")
 window.onkeypress(quit_game, "q")
-window.onkeypress(restart_game, "r")
-window.onkeypress(atomic, "w")
-window.onkeypress(atomic, "W")
+window.onkeypress(toggle_overlay, "F3")
+trace_startup("contrôles")
 
 # ---------------------- Initialisation ----------------------
-create_alien_shapes()
-create_stars()
 draw_grid()
+trace_startup("grille")
 show_menu()
+trace_startup("menu")
+window.update()
+trace_startup("premier affichage")
+warm_up_time = 0.0
+
+
+def warm_up():
+    """Prépare pendant le menu, un peu à chaque image, ce dont la partie
+    aura besoin : formes et premières tortues de laser."""
+    global warm_up_time
+    if options.renderer != "turtle" or laser_pool.size >= LASER_POOL_PREFILL:
+        return
+    start = time.perf_counter()
+    create_alien_shapes()
+    laser_pool.prefill(min(laser_pool.size + LASER_PREFILL_STEP, LASER_POOL_PREFILL))
+    warm_up_time += time.perf_counter() - start
+    if laser_pool.size >= LASER_POOL_PREFILL:
+        trace_startup("lasers (pendant le menu)", warm_up_time)
+
 
 # ---------------------- Boucle principale ----------------------
 running = True
-combo_timer = 0
 
 while running:
     window.update()
-
-    if game_state == "menu":
-        update_stars()
-        time.sleep(0.016)
-        continue
-
-    if game_state == "paused":
-        time.sleep(0.016)
-        continue
-
-    if game_state == "gameover":
-        update_stars()
-        animate_explosions()
-        time.sleep(0.016)
-        continue
-
-    # Jeu en cours
-    update_stars()
-    draw_player_effects()
-
-    move_lasers()
-    animate_explosions()
-
-    formation.update()
-    if boss:
-        boss.update()
-
-    alien_shoot()
-
-    for powerup in powerups[:]:
-        if not powerup.update():
-            powerup.destroy()
-            powerups.remove(powerup)
-
-    update_powerup_timers()
-
-    if combo_timer > 0:
-        combo_timer -= 1
-    else:
-        combo = 0
-
-    result = check_collisions()
-    if result == "gameover":
-        game_state = "gameover"
-        play_sound("game_over")
-        show_message(f"GAME OVER\n\nScore: {score}\nRecord: {high_score}\n\nR pour rejouer", 24, "#FF4444")
-
-    if not aliens and (not boss or not boss.active) and game_state == "playing":
-        level += 1
-        play_sound("level_up")
-        if boss:
-            show_message(f"BOSS VAINCU!\n\nNiveau {level}", 30, "#00FF00")
+    # L'image des ticks précédents est maintenant à l'écran
+    input_latency.presented()
+    profiler.lap("window_update")
+
+    # La simulation avance par ticks fixes ; le rendu suit à son rythme
+    ticks = 1 if options.soak else loop.advance()
+    ended = False
+    for _ in range(ticks):
+        if options.soak:
+            advance_game(sweep_inputs(game.tick, restart=True))
+            soak_step()
         else:
-            show_message(f"NIVEAU {level}", 36)
-        window.update()
-        time.sleep(1.5)
-        message.clear()
-        spawn_wave()
-
-    update_hud()
-
-    time.sleep(0.016)
-
+            advance_game(take_inputs())
+        play_events()
+        profiler.lap("events")
+        ended = ended or ("gameover",) in game.events
+
+    if ticks:
+        if game.state != "paused":
+            update_stars()
+            profiler.lap("stars")
+        if game.state == "gameover":
+            if ended:
+                render()
+            else:
+                draw_explosions()
+                profiler.lap("draw_explosions")
+        elif game.state == "playing":
+            render()
+        update_overlay()
+        profiler.lap("overlay")
+        loop.frame_rendered()
+        profiler.end_frame(frame_counts())
+        if game.state == "menu":
+            warm_up()
+
+    if not options.soak:
+        time.sleep(loop.idle_time())
+    profiler.skip()
+
+if game.state in ("playing", "paused"):
+    record_score()
+if scores:
+    scores.close()
+sounds_ready.wait()
+if mixer:
+    mixer.close()
+profiler.close()
+if recorder:
+    recorder.close()
+if options.profile_dump:
+    print(profiler.format_overlay())
+    print(input_latency.format_line())
 window.bye()
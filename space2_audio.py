@@ -0,0 +1,355 @@
+"""Sons synthétisés et mixage de Space Invaders 2.0.
+
+Chaque effet est calculé d'un bloc (vectorisé avec NumPy s'il est présent)
+puis écrit en une seule fois. Les fichiers sont mis en cache dans le
+dossier temporaire sous un nom dérivé de leurs paramètres : un lancement
+suivant réutilise les WAV existants sans rien recalculer.
+
+Pendant la partie, ``Mixer`` garde les sons en mémoire et mélange les voix
+en cours dans un seul flux envoyé à une sortie (``AplaySink`` sous Linux,
+``NullSink`` ou ``WavFileSink`` sans carte son) : jouer un son ne lance
+aucun processus.
+
+    python3 space2_audio.py    # mesure un démarrage à froid puis à chaud
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SAMPLE_RATE = 22050
+AMPLITUDE = 32767 * 0.5
+# À incrémenter quand la synthèse change : invalide le cache existant
+SYNTH_VERSION = 1
+
+# nom -> (fréquence, durée, enveloppe)
+SOUNDS = {
+    'laser': (800, 0.1, "sweep_down"),
+    'explosion': (200, 0.25, "noise"),
+    'game_over': (300, 0.8, "game_over"),
+    'powerup': (600, 0.3, "powerup"),
+    'boss_hit': (150, 0.2, "boss"),
+    'level_up': (500, 0.5, "level_up"),
+    'shield': (400, 0.15, "sweep_up"),
+}
+
+
+def _signal(envelope: str, frequency: float, duration: float, t, noise, sin, exp):
+    """Forme d'onde entre -1 et 1 ; ``t`` est un instant ou un tableau d'instants."""
+    if envelope == "sweep_down":
+        freq = frequency - (frequency * 0.7 * t / duration)
+        return sin(2 * math.pi * freq * t) * exp(-t * 10)
+    if envelope == "sweep_up":
+        freq = frequency + (frequency * 0.5 * t / duration)
+        return sin(2 * math.pi * freq * t) * exp(-t * 8)
+    if envelope == "noise":
+        return noise * exp(-t * 8)
+    if envelope == "game_over":
+        freq = frequency - (frequency * 0.5 * t / duration)
+        return sin(2 * math.pi * freq * t) * exp(-t * 3)
+    if envelope == "powerup":
+        freq = frequency + (frequency * t / duration)
+        return sin(2 * math.pi * freq * t) * (1 - (t / duration))
+    if envelope == "boss":
+        value = sin(2 * math.pi * frequency * t)
+        value += 0.5 * sin(2 * math.pi * frequency * 1.5 * t)
+        return value * exp(-t * 5)
+    if envelope == "level_up":
+        freq = frequency * (1 + t / duration)
+        return sin(2 * math.pi * freq * t) * (1 - (t / duration) * 0.5)
+    return sin(2 * math.pi * frequency * t)
+
+
+def synthesize(frequency: float, duration: float, envelope: str = "none",
+               sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Échantillons PCM 16 bits mono (petit-boutiste) d'un effet sonore.
+
+    Le bruit de l'enveloppe ``noise`` vient d'un générateur amorcé par les
+    paramètres du son : un même effet donne toujours les mêmes octets, avec
+    ou sans NumPy, ce qui permet de le mettre en cache.
+    """
+    num_samples = int(sample_rate * duration)
+    rng = random.Random(f"{frequency}:{duration}:{envelope}")
+
+    if np is not None:
+        t = np.arange(num_samples) / sample_rate
+        noise = None
+        if envelope == "noise":
+            noise = np.array([rng.uniform(-1, 1) for _ in range(num_samples)])
+        value = _signal(envelope, frequency, duration, t, noise, np.sin, np.exp)
+        data = np.clip(np.trunc(value * AMPLITUDE), -32767, 32767).astype("<i2")
+        return data.tobytes()
+
+    samples = array('h')
+    for i in range(num_samples):
+        noise = rng.uniform(-1, 1) if envelope == "noise" else None
+        value = _signal(envelope, frequency, duration, i / sample_rate, noise, math.sin, math.exp)
+        samples.append(max(-32767, min(32767, int(value * AMPLITUDE))))
+    if array('h', [1]).tobytes() != b'\x01\x00':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def cache_key(frequency: float, duration: float, envelope: str,
+              sample_rate: int = SAMPLE_RATE) -> str:
+    text = f"v{SYNTH_VERSION}:{frequency}:{duration}:{envelope}:{sample_rate}"
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def create_wav_file(filename: str, frequency: float, duration: float, envelope: str = "none",
+                    sample_rate: int = SAMPLE_RATE):
+    """Crée un fichier WAV avec une fréquence et durée données.
+
+    Le fichier est écrit à côté puis renommé : un lancement interrompu ne
+    laisse jamais de WAV tronqué dans le cache.
+    """
+    partial = f"{filename}.{os.getpid()}.tmp"
+    with wave.open(partial, 'w') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(synthesize(frequency, duration, envelope, sample_rate))
+    os.replace(partial, filename)
+
+
+def build_sound_files(directory: str | None = None, sample_rate: int = SAMPLE_RATE) -> dict:
+    """Renvoie ``{nom: chemin}`` en ne synthétisant que les sons absents du cache."""
+    directory = directory or tempfile.gettempdir()
+    sound_files = {}
+    for name, (frequency, duration, envelope) in SOUNDS.items():
+        key = cache_key(frequency, duration, envelope, sample_rate)
+        path = os.path.join(directory, f"space2_{name}_{key}.wav")
+        if not os.path.exists(path):
+            create_wav_file(path, frequency, duration, envelope, sample_rate)
+        sound_files[name] = path
+    return sound_files
+
+
+# ---------------------- Sorties ----------------------
+
+class NullSink:
+    """Sortie muette : compte les échantillons sans les jouer."""
+
+    realtime = False
+
+    def __init__(self):
+        self.frames = 0
+
+    def write(self, data: bytes):
+        self.frames += len(data) // 2
+
+    def close(self):
+        pass
+
+
+class WavFileSink:
+    """Enregistre le flux mixé dans un fichier WAV."""
+
+    realtime = False
+
+    def __init__(self, path: str, sample_rate: int = SAMPLE_RATE):
+        self.wav_file = wave.open(path, 'w')
+        self.wav_file.setnchannels(1)
+        self.wav_file.setsampwidth(2)
+        self.wav_file.setframerate(sample_rate)
+
+    def write(self, data: bytes):
+        self.wav_file.writeframes(data)
+
+    def close(self):
+        self.wav_file.close()
+
+
+class AplaySink:
+    """Un seul processus ``aplay`` (ALSA) alimenté en PCM brut sur stdin.
+
+    L'écriture bloque au rythme de la carte son : c'est elle qui cadence le
+    mixeur.
+    """
+
+    realtime = True
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, buffer_ms: int = 60):
+        if shutil.which("aplay") is None:
+            raise OSError("aplay introuvable")
+        self.process = subprocess.Popen(
+            ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-c", "1", "-r", str(sample_rate),
+             f"--buffer-time={buffer_ms * 1000}", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def write(self, data: bytes):
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.terminate()
+
+
+def open_sink(name: str = "auto"):
+    """Sortie audio par nom : ``aplay``, ``null`` ou ``auto``.
+
+    ``auto`` choisit ``aplay`` sous Linux s'il est disponible et renvoie
+    ``None`` ailleurs (pas de sortie en flux dans la bibliothèque standard).
+    """
+    if name == "null":
+        return NullSink()
+    if name == "aplay":
+        return AplaySink()
+    if name == "auto" and sys.platform.startswith("linux"):
+        try:
+            return AplaySink()
+        except OSError:
+            return NullSink()
+    return None
+
+
+# ---------------------- Mixeur ----------------------
+
+def load_wav(path: str):
+    """Échantillons 16 bits d'un WAV mono, en tableau NumPy ou ``array('h')``."""
+    with wave.open(path, 'rb') as wav_file:
+        data = wav_file.readframes(wav_file.getnframes())
+    if np is not None:
+        return np.frombuffer(data, dtype="<i2").astype(np.int32)
+    samples = array('h')
+    samples.frombytes(data)
+    if array('h', [1]).tobytes() != b'\x01\x00':
+        samples.byteswap()
+    return samples
+
+
+class Mixer:
+    """Mélange les sons en cours dans un seul flux PCM.
+
+    ``play`` est appelable depuis la boucle de jeu : il ajoute une voix sans
+    rien bloquer. Au-delà de ``polyphony`` voix, la plus ancienne est coupée ;
+    un même son rejoué moins de ``min_interval`` secondes après le précédent
+    est ignoré. ``start`` lance le fil qui envoie les blocs mixés à ``sink`` ;
+    sans fil, ``render`` peut être appelé directement.
+    """
+
+    def __init__(self, sound_files: dict, sink=None, polyphony: int = 8,
+                 min_interval: float = 0.03, block: int = 512, sample_rate: int = SAMPLE_RATE):
+        self.sounds = {name: load_wav(path) for name, path in sound_files.items()}
+        self.sink = sink if sink is not None else NullSink()
+        self.polyphony = polyphony
+        self.min_interval = min_interval
+        self.block = block
+        self.sample_rate = sample_rate
+
+        self.voices = []
+        self.last_played = {}
+        self.played = 0
+        self.rate_limited = 0
+        self.stolen = 0
+
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+    def play(self, name: str):
+        samples = self.sounds.get(name)
+        if samples is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self.last_played.get(name, -math.inf) < self.min_interval:
+                self.rate_limited += 1
+                return
+            self.last_played[name] = now
+            if len(self.voices) >= self.polyphony:
+                self.voices.pop(0)
+                self.stolen += 1
+            self.voices.append([samples, 0])
+            self.played += 1
+
+    def render(self, frames: int) -> bytes:
+        """Mélange les ``frames`` échantillons suivants de toutes les voix."""
+        with self._lock:
+            voices = self.voices
+            if np is not None:
+                mix = np.zeros(frames, dtype=np.int32)
+                for voice in voices:
+                    samples, position = voice
+                    chunk = samples[position:position + frames]
+                    mix[:len(chunk)] += chunk
+                    voice[1] = position + len(chunk)
+            else:
+                mix = [0] * frames
+                for voice in voices:
+                    samples, position = voice
+                    chunk = samples[position:position + frames]
+                    for i, value in enumerate(chunk):
+                        mix[i] += value
+                    voice[1] = position + len(chunk)
+            self.voices = [voice for voice in voices if voice[1] < len(voice[0])]
+
+        if np is not None:
+            return np.clip(mix, -32767, 32767).astype("<i2").tobytes()
+        out = array('h', [max(-32767, min(32767, value)) for value in mix])
+        if array('h', [1]).tobytes() != b'\x01\x00':
+            out.byteswap()
+        return out.tobytes()
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._pump, name="space2-mixer", daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        period = self.block / self.sample_rate
+        deadline = time.monotonic()
+        while self._running:
+            data = self.render(self.block)
+            try:
+                self.sink.write(data)
+            except OSError:
+                break
+            if not self.sink.realtime:
+                deadline += period
+                time.sleep(max(0.0, deadline - time.monotonic()))
+
+    def close(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        self.sink.close()
+
+
+def main():
+    directory = tempfile.mkdtemp(prefix="space2_sounds_")
+    start = time.perf_counter()
+    build_sound_files(directory)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    build_sound_files(directory)
+    warm = time.perf_counter() - start
+    backend = "numpy" if np is not None else "python"
+    print(f"synthèse {backend}: démarrage à froid {cold * 1000:.1f} ms, à chaud {warm * 1000:.2f} ms")
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Benchmarks headless du moteur de Space Invaders 2.0.
+
+    python3 space2_bench.py collisions [--repeat 200] [--json]
+    python3 space2_bench.py scenarios [--ticks 1800] [--collisions grid] [--alien-fire scheduled]
+                                      [--stages] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import platform
+import random
+import time
+
+from space2_engine import (
+    COLLISION_MODES,
+    COLOR_ENEMY_LASER,
+    ENGINE_STAGES,
+    FIRE_MODES,
+    MAX_LIVES,
+    Game,
+    Laser,
+    np,
+    sweep_inputs,
+)
+from space2_profiler import FrameProfiler, percentile
+
+WIDTH = 1536
+HEIGHT = 972
+
+
+# ---------------------- Collisions ----------------------
+
+# (nom, niveau, nombre de bombes atomiques tirées). Le niveau 10 est un
+# combat de boss sans formation : on mesure la formation maximale (6x9)
+# au niveau 11, qui a exactement la même taille.
+COLLISION_CASES = [
+    ("level_1", 1, 0),
+    ("level_10", 11, 0),
+    ("atomic_spam", 11, 4),
+]
+
+
+def collision_scenario(level: int, atomics: int, seed: int = 0) -> Game:
+    """Formation fraîche du niveau donné, lasers étalés sur toute sa hauteur."""
+    game = Game(WIDTH, HEIGHT, seed=seed)
+    game.start()
+    game.level = level
+    game.spawn_wave()
+
+    for _ in range(atomics):
+        game.atomic_explosion()
+    # Une salve normale en plus, comme en jeu
+    for offset in range(-2, 3):
+        game.player_x = offset * 90
+        game.last_shot_time = -1.0
+        game.shoot_laser()
+
+    span = game.top - game.floor_level
+    for i, laser in enumerate(game.lasers):
+        laser.y = game.floor_level + (i * 37) % span
+    return game
+
+
+def bench_collisions(repeat: int) -> list:
+    modes = [mode for mode in COLLISION_MODES if mode != "numpy" or np is not None]
+    results = []
+    for name, level, atomics in COLLISION_CASES:
+        base = collision_scenario(level, atomics)
+        outcomes = {}
+        for mode in modes:
+            base.collision_mode = mode
+            games = [copy.deepcopy(base) for _ in range(repeat)]
+            start = time.perf_counter()
+            for game in games:
+                game.resolve_alien_hits()
+            elapsed = time.perf_counter() - start
+            outcomes[mode] = (games[0].score, len(games[0].aliens), len(games[0].lasers))
+            results.append({
+                "case": name,
+                "mode": mode,
+                "lasers": len(base.lasers),
+                "aliens": len(base.aliens),
+                "us_per_pass": elapsed / repeat * 1e6,
+            })
+        if len(set(outcomes.values())) > 1:
+            raise AssertionError(f"{name}: résultats différents selon le mode {outcomes}")
+    return results
+
+
+def print_table(results: list):
+    print(f"{'cas':<14}{'mode':<8}{'lasers':>8}{'aliens':>8}{'µs/passe':>12}")
+    for row in results:
+        print(f"{row['case']:<14}{row['mode']:<8}{row['lasers']:>8}{row['aliens']:>8}"
+              f"{row['us_per_pass']:>12.1f}")
+
+
+# ---------------------- Scénarios ----------------------
+# Chaque scénario rejoue la boucle de jeu tick par tick avec des entrées
+# scriptées et une graine fixe. Un crochet appelé avant chaque tick (hors
+# mesure) maintient la situation voulue : vague rétablie quand elle est
+# vaincue, vies remises au maximum, charge injectée.
+
+WARMUP_TICKS = 60
+ATOMIC_SPAM_INTERVAL = 4
+ENEMY_LASER_TARGET = 100
+EXPLOSIONS_PER_TICK = 3
+
+
+def _restart(game: Game, level: int):
+    game.start()
+    game.level = level
+    game.spawn_wave()
+
+
+def keep_wave(level: int):
+    """Crochet qui maintient la partie au niveau ``level``."""
+    def hook(game: Game, tick: int, rng: random.Random):
+        if game.state != "playing" or game.level != level:
+            _restart(game, level)
+        game.lives = MAX_LIVES
+    return hook
+
+
+def atomic_spam(game: Game, tick: int, rng: random.Random):
+    keep_wave(11)(game, tick, rng)
+    if tick % ATOMIC_SPAM_INTERVAL == 0:
+        game.atomic_explosion()
+
+
+def enemy_laser_storm(game: Game, tick: int, rng: random.Random):
+    keep_wave(1)(game, tick, rng)
+    while len(game.enemy_lasers) < ENEMY_LASER_TARGET:
+        game.enemy_lasers.append(Laser(rng.uniform(game.left + 20, game.right - 20),
+                                       rng.uniform(game.floor_level, game.top),
+                                       1, COLOR_ENEMY_LASER, 3))
+
+
+def continuous_explosions(game: Game, tick: int, rng: random.Random):
+    keep_wave(1)(game, tick, rng)
+    for _ in range(EXPLOSIONS_PER_TICK):
+        game.create_explosion(rng.uniform(game.left, game.right), rng.uniform(game.floor_level, game.top),
+                              "#FF4500")
+
+
+# (nom, crochet). La formation maximale (6x9) est atteinte au niveau 11,
+# les niveaux 5 et 10 sont des combats de boss.
+SCENARIOS = [
+    ("level_1", keep_wave(1)),
+    ("max_formation", keep_wave(11)),
+    ("boss_5", keep_wave(5)),
+    ("boss_10", keep_wave(10)),
+    ("atomic_spam", atomic_spam),
+    ("enemy_lasers_100", enemy_laser_storm),
+    ("explosions", continuous_explosions),
+]
+
+PEAK_COUNTERS = ("aliens", "lasers", "enemy_lasers", "particles")
+
+
+def run_scenario(hook, ticks: int, collision_mode: str = "loop", seed: int = 0,
+                 stages: bool = False, fire_mode: str = "roll") -> dict:
+    """Durées de ``ticks`` appels à ``step`` après ``WARMUP_TICKS`` de chauffe."""
+    game = Game(WIDTH, HEIGHT, seed=seed, collision_mode=collision_mode, fire_mode=fire_mode)
+    rng = random.Random(seed)
+    profiler = None
+    clock = time.perf_counter
+    durations = []
+    peaks = dict.fromkeys(PEAK_COUNTERS, 0)
+
+    for tick in range(WARMUP_TICKS + ticks):
+        if tick == WARMUP_TICKS and stages:
+            profiler = game.profiler = FrameProfiler(ENGINE_STAGES, window=ticks)
+        hook(game, tick, rng)
+        inputs = sweep_inputs(tick)
+        if tick < WARMUP_TICKS:
+            game.step(inputs)
+            continue
+        if profiler:
+            profiler.skip()
+        start = clock()
+        game.step(inputs)
+        durations.append(clock() - start)
+        if profiler:
+            profiler.end_frame()
+
+        peaks["aliens"] = max(peaks["aliens"], len(game.aliens))
+        peaks["lasers"] = max(peaks["lasers"], len(game.lasers))
+        peaks["enemy_lasers"] = max(peaks["enemy_lasers"], len(game.enemy_lasers))
+        peaks["particles"] = max(peaks["particles"], game.particles.count)
+
+    values = sorted(durations)
+    result = {
+        "ticks": ticks,
+        "ticks_per_s": ticks / sum(durations),
+        "p50_us": percentile(values, 50) * 1e6,
+        "p95_us": percentile(values, 95) * 1e6,
+        "p99_us": percentile(values, 99) * 1e6,
+        "max_us": values[-1] * 1e6,
+        "peak": peaks,
+    }
+    if profiler:
+        result["stages_ms"] = profiler.summary()
+    return result
+
+
+def bench_scenarios(ticks: int, collision_mode: str, stages: bool = False, only=None,
+                    fire_mode: str = "roll") -> dict:
+    results = []
+    for name, hook in SCENARIOS:
+        if only and name not in only:
+            continue
+        row = {"scenario": name}
+        row.update(run_scenario(hook, ticks, collision_mode, stages=stages, fire_mode=fire_mode))
+        results.append(row)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np is not None,
+        "collisions": collision_mode,
+        "alien_fire": fire_mode,
+        "results": results,
+    }
+
+
+def print_scenarios(report: dict):
+    print(f"{'scénario':<18}{'ticks/s':>10}{'p50 µs':>9}{'p95 µs':>9}{'p99 µs':>9}{'max µs':>9}")
+    for row in report["results"]:
+        print(f"{row['scenario']:<18}{row['ticks_per_s']:>10.0f}{row['p50_us']:>9.1f}"
+              f"{row['p95_us']:>9.1f}{row['p99_us']:>9.1f}{row['max_us']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    collisions = sub.add_parser("collisions", help="lasers vs aliens : boucle contre NumPy")
+    collisions.add_argument("--repeat", type=int, default=200)
+    collisions.add_argument("--json", action="store_true", help="sortie JSON")
+    scenarios = sub.add_parser("scenarios", help="boucle de jeu complète sur des scénarios fixes")
+    scenarios.add_argument("--ticks", type=int, default=1800, help="ticks mesurés par scénario")
+    scenarios.add_argument("--collisions", choices=COLLISION_MODES, default="loop")
+    scenarios.add_argument("--alien-fire", choices=FIRE_MODES, default="roll")
+    scenarios.add_argument("--stages", action="store_true",
+                           help="ajoute les percentiles de chaque étape du moteur")
+    scenarios.add_argument("--only", nargs="+", choices=[name for name, _ in SCENARIOS])
+    scenarios.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    if args.command == "collisions":
+        results = bench_collisions(args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_table(results)
+    elif args.command == "scenarios":
+        report = bench_scenarios(args.ticks, args.collisions, args.stages, args.only, args.alien_fire)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_scenarios(report)
+
+
+if __name__ == "__main__":
+    main()
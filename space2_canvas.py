@@ -0,0 +1,262 @@
+"""Rendu direct sur le Canvas Tk de Space Invaders 2.0.
+
+Même image que les tortues, sans elles : chaque alien, tir, particule ou
+power-up est un élément du canevas créé une fois puis déplacé par
+``coords()`` et recoloré par ``itemconfig()``. Rien n'est effacé ni
+recréé d'une image à l'autre, et ``window.update()`` n'a plus de tortues
+à parcourir.
+
+Le canevas de turtle a son origine au centre et l'axe y vers le bas : un
+point (x, y) du jeu est dessiné en (x, -y).
+"""
+
+from __future__ import annotations
+
+import time
+
+from space2_engine import (
+    COLOR_BOSS,
+    COLOR_PLAYER,
+    COLOR_PLAYER_SHIELD,
+    ENEMY_LASER_LENGTH,
+    LASER_LENGTH,
+)
+from space2_particles import FLASH_COLOR
+from space2_visuals import (
+    BOSS_PULSE_SPEED,
+    ENEMY_LASER_TRAIL,
+    HEALTH_BAR_BACK,
+    HEALTH_BAR_HEIGHT,
+    HEALTH_BAR_WIDTH,
+    LASER_TRAIL,
+    TRIANGLE,
+    boss_pulse,
+    health_color,
+    shape_coords,
+    shield_radius,
+)
+from sprites import SpritePool, sync_sprites
+
+
+class ItemBatch:
+    """Éléments de même type réutilisés d'une image à l'autre.
+
+    ``show(n)`` garantit ``n`` éléments visibles et cache ceux en trop, en
+    ne touchant qu'aux éléments qui changent d'état.
+    """
+
+    def __init__(self, create, canvas):
+        self.create = create
+        self.canvas = canvas
+        self.items = []
+        self.shown = 0
+
+    def show(self, count: int) -> list:
+        while len(self.items) < count:
+            self.items.append(self.create())
+        itemconfig = self.canvas.itemconfig
+        for item in self.items[count:self.shown]:
+            itemconfig(item, state="hidden")
+        for item in self.items[self.shown:count]:
+            itemconfig(item, state="normal")
+        self.shown = count
+        return self.items
+
+
+class CanvasRenderer:
+    """Dessine l'état de ``game`` sur ``canvas``, le canevas de la fenêtre turtle.
+
+    ``shapes`` associe un nom de forme turtle à ses points ; ``laser_trail``
+    et ``enemy_laser_trail`` sont les traînées des tirs, comme en turtle.
+    """
+
+    def __init__(self, canvas, game, shapes: dict, laser_trail: float = LASER_TRAIL,
+                 enemy_laser_trail: float = ENEMY_LASER_TRAIL, laser_pool_size: int = 256):
+        self.canvas = canvas
+        self.game = game
+        self.shapes = dict(shapes, triangle=TRIANGLE)
+        self.laser_trail = laser_trail
+        self.enemy_laser_trail = enemy_laser_trail
+
+        self.alien_items = {}
+        self.laser_items = {}
+        self.enemy_laser_items = {}
+        self.powerup_items = {}
+        self.polygon_pool = SpritePool(self._new_polygon, self._hide, 128)
+        self.line_pool = SpritePool(self._new_line, self._hide, laser_pool_size)
+
+        self.particle_lines = ItemBatch(self._new_line, canvas)
+        self.particle_dots = ItemBatch(self._new_oval, canvas)
+        self.flashes = ItemBatch(self._new_flash, canvas)
+
+        self.player = self._new_polygon()
+        canvas.itemconfig(self.player, state="normal", fill=COLOR_PLAYER, outline=COLOR_PLAYER)
+        self.shield = canvas.create_oval(0, 0, 0, 0, outline=COLOR_PLAYER_SHIELD, width=2,
+                                         state="hidden", tags=("lines",))
+        self.shield_shown = False
+
+        self.boss = None
+        self.boss_color = None
+        self.boss_health = None
+        self.boss_item = self._new_polygon()
+        self.health_back = canvas.create_rectangle(0, 0, 0, 0, fill=HEALTH_BAR_BACK, outline=HEALTH_BAR_BACK,
+                                                   state="hidden", tags=("lines",))
+        self.health_front = canvas.create_rectangle(0, 0, 0, 0, state="hidden", tags=("lines",))
+
+    # ------------------ Éléments ------------------
+
+    def _new_polygon(self):
+        # Les formes passent au-dessus des traits, comme les tortues
+        return self.canvas.create_polygon(0, 0, 0, 0, 0, 0, width=1, state="hidden", tags=("shapes",))
+
+    def _new_line(self):
+        item = self.canvas.create_line(0, 0, 0, 0, capstyle="round", state="hidden", tags=("lines",))
+        if self.canvas.find_withtag("shapes"):
+            self.canvas.tag_lower(item, "shapes")
+        return item
+
+    def _new_oval(self):
+        item = self.canvas.create_oval(0, 0, 0, 0, state="hidden", tags=("lines",))
+        if self.canvas.find_withtag("shapes"):
+            self.canvas.tag_lower(item, "shapes")
+        return item
+
+    def _new_flash(self):
+        item = self._new_oval()
+        self.canvas.itemconfig(item, fill=FLASH_COLOR, outline=FLASH_COLOR)
+        return item
+
+    def _hide(self, item):
+        self.canvas.itemconfig(item, state="hidden")
+
+    # ------------------ Étapes du rendu ------------------
+
+    def draw_player(self):
+        game = self.game
+        canvas = self.canvas
+        x, y = game.player_x, game.player_y
+        canvas.coords(self.player, *shape_coords(TRIANGLE, x, y, 90, 1.6))
+
+        if game.shield_active:
+            # ``circle`` de turtle part du bas du cercle, centre au-dessus
+            radius = shield_radius(time.time())
+            cy = y - 25 + radius
+            canvas.coords(self.shield, x - radius, -(cy + radius), x + radius, -(cy - radius))
+            if not self.shield_shown:
+                canvas.itemconfig(self.shield, state="normal")
+                self.shield_shown = True
+        elif self.shield_shown:
+            canvas.itemconfig(self.shield, state="hidden")
+            self.shield_shown = False
+
+    def draw_lasers(self):
+        game = self.game
+        sync_sprites(self.laser_items, game.lasers, self._create_laser, self._draw_laser,
+                     self.line_pool.release)
+        sync_sprites(self.enemy_laser_items, game.enemy_lasers, self._create_laser,
+                     self._draw_enemy_laser, self.line_pool.release)
+
+    def _create_laser(self, laser):
+        item = self.line_pool.acquire()
+        if item is not None:
+            self.canvas.itemconfig(item, fill=laser.color, width=laser.width, state="normal")
+        return item
+
+    def _draw_laser(self, laser, item):
+        self.canvas.coords(item, laser.x, -(laser.y - self.laser_trail),
+                           laser.x, -(laser.y + LASER_LENGTH))
+
+    def _draw_enemy_laser(self, laser, item):
+        self.canvas.coords(item, laser.x, -(laser.y + self.enemy_laser_trail),
+                           laser.x, -(laser.y - ENEMY_LASER_LENGTH))
+
+    def draw_explosions(self):
+        canvas = self.canvas
+        coords = canvas.coords
+        itemconfig = canvas.itemconfig
+        particles = self.game.particles
+
+        flashes = list(particles.visible_flashes())
+        items = self.flashes.show(len(flashes))
+        for item, (x, y, size) in zip(items, flashes):
+            half = size / 2
+            coords(item, x - half, -y - half, x + half, -y + half)
+
+        visible = list(particles.visible())
+        lines = self.particle_lines.show(len(visible))
+        dots = self.particle_dots.show(len(visible))
+        for line, dot, (x0, y0, x1, y1, size, width, color) in zip(lines, dots, visible):
+            coords(line, x0, -y0, x1, -y1)
+            itemconfig(line, fill=color, width=width)
+            half = size / 2
+            coords(dot, x1 - half, -y1 - half, x1 + half, -y1 + half)
+            itemconfig(dot, fill=color, outline=color)
+
+    def draw_aliens(self):
+        sync_sprites(self.alien_items, self.game.aliens, self._create_alien, self._draw_alien,
+                     self.polygon_pool.release)
+
+    def _create_alien(self, alien):
+        item = self.polygon_pool.acquire()
+        if item is not None:
+            self.canvas.itemconfig(item, fill=alien.color, outline=alien.color, state="normal")
+        return item
+
+    def _draw_alien(self, alien, item):
+        self.canvas.coords(item, *shape_coords(self.shapes[alien.shape], alien.x, alien.y))
+
+    def draw_boss(self):
+        canvas = self.canvas
+        boss = self.game.boss
+        if not boss or not boss.active:
+            self._hide_boss()
+            return
+        if self.boss is None:
+            for item in (self.boss_item, self.health_back, self.health_front):
+                canvas.itemconfig(item, state="normal")
+        self.boss = boss
+
+        scale = boss_pulse(BOSS_PULSE_SPEED * time.time())
+        canvas.coords(self.boss_item, *shape_coords(self.shapes["boss_shape"], boss.x, boss.y, 0, scale))
+        # Couleurs changées seulement au flash et quand la vie baisse
+        color = "white" if boss.flash else COLOR_BOSS
+        if color != self.boss_color:
+            self.boss_color = color
+            canvas.itemconfig(self.boss_item, fill=color, outline=color)
+
+        x = boss.x - HEALTH_BAR_WIDTH / 2
+        y = boss.y + 50
+        canvas.coords(self.health_back, x, -y, x + HEALTH_BAR_WIDTH, -(y + HEALTH_BAR_HEIGHT))
+        health, max_health = boss.health, boss.max_health
+        width = max(0, (health / max_health) * HEALTH_BAR_WIDTH)
+        canvas.coords(self.health_front, x, -y, x + width, -(y + HEALTH_BAR_HEIGHT))
+        if health != self.boss_health:
+            self.boss_health = health
+            color = health_color(health, max_health)
+            canvas.itemconfig(self.health_front, fill=color, outline=color)
+
+    def draw_powerups(self):
+        sync_sprites(self.powerup_items, self.game.powerups, self._create_powerup, self._draw_powerup,
+                     self.polygon_pool.release)
+
+    def _create_powerup(self, powerup):
+        item = self.polygon_pool.acquire()
+        if item is not None:
+            self.canvas.itemconfig(item, fill=powerup.color, outline=powerup.color, state="normal")
+        return item
+
+    def _draw_powerup(self, powerup, item):
+        self.canvas.coords(item, *shape_coords(self.shapes["powerup_shape"], powerup.x, powerup.y,
+                                               powerup.angle, 1.2))
+
+    def clear_wave(self):
+        sync_sprites(self.alien_items, [], self._create_alien, self._draw_alien, self.polygon_pool.release)
+        self._hide_boss()
+
+    def _hide_boss(self):
+        if self.boss is not None:
+            for item in (self.boss_item, self.health_back, self.health_front):
+                self.canvas.itemconfig(item, state="hidden")
+            self.boss = None
+            self.boss_color = None
+            self.boss_health = None
@@ -0,0 +1,878 @@
+"""Moteur de simulation de Space Invaders 2.0, sans turtle ni Tk.
+
+Toutes les règles du jeu (formation, tirs, collisions, power-ups, boss,
+combo, niveaux) vivent ici sous forme de données pures. Le front end turtle
+de ``space2.py`` n'est qu'un consommateur : il transmet les entrées du
+joueur à ``Game.step`` puis dessine l'état obtenu.
+
+Exemple headless ::
+
+    game = Game(1200, 800, seed=42)
+    game.start()
+    for _ in range(1000):
+        game.step(Inputs(shoot=True))
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : seul le mode "numpy" en dépend
+    np = None
+
+from space2_entities import EntityStore
+from space2_particles import ParticleSystem
+
+# ---------------------- Configuration ----------------------
+# Les vitesses sont en pixels par seconde et les durées en secondes : le
+# jeu se déroule à la même allure quelle que soit la fréquence des ticks.
+DEFAULT_TICK_RATE = 60
+
+PLAYER_SPEED = 28
+# Déplacement continu d'une touche tenue : 30 répétitions clavier de 28 px par seconde
+PLAYER_STEER_SPEED = 840
+LASER_SPEED = 1200
+LASER_LENGTH = 20
+ENEMY_LASER_SPEED = 720
+ENEMY_LASER_LENGTH = 15
+ALIEN_DROP = 22
+ALIEN_STEP = 90
+# Accélération de la formation par niveau (vitesse x (1 + niveau x 0.08))
+ALIEN_SPEED_GROWTH = 0.08
+# Tirs par seconde et par alien (0.6 % de chance par tick à 60 Hz)
+ALIEN_SHOOT_RATE = 0.36
+ALIEN_SHOOT_GROWTH = 0.05
+# Chance qu'un alien détruit lâche un power-up
+POWERUP_DROP_CHANCE = 0.12
+POWERUP_FALL_SPEED = 150
+POWERUP_SPIN = 300
+BOSS_SPEED = 180
+BOSS_SHOOT_INTERVAL = 26 / 60
+BOSS_BASE_HEALTH = 30
+BOSS_HEALTH_PER_LEVEL = 10
+
+SHIELD_DURATION = 10.0
+RAPID_DURATION = 8.0
+TRIPLE_DURATION = 7.0
+COMBO_WINDOW = 1.0
+SHOT_COOLDOWN = 0.25
+RAPID_SHOT_COOLDOWN = 0.12
+
+MAX_LIVES = 5
+GUTTER = 40
+
+# Marge sous laquelle un minuteur décompté en flottants est considéré écoulé
+TIMER_EPSILON = 1e-9
+
+# Couleurs
+COLOR_PLAYER = "#00E5FF"
+COLOR_PLAYER_SHIELD = "#00FF88"
+COLOR_LASER = "#F72585"
+COLOR_LASER_POWERED = "#FFD700"
+COLOR_ENEMY_LASER = "#FF4444"
+COLOR_BOSS = "#FF00FF"
+
+# Couleurs aliens
+ALIEN_COLORS = ["#9BFF56", "#FF6B35", "#F7B32B", "#4ECDC4", "#FF3366"]
+ALIEN_SHAPES = ["alien1", "alien2", "alien3"]
+
+# Grille de la formation
+FORMATION_MARGIN_X = 90
+FORMATION_MARGIN_Y = 130
+FORMATION_SPACING_X = 68
+FORMATION_SPACING_Y = 52
+
+# Rayons de collision
+HIT_RADIUS_ALIEN = 22
+HIT_RADIUS_BOSS = 50
+HIT_RADIUS_PLAYER = 22
+HIT_RADIUS_POWERUP = 28
+
+# Résolution des collisions lasers/aliens
+COLLISION_MODES = ("loop", "numpy", "grid")
+# Tirs des aliens : un tirage par alien et par tick, ou tirs planifiés
+# depuis le premier rang de chaque colonne
+FIRE_MODES = ("roll", "scheduled")
+
+# Étapes d'un tick signalées au profileur, dans l'ordre
+ENGINE_STAGES = ("inputs", "move_lasers", "explosions", "formation", "boss", "alien_shoot",
+                 "update_powerups", "collisions", "spawn_wave")
+
+
+# ---------------------- Équilibrage ----------------------
+
+class Tuning:
+    """Constantes d'équilibrage d'une partie, modifiables une à une.
+
+    Les valeurs par défaut sont celles du jeu ; ``Tuning(alien_step=120)``
+    ne change que la vitesse de la formation. Un nom inconnu lève
+    ``ValueError``.
+    """
+
+    __slots__ = ("alien_step", "alien_speed_growth", "alien_shoot_rate", "alien_shoot_growth",
+                 "powerup_drop_chance", "boss_base_health", "boss_health_per_level")
+
+    def __init__(self, **overrides):
+        self.alien_step = ALIEN_STEP
+        self.alien_speed_growth = ALIEN_SPEED_GROWTH
+        self.alien_shoot_rate = ALIEN_SHOOT_RATE
+        self.alien_shoot_growth = ALIEN_SHOOT_GROWTH
+        self.powerup_drop_chance = POWERUP_DROP_CHANCE
+        self.boss_base_health = BOSS_BASE_HEALTH
+        self.boss_health_per_level = BOSS_HEALTH_PER_LEVEL
+        for name, value in overrides.items():
+            if name not in self.__slots__:
+                raise ValueError(f"Constante d'équilibrage inconnue: {name!r}")
+            setattr(self, name, value)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# ---------------------- Entrées ----------------------
+
+class Inputs:
+    """Entrées du joueur accumulées pendant un tick.
+
+    ``move`` est le nombre net de pas de déplacement (négatif vers la
+    gauche), chaque pas valant ``PLAYER_SPEED`` pixels comme un appui de
+    touche dans la version turtle. ``steer`` (-1, 0 ou 1) est la direction
+    d'une touche tenue : le joueur glisse de ``PLAYER_STEER_SPEED`` pixels
+    par seconde.
+    """
+
+    __slots__ = ("move", "shoot", "atomic", "pause", "restart", "steer")
+
+    def __init__(self, move: int = 0, shoot: bool = False, atomic: bool = False,
+                 pause: bool = False, restart: bool = False, steer: int = 0):
+        self.move = move
+        self.shoot = shoot
+        self.atomic = atomic
+        self.pause = pause
+        self.restart = restart
+        self.steer = steer
+
+
+NO_INPUT = Inputs()
+
+# Entrées scriptées : un aller ou un retour toutes les SWEEP_TICKS
+SWEEP_TICKS = 60
+
+
+def sweep_inputs(tick: int, restart: bool = False) -> Inputs:
+    """Balayage de gauche à droite en tirant en continu, à la vitesse d'une
+    touche tenue (bancs d'essai, balayage de paramètres, export, endurance)."""
+    return Inputs(steer=-1 if (tick // SWEEP_TICKS) % 2 else 1, shoot=True, restart=restart)
+
+
+# ---------------------- Entités ----------------------
+
+class Alien:
+    """Un alien n'a pas de position propre : il occupe la case ``(row, col)``
+    de sa formation, posée en ``(slot_x, slot_y)`` au début de la vague, et
+    suit le décalage commun de la formation."""
+
+    __slots__ = ("slot_x", "slot_y", "formation", "row", "col", "health", "points", "color", "shape",
+                 "index")
+
+    def __init__(self, formation: AlienFormation, row: int, col: int):
+        self.index = -1
+        self.formation = formation
+        self.slot_x = formation.start_x + col * FORMATION_SPACING_X
+        self.slot_y = formation.start_y - row * FORMATION_SPACING_Y
+        self.row = row
+        self.col = col
+        self.health = 1 + row // 2
+        self.points = 10 * (row + 1)
+        self.color = ALIEN_COLORS[row % len(ALIEN_COLORS)]
+        self.shape = ALIEN_SHAPES[row % len(ALIEN_SHAPES)]
+
+    @property
+    def x(self) -> float:
+        return self.slot_x + self.formation.offset_x
+
+    @property
+    def y(self) -> float:
+        return self.slot_y + self.formation.offset_y
+
+
+class Laser:
+    __slots__ = ("x", "y", "damage", "color", "width", "index")
+
+    def __init__(self, x: float, y: float, damage: int, color: str, width: int):
+        self.index = -1
+        self.x = x
+        self.y = y
+        self.damage = damage
+        self.color = color
+        self.width = width
+
+
+class PowerUp:
+    TYPES = ['shield', 'rapid', 'triple', 'life', 'bomb']
+    COLORS = {
+        'shield': '#00FF88',
+        'rapid': '#FF00FF',
+        'triple': '#FFD700',
+        'life': '#FF6B6B',
+        'bomb': '#FF4500'
+    }
+
+    __slots__ = ("x", "y", "type", "speed", "angle", "index")
+
+    def __init__(self, x: float, y: float, kind: str):
+        self.index = -1
+        self.x = x
+        self.y = y
+        self.type = kind
+        self.speed = POWERUP_FALL_SPEED
+        self.angle = 0.0
+
+    @property
+    def color(self) -> str:
+        return self.COLORS[self.type]
+
+    def update(self, floor_level: float, dt: float) -> bool:
+        self.y -= self.speed * dt
+        self.angle += POWERUP_SPIN * dt
+        return self.y > floor_level - 30
+
+
+class Boss:
+    __slots__ = ("x", "y", "health", "max_health", "direction", "speed",
+                 "shoot_timer", "active", "flash")
+
+    def __init__(self, y: float, health: int):
+        self.x = 0.0
+        self.y = y
+        self.health = health
+        self.max_health = self.health
+        self.direction = 1
+        self.speed = BOSS_SPEED
+        self.shoot_timer = 0.0
+        self.active = True
+        self.flash = False
+
+    def update(self, left: float, right: float, dt: float):
+        if not self.active:
+            return
+        self.flash = False
+        new_x = self.x + self.speed * dt * self.direction
+        if new_x > right - 80 or new_x < left + 80:
+            self.direction *= -1
+        self.x = new_x
+
+    def hit(self, damage: int = 1) -> bool:
+        self.health -= damage
+        self.flash = True
+        if self.health <= 0:
+            self.active = False
+            return True
+        return False
+
+    def should_shoot(self, rng: random.Random, dt: float) -> bool:
+        self.shoot_timer += dt
+        if self.shoot_timer >= BOSS_SHOOT_INTERVAL - TIMER_EPSILON:
+            self.shoot_timer = 0.0
+            return rng.random() < 0.6
+        return False
+
+
+# ---------------------- Formation ----------------------
+
+class AlienFormation:
+    """Déplacement de la formation et index des cases occupées.
+
+    Les aliens naissent sur une grille régulière et se déplacent tous
+    ensemble : la position d'un alien est toujours celle de sa case plus le
+    décalage courant ``(offset_x, offset_y)``. Déplacer la formation ne
+    touche donc qu'un décalage, quel que soit le nombre d'aliens.
+
+    ``cells[row][col]`` donne l'alien vivant de chaque case, ce qui permet
+    de retrouver en O(1) les aliens proches d'un point. Le nombre d'aliens
+    vivants par colonne et par rangée délimite la boîte englobante
+    (``min_col``, ``max_col``, ``max_row``), tenue à jour à chaque mort pour
+    tester les bords et le sol en temps constant. ``front[col]`` est l'alien
+    vivant le plus bas de chaque colonne (``None`` si elle est vide).
+    """
+
+    def __init__(self):
+        self.direction = 1
+        self.reset(0.0, 0.0, 0, 0)
+
+    def reset(self, start_x: float, start_y: float, rows: int, cols: int) -> list:
+        """Remplit une nouvelle grille posée en ``(start_x, start_y)`` et
+        renvoie ses aliens, rangée par rangée."""
+        self.start_x = start_x
+        self.start_y = start_y
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.cells = [[Alien(self, row, col) for col in range(cols)] for row in range(rows)]
+        self.front = list(self.cells[-1]) if rows else []
+        self.col_counts = [rows] * cols
+        self.row_counts = [cols] * rows
+        self.alive = rows * cols
+        self.min_col = 0
+        self.max_col = cols - 1
+        self.max_row = rows - 1
+        return [alien for line in self.cells for alien in line]
+
+    def remove(self, alien: Alien):
+        if self.cells[alien.row][alien.col] is not alien:
+            return
+        self.cells[alien.row][alien.col] = None
+        self.alive -= 1
+        self.col_counts[alien.col] -= 1
+        self.row_counts[alien.row] -= 1
+        if self.front[alien.col] is alien:
+            self.front[alien.col] = next((self.cells[row][alien.col] for row in range(alien.row - 1, -1, -1)
+                                          if self.cells[row][alien.col] is not None), None)
+        if not self.alive:
+            return
+        while not self.col_counts[self.min_col]:
+            self.min_col += 1
+        while not self.col_counts[self.max_col]:
+            self.max_col -= 1
+        while not self.row_counts[self.max_row]:
+            self.max_row -= 1
+
+    def clear(self):
+        """La vague disparaît d'un coup (elle a touché le sol)."""
+        self.reset(self.start_x, self.start_y, 0, 0)
+
+    def left_x(self) -> float:
+        return self.start_x + self.min_col * FORMATION_SPACING_X + self.offset_x
+
+    def right_x(self) -> float:
+        return self.start_x + self.max_col * FORMATION_SPACING_X + self.offset_x
+
+    def bottom_y(self) -> float:
+        return self.start_y - self.max_row * FORMATION_SPACING_Y + self.offset_y
+
+    def candidates(self, x: float, y: float, radius: float):
+        """Aliens vivants dont la case est à moins de ``radius`` de (x, y).
+
+        Avec l'espacement actuel il n'y a qu'une case candidate, et l'ordre
+        des aliens ne change donc pas le résultat ; une marge d'un pixel
+        absorbe l'écart d'arrondi entre le décalage et les positions.
+        """
+        cells = self.cells
+        if not cells:
+            return
+        reach = radius + 1
+        dx = x - self.start_x - self.offset_x
+        dy = self.start_y + self.offset_y - y
+        col_lo = max(0, math.ceil((dx - reach) / FORMATION_SPACING_X))
+        col_hi = min(len(cells[0]) - 1, math.floor((dx + reach) / FORMATION_SPACING_X))
+        row_lo = max(0, math.ceil((dy - reach) / FORMATION_SPACING_Y))
+        row_hi = min(len(cells) - 1, math.floor((dy + reach) / FORMATION_SPACING_Y))
+        for row in range(row_lo, row_hi + 1):
+            line = cells[row]
+            for col in range(col_lo, col_hi + 1):
+                alien = line[col]
+                if alien is not None:
+                    yield alien
+
+    def update(self, game: Game):
+        if (game.boss and game.boss.active) or not self.alive:
+            return
+
+        tuning = game.tuning
+        self.offset_x += (tuning.alien_step * game.dt * self.direction
+                          * (1 + game.level * tuning.alien_speed_growth))
+        if self.right_x() > game.right - GUTTER or self.left_x() < game.left + GUTTER:
+            self.direction *= -1
+            self.offset_y -= ALIEN_DROP
+
+
+# ---------------------- Jeu ----------------------
+
+class Game:
+    """État complet d'une partie et règles appliquées tick par tick.
+
+    ``events`` liste ce qui s'est passé pendant le dernier ``step`` sous
+    forme de tuples : ``("sound", nom)``, ``("gameover",)``,
+    ``("level_up", niveau, boss_vaincu)``, ``("paused",)``, ``("resumed",)``
+    et ``("started",)``. Les explosions en cours sont dans ``particles``.
+
+    ``aliens``, ``lasers``, ``enemy_lasers`` et ``powerups`` sont des
+    ``EntityStore`` : un retrait se fait en O(1) mais change l'ordre.
+    """
+
+    def __init__(self, width: float, height: float, seed: int | None = None,
+                 collision_mode: str = "loop", tick_rate: float = DEFAULT_TICK_RATE,
+                 tuning: Tuning | None = None, fire_mode: str = "roll"):
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"Mode de collision inconnu: {collision_mode!r}")
+        if fire_mode not in FIRE_MODES:
+            raise ValueError(f"Mode de tir inconnu: {fire_mode!r}")
+        if collision_mode == "numpy" and np is None:
+            raise ValueError("Le mode de collision 'numpy' nécessite NumPy")
+        self.collision_mode = collision_mode
+        self.fire_mode = fire_mode
+        self.tuning = tuning if tuning is not None else Tuning()
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+
+        self.left = -width / 2
+        self.right = width / 2
+        self.top = height / 2
+        self.bottom = -height / 2
+        self.floor_level = self.bottom + 80
+
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Générateur séparé pour les effets visuels : les particules ne
+        # décalent jamais le tirage des règles du jeu.
+        self.fx_rng = random.Random(None if seed is None else seed + 1)
+
+        self.high_score = 0
+        self.state = "menu"
+        self.formation = AlienFormation()
+        self.particles = ParticleSystem()
+        self.events = []
+        self.tick = 0
+        self.time = 0.0
+        # Profileur optionnel (``FrameProfiler``) : chaque étape de ``step``
+        # lui signale sa fin, voir ``ENGINE_STAGES``.
+        self.profiler = None
+        self._reset()
+
+    def _reset(self):
+        self.score = 0
+        self.lives = MAX_LIVES
+        self.level = 1
+        self.combo = 0
+        self.combo_timer = 0.0
+
+        self.shield_active = False
+        self.shield_timer = 0.0
+        self.rapid_fire = False
+        self.rapid_timer = 0.0
+        self.triple_shot = False
+        self.triple_timer = 0.0
+
+        self.player_x = 0.0
+        self.player_y = self.floor_level
+        self.last_shot_time = -1.0
+
+        self.lasers = EntityStore()
+        self.enemy_lasers = EntityStore()
+        self.aliens = EntityStore()
+        self.particles.clear()
+        self.powerups = EntityStore()
+        self.boss = None
+        self.next_alien_shot = None
+        self.alien_fire_rate = 0.0
+
+    # ------------------ Cycle de partie ------------------
+
+    def start(self):
+        """Démarre (ou redémarre) une partie au niveau 1."""
+        self._reset()
+        self.state = "playing"
+        self.events.append(("started",))
+        self.spawn_wave()
+
+    def spawn_wave(self):
+        self.aliens = EntityStore()
+        self.boss = None
+        self.next_alien_shot = None
+
+        if self.level % 5 == 0:
+            tuning = self.tuning
+            self.boss = Boss(self.top - 150, tuning.boss_base_health + self.level * tuning.boss_health_per_level)
+            self.formation.reset(0.0, 0.0, 0, 0)
+            return
+
+        rows = min(3 + self.level // 2, 6)
+        cols = min(6 + self.level // 3, 9)
+        start_x = self.left + FORMATION_MARGIN_X
+        start_y = self.top - FORMATION_MARGIN_Y
+
+        self.aliens = EntityStore(self.formation.reset(start_x, start_y, rows, cols))
+
+    def step(self, inputs: Inputs = NO_INPUT):
+        """Avance la simulation d'un tick."""
+        self.events = []
+        self.tick += 1
+        self.time += self.dt
+
+        if inputs.restart and self.state == "gameover":
+            self.start()
+        if inputs.pause:
+            self.toggle_pause()
+
+        if self.state == "menu":
+            if inputs.shoot:
+                self.start()
+            return
+
+        if self.state == "paused":
+            return
+
+        lap = self.profiler.lap if self.profiler is not None else _no_lap
+
+        if self.state == "gameover":
+            self.animate_explosions()
+            lap("explosions")
+            return
+
+        self.apply_inputs(inputs)
+        lap("inputs")
+
+        self.move_lasers()
+        lap("move_lasers")
+        self.animate_explosions()
+        lap("explosions")
+
+        self.formation.update(self)
+        lap("formation")
+        if self.boss:
+            self.boss.update(self.left, self.right, self.dt)
+            lap("boss")
+
+        self.alien_shoot()
+        lap("alien_shoot")
+
+        for powerup in self.powerups.backwards():
+            if not powerup.update(self.floor_level, self.dt):
+                self.powerups.remove(powerup)
+
+        self.update_powerup_timers()
+
+        if self.combo_timer > TIMER_EPSILON:
+            self.combo_timer -= self.dt
+        else:
+            self.combo = 0
+        lap("update_powerups")
+
+        if self.check_collisions() == "gameover":
+            self.state = "gameover"
+            self.events.append(("gameover",))
+            self.events.append(("sound", "game_over"))
+        lap("collisions")
+
+        if not self.aliens and (not self.boss or not self.boss.active) and self.state == "playing":
+            boss_defeated = self.boss is not None
+            self.level += 1
+            self.events.append(("sound", "level_up"))
+            self.events.append(("level_up", self.level, boss_defeated))
+            self.spawn_wave()
+            lap("spawn_wave")
+
+    def toggle_pause(self):
+        if self.state == "playing":
+            self.state = "paused"
+            self.events.append(("paused",))
+        elif self.state == "paused":
+            self.state = "playing"
+            self.events.append(("resumed",))
+
+    # ------------------ Joueur ------------------
+
+    def apply_inputs(self, inputs: Inputs):
+        step = -1 if inputs.move < 0 else 1
+        for _ in range(abs(inputs.move)):
+            new_x = self.player_x + step * PLAYER_SPEED
+            if self.left + GUTTER < new_x < self.right - GUTTER:
+                self.player_x = new_x
+        if inputs.steer:
+            new_x = self.player_x + inputs.steer * PLAYER_STEER_SPEED * self.dt
+            self.player_x = min(max(new_x, self.left + GUTTER), self.right - GUTTER)
+
+        if inputs.shoot:
+            self.shoot_laser()
+        if inputs.atomic:
+            self.atomic_explosion()
+
+    def shoot_laser(self):
+        cooldown = RAPID_SHOT_COOLDOWN if self.rapid_fire else SHOT_COOLDOWN
+        if self.time - self.last_shot_time < cooldown - TIMER_EPSILON:
+            return
+
+        self.last_shot_time = self.time
+        self.events.append(("sound", "laser"))
+
+        positions = [0]
+        if self.triple_shot:
+            positions = [-18, 0, 18]
+
+        color = COLOR_LASER_POWERED if self.rapid_fire else COLOR_LASER
+        width = 5 if self.rapid_fire else 4
+        damage = 2 if self.rapid_fire else 1
+        for offset in positions:
+            self.lasers.append(Laser(self.player_x + offset, self.player_y + 15,
+                                     damage, color, width))
+
+    def atomic_explosion(self):
+        """Tire des lasers sur toute la largeur."""
+        cursor = self.left + 20
+        step = 25
+        while cursor < self.right - 20:
+            self.lasers.append(Laser(cursor, self.floor_level + 15, 1, COLOR_LASER_POWERED, 3))
+            cursor += step
+        self.events.append(("sound", "laser"))
+
+    # ------------------ Power-ups ------------------
+
+    def apply_powerup(self, powerup_type: str):
+        self.events.append(("sound", "powerup"))
+
+        if powerup_type == 'shield':
+            self.shield_active = True
+            self.shield_timer = SHIELD_DURATION
+        elif powerup_type == 'rapid':
+            self.rapid_fire = True
+            self.rapid_timer = RAPID_DURATION
+        elif powerup_type == 'triple':
+            self.triple_shot = True
+            self.triple_timer = TRIPLE_DURATION
+        elif powerup_type == 'life':
+            self.lives = min(self.lives + 1, MAX_LIVES)
+        elif powerup_type == 'bomb':
+            self.atomic_explosion()
+
+    def update_powerup_timers(self):
+        dt = self.dt
+        if self.shield_active:
+            self.shield_timer -= dt
+            if self.shield_timer <= TIMER_EPSILON:
+                self.shield_active = False
+
+        if self.rapid_fire:
+            self.rapid_timer -= dt
+            if self.rapid_timer <= TIMER_EPSILON:
+                self.rapid_fire = False
+
+        if self.triple_shot:
+            self.triple_timer -= dt
+            if self.triple_timer <= TIMER_EPSILON:
+                self.triple_shot = False
+
+    # ------------------ Aliens ------------------
+
+    def remove_alien(self, alien: Alien):
+        self.create_explosion(alien.x, alien.y, alien.color)
+        self.events.append(("sound", "explosion"))
+        self.aliens.remove(alien)
+        self.formation.remove(alien)
+
+        if self.rng.random() < self.tuning.powerup_drop_chance:
+            self.powerups.append(PowerUp(alien.x, alien.y, self.rng.choice(PowerUp.TYPES)))
+
+    def alien_shoot(self):
+        rng = self.rng
+        if self.fire_mode == "scheduled":
+            self.scheduled_alien_shots()
+        else:
+            tuning = self.tuning
+            chance = tuning.alien_shoot_rate * self.dt * (1 + self.level * tuning.alien_shoot_growth)
+            for alien in self.aliens:
+                if rng.random() < chance:
+                    self.enemy_lasers.append(Laser(alien.x, alien.y - 15, 1, COLOR_ENEMY_LASER, 3))
+
+        boss = self.boss
+        if boss and boss.active and boss.should_shoot(rng, self.dt):
+            for offset in [-25, 0, 25]:
+                self.enemy_lasers.append(Laser(boss.x + offset, boss.y - 40, 1, COLOR_ENEMY_LASER, 4))
+
+    def scheduled_alien_shots(self):
+        """Tirs de la formation à la même cadence totale que ``roll``, mais
+        tirés par un alien du premier rang et planifiés à l'avance.
+
+        L'écart entre deux tirs suit une loi exponentielle : un seul tirage
+        par tir au lieu d'un par alien et par tick. Quand la cadence change
+        (un alien meurt), le temps restant est simplement mis à l'échelle,
+        ce que permet l'absence de mémoire de la loi.
+        """
+        tuning = self.tuning
+        rate = self.formation.alive * tuning.alien_shoot_rate * (1 + self.level * tuning.alien_shoot_growth)
+        if rate <= 0:
+            self.next_alien_shot = None
+            return
+        rng = self.rng
+        if self.next_alien_shot is None:
+            self.next_alien_shot = self.time + rng.expovariate(rate)
+        elif rate != self.alien_fire_rate:
+            self.next_alien_shot = self.time + (self.next_alien_shot - self.time) * self.alien_fire_rate / rate
+        self.alien_fire_rate = rate
+
+        while self.next_alien_shot <= self.time:
+            alien = rng.choice([alien for alien in self.formation.front if alien is not None])
+            self.enemy_lasers.append(Laser(alien.x, alien.y - 15, 1, COLOR_ENEMY_LASER, 3))
+            self.next_alien_shot += rng.expovariate(rate)
+
+    # ------------------ Lasers ------------------
+
+    def move_lasers(self):
+        lasers = self.lasers
+        rise = LASER_SPEED * self.dt
+        top = self.top
+        for laser in lasers.backwards():
+            laser.y += rise
+            if laser.y > top:
+                lasers.remove(laser)
+
+        enemy_lasers = self.enemy_lasers
+        fall = ENEMY_LASER_SPEED * self.dt
+        bottom = self.floor_level - 20
+        for laser in enemy_lasers.backwards():
+            laser.y -= fall
+            if laser.y < bottom:
+                enemy_lasers.remove(laser)
+
+    # ------------------ Explosions ------------------
+
+    def create_explosion(self, x: float, y: float, color: str, count: int = 12):
+        """Crée une explosion avec des particules."""
+        self.particles.emit(x, y, color, count, self.fx_rng)
+
+    def animate_explosions(self):
+        self.particles.step(self.dt)
+
+    # ------------------ Collisions ------------------
+
+    def check_collisions(self):
+        player_x = self.player_x
+        player_y = self.player_y
+
+        # Lasers joueur vs boss
+        boss = self.boss
+        if boss and boss.active:
+            for laser in self.lasers.backwards():
+                if _distance(laser.x, laser.y, boss.x, boss.y) < HIT_RADIUS_BOSS:
+                    self.lasers.remove(laser)
+                    self.events.append(("sound", "boss_hit"))
+                    if boss.hit(laser.damage):
+                        self.create_explosion(boss.x, boss.y, COLOR_BOSS, 25)
+                        self.score += 500 * self.level
+                    else:
+                        self.create_explosion(laser.x, laser.y, COLOR_BOSS, 5)
+
+        # Lasers joueur vs aliens
+        self.resolve_alien_hits()
+
+        # Lasers ennemis vs joueur
+        for laser in self.enemy_lasers.backwards():
+            if _distance(laser.x, laser.y, player_x, player_y) < HIT_RADIUS_PLAYER:
+                self.enemy_lasers.remove(laser)
+
+                if self.shield_active:
+                    self.events.append(("sound", "shield"))
+                    self.create_explosion(player_x, player_y, COLOR_PLAYER_SHIELD, 8)
+                else:
+                    self.lives -= 1
+                    self.create_explosion(player_x, player_y, COLOR_PLAYER, 15)
+                    if self.lives <= 0:
+                        return "gameover"
+
+        # Power-ups vs joueur
+        for powerup in self.powerups.backwards():
+            if _distance(powerup.x, powerup.y, player_x, player_y) < HIT_RADIUS_POWERUP:
+                self.powerups.remove(powerup)
+                self.apply_powerup(powerup.type)
+
+        # Aliens touchent le sol
+        formation = self.formation
+        if formation.alive and formation.bottom_y() < self.floor_level + 25:
+            if not self.shield_active:
+                self.lives -= 1
+            self.aliens.clear()
+            formation.clear()
+            if self.lives <= 0:
+                return "gameover"
+            self.spawn_wave()
+
+        if self.score > self.high_score:
+            self.high_score = self.score
+
+        return None
+
+    def resolve_alien_hits(self):
+        """Chaque laser, du dernier au premier, touche au plus le premier
+        alien à portée."""
+        if self.collision_mode == "numpy":
+            self._resolve_alien_hits_numpy()
+            return
+        if self.collision_mode == "grid":
+            self._resolve_alien_hits_grid()
+            return
+
+        offset_x = self.formation.offset_x
+        offset_y = self.formation.offset_y
+        for laser in self.lasers.backwards():
+            for alien in self.aliens:
+                if _distance(laser.x, laser.y, alien.slot_x + offset_x,
+                             alien.slot_y + offset_y) < HIT_RADIUS_ALIEN:
+                    self.lasers.remove(laser)
+                    self.hit_alien(alien, laser.damage)
+                    break
+
+    def _resolve_alien_hits_grid(self):
+        """Même résolution que la boucle, en ne testant que la case du laser."""
+        formation = self.formation
+        for laser in self.lasers.backwards():
+            for alien in formation.candidates(laser.x, laser.y, HIT_RADIUS_ALIEN):
+                if _distance(laser.x, laser.y, alien.x, alien.y) < HIT_RADIUS_ALIEN:
+                    self.lasers.remove(laser)
+                    self.hit_alien(alien, laser.damage)
+                    break
+
+    def _resolve_alien_hits_numpy(self):
+        """Même résolution que la boucle, avec une seule matrice de distances.
+
+        Les positions ne bougent pas pendant la résolution : seules les
+        morts changent d'un laser à l'autre. On calcule donc toutes les
+        paires d'un coup, puis on rejoue les lasers touchants dans l'ordre
+        en sautant les aliens déjà détruits.
+        """
+        lasers = self.lasers.items
+        aliens = self.aliens.items[:]
+        if not lasers or not aliens:
+            return
+
+        laser_pos = np.array([(laser.x, laser.y) for laser in lasers])
+        formation = self.formation
+        alien_pos = np.array([(alien.slot_x, alien.slot_y) for alien in aliens])
+        alien_pos += (formation.offset_x, formation.offset_y)
+        delta = laser_pos[:, None, :] - alien_pos[None, :, :]
+        in_range = np.hypot(delta[..., 0], delta[..., 1]) < HIT_RADIUS_ALIEN
+
+        hitting = np.flatnonzero(in_range.any(axis=1))
+        if not len(hitting):
+            return
+
+        # Lasers dans l'ordre de la boucle : du dernier au premier. Retirer
+        # le laser i ne déplace qu'un laser d'indice supérieur, déjà traité.
+        dead = set()
+        for i in reversed(hitting.tolist()):
+            for j in np.flatnonzero(in_range[i]).tolist():
+                if j in dead:
+                    continue
+                alien = aliens[j]
+                laser = lasers[i]
+                self.lasers.remove(laser)
+                self.hit_alien(alien, laser.damage)
+                if alien.health <= 0:
+                    dead.add(j)
+                break
+
+    def hit_alien(self, alien: Alien, damage: int):
+        alien.health -= damage
+        if alien.health <= 0:
+            self.combo += 1
+            self.combo_timer = COMBO_WINDOW
+            self.score += alien.points * self.combo
+            self.remove_alien(alien)
+
+
+def _no_lap(stage: str):
+    pass
+
+
+def _distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    return math.hypot(x1 - x2, y1 - y2)
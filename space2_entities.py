@@ -0,0 +1,77 @@
+"""Ensembles d'entités vivantes du moteur de Space Invaders 2.0.
+
+Les aliens, lasers, lasers ennemis et power-ups d'une partie sont des
+enregistrements à ``__slots__`` rangés sans trou dans la liste ``items``
+d'un ``EntityStore``. Chaque entité retient sa case (``index``) : la
+retirer y déplace la dernière entité, en temps constant, au lieu du
+``list.remove`` linéaire.
+
+L'entité elle-même sert de poignée stable : les front ends l'utilisent
+comme clé de leurs sprites, et elle reste valable quand les autres sont
+retirées. ``entity in store`` vérifie en O(1) qu'elle est encore vivante.
+
+Pour retirer des entités en cours de parcours, sans copier la liste, on
+parcourt à rebours (``backwards``) : la case libérée reçoit une entité
+déjà vue.
+"""
+
+from __future__ import annotations
+
+
+class EntityStore:
+    """Entités vivantes d'un type ; l'ordre de ``items`` n'est pas garanti
+    après un retrait."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, entities=()):
+        self.items = []
+        for entity in entities:
+            self.add(entity)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __contains__(self, entity) -> bool:
+        index = entity.index
+        return 0 <= index < len(self.items) and self.items[index] is entity
+
+    def add(self, entity):
+        entity.index = len(self.items)
+        self.items.append(entity)
+        return entity
+
+    append = add
+
+    def remove(self, entity):
+        """Retire ``entity`` en O(1) ; la dernière entité prend sa case.
+
+        Une entité déjà retirée (``index`` à -1) lève ``ValueError`` : un
+        indice négatif désignerait sinon silencieusement une autre case.
+        """
+        items = self.items
+        index = entity.index
+        if index < 0 or index >= len(items) or items[index] is not entity:
+            raise ValueError("Entité absente de l'ensemble")
+        last = items.pop()
+        if last is not entity:
+            items[index] = last
+            last.index = index
+        entity.index = -1
+
+    def clear(self):
+        for entity in self.items:
+            entity.index = -1
+        self.items.clear()
+
+    def backwards(self):
+        """De la dernière entité à la première : l'entité courante peut être
+        retirée pendant le parcours (l'itérateur inverse de ``list`` relit la
+        case suivante à chaque pas et s'arrête si la liste a raccourci)."""
+        return reversed(self.items)
@@ -0,0 +1,372 @@
+"""Environnement d'apprentissage pour Space Invaders 2.0 (API de type Gym).
+
+``Env`` enveloppe le moteur sans fenêtre : ``reset()`` renvoie
+``(observation, info)`` et ``step(action)`` renvoie ``(observation,
+récompense, terminé, tronqué, info)``. L'observation est un dictionnaire
+de tableaux NumPy de taille fixe (voir ``OBSERVATION_SHAPES``) : joueur,
+aliens, lasers, lasers ennemis, power-ups et boss, positions ramenées
+entre -1 et 1. L'action est un indice de ``ACTIONS`` (gauche/droite,
+tir, bombe atomique). La récompense est le score gagné pendant le pas.
+
+``VectorEnv`` fait avancer N parties indépendantes à chaque appel,
+réparties sur un groupe de processus. Les observations passent par de la
+mémoire partagée : seules les actions et les fins de partie transitent
+par les tubes.
+
+    python3 space2_env.py --envs 64 --workers 8    # pas par seconde
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel pour le jeu, pas pour l'environnement
+    np = None
+
+from space2_engine import MAX_LIVES, Game, Inputs, PowerUp
+
+# Terrain par défaut, celui d'un écran 1500x890 à 80 % x 90 %
+DEFAULT_SIZE = (1200, 800)
+
+# Une action par combinaison déplacement x tir x bombe atomique. Le
+# déplacement est celui d'une touche tenue (``steer``) : l'agent ne va pas
+# plus vite qu'un joueur.
+ACTIONS = tuple(Inputs(shoot=shoot, atomic=atomic, steer=steer)
+                for steer in (0, -1, 1) for shoot in (False, True) for atomic in (False, True))
+ACTION_NAMES = tuple(
+    "+".join(name for name, on in (("gauche", inputs.steer < 0), ("droite", inputs.steer > 0),
+                                   ("tir", inputs.shoot), ("atomique", inputs.atomic)) if on) or "rien"
+    for inputs in ACTIONS)
+
+# Entités au-delà de ces nombres ignorées ; la plus grande formation compte 6x9 aliens
+MAX_ALIENS = 54
+MAX_LASERS = 64
+MAX_ENEMY_LASERS = 32
+MAX_POWERUPS = 8
+
+# La dernière colonne des entités vaut 1 pour une ligne occupée, 0 pour le remplissage
+OBSERVATION_SHAPES = {
+    # x, vies, bouclier, tir rapide, tir triple (secondes restantes), niveau
+    "player": (6,),
+    # x, y, points de vie, présent
+    "aliens": (MAX_ALIENS, 4),
+    # x, y, présent
+    "lasers": (MAX_LASERS, 3),
+    "enemy_lasers": (MAX_ENEMY_LASERS, 3),
+    # x, y, type (indice dans PowerUp.TYPES), présent
+    "powerups": (MAX_POWERUPS, 4),
+    # x, y, vie restante (fraction), présent
+    "boss": (4,),
+}
+
+# Colonnes des tableaux de ``VectorEnv`` en plus des observations
+_STEP_RESULTS = {"reward": "float32", "terminated": "bool", "truncated": "bool"}
+
+
+def allocate_observation(batch: tuple = ()) -> dict:
+    return {name: np.zeros(batch + shape, dtype=np.float32) for name, shape in OBSERVATION_SHAPES.items()}
+
+
+class Env:
+    """Une partie pilotée pas à pas.
+
+    ``frame_skip`` répète chaque action sur autant de ticks ; ``max_steps``
+    tronque la partie après ce nombre de pas (0 : jamais). Chaque perte de
+    vie retire ``life_penalty`` à la récompense.
+
+    Les tableaux de l'observation sont réutilisés d'un pas à l'autre :
+    les copier pour les conserver. ``observation`` permet de fournir ces
+    tableaux (les vues d'un ``VectorEnv``, par exemple).
+    """
+
+    def __init__(self, width: float = DEFAULT_SIZE[0], height: float = DEFAULT_SIZE[1],
+                 seed: int | None = None, collision_mode: str = "grid", frame_skip: int = 1,
+                 max_steps: int = 0, life_penalty: float = 0.0, observation: dict | None = None):
+        if np is None:
+            raise ImportError("L'environnement nécessite NumPy")
+        self.width = width
+        self.height = height
+        self.collision_mode = collision_mode
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.life_penalty = life_penalty
+        self.action_count = len(ACTIONS)
+        self.observation = observation if observation is not None else allocate_observation()
+        # Vues à plat de chaque tableau et nombre de valeurs écrites au pas précédent :
+        # seules les lignes occupées sont écrites, seules celles libérées sont remises à zéro.
+        self._flat = {name: array.reshape(-1) for name, array in self.observation.items()}
+        self._used = {name: array.size for name, array in self.observation.items()}
+        self.seeds = random.Random(seed)
+        self.game = None
+        self.steps = 0
+
+    def reset(self, seed: int | None = None):
+        if seed is None:
+            seed = self.seeds.randrange(2 ** 32)
+        self.game = Game(self.width, self.height, seed=seed, collision_mode=self.collision_mode)
+        self.game.start()
+        self.steps = 0
+        self._observe()
+        return self.observation, {"seed": seed}
+
+    def step(self, action: int):
+        game = self.game
+        inputs = ACTIONS[action]
+        score, lives = game.score, game.lives
+        for _ in range(self.frame_skip):
+            game.step(inputs)
+            if game.state != "playing":
+                break
+        self.steps += 1
+        self._observe()
+
+        reward = game.score - score
+        if game.lives < lives:
+            reward -= self.life_penalty * (lives - game.lives)
+        terminated = game.state == "gameover"
+        truncated = not terminated and self.max_steps > 0 and self.steps >= self.max_steps
+        return self.observation, reward, terminated, truncated, {}
+
+    def episode_info(self) -> dict:
+        game = self.game
+        return {"score": game.score, "level": game.level, "steps": self.steps, "ticks": game.tick}
+
+    def _write(self, name: str, values: list):
+        flat = self._flat[name]
+        count = len(values)
+        if count:
+            flat[:count] = values
+        if self._used[name] > count:
+            flat[count:self._used[name]] = 0
+        self._used[name] = count
+
+    def _observe(self):
+        game = self.game
+        write = self._write
+        sx = 1 / game.right
+        sy = 1 / game.top
+
+        write("player", [game.player_x * sx, game.lives / MAX_LIVES, game.shield_timer,
+                         game.rapid_timer, game.triple_timer, game.level])
+        # Position d'un alien : sa case plus le décalage commun de la formation
+        ox = game.formation.offset_x
+        oy = game.formation.offset_y
+        write("aliens", [value for alien in game.aliens[:MAX_ALIENS]
+                         for value in ((alien.slot_x + ox) * sx, (alien.slot_y + oy) * sy, alien.health, 1.0)])
+        write("lasers", [value for laser in game.lasers[:MAX_LASERS]
+                         for value in (laser.x * sx, laser.y * sy, 1.0)])
+        write("enemy_lasers", [value for laser in game.enemy_lasers[:MAX_ENEMY_LASERS]
+                               for value in (laser.x * sx, laser.y * sy, 1.0)])
+        types = PowerUp.TYPES
+        write("powerups", [value for powerup in game.powerups[:MAX_POWERUPS]
+                           for value in (powerup.x * sx, powerup.y * sy, types.index(powerup.type), 1.0)])
+        boss = game.boss
+        if boss and boss.active:
+            write("boss", [boss.x * sx, boss.y * sy, boss.health / boss.max_health, 1.0])
+        else:
+            write("boss", [])
+
+
+# ---------------------- Parties en parallèle ----------------------
+
+def _attach(names: dict, count: int) -> tuple:
+    """Tableaux ``(count, ...)`` posés sur les segments de mémoire partagée ``names``."""
+    segments = {}
+    arrays = {}
+    for name, (segment_name, shape, dtype) in names.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        segments[name] = segment
+        arrays[name] = np.ndarray((count,) + shape, dtype=dtype, buffer=segment.buf)
+    return segments, arrays
+
+
+def _run_envs(envs: list, arrays: dict, start: int, actions) -> dict:
+    """Un pas de chaque partie ; les parties finies repartent aussitôt."""
+    finished = {}
+    reward = arrays["reward"]
+    terminated = arrays["terminated"]
+    truncated = arrays["truncated"]
+    for offset, (env, action) in enumerate(zip(envs, actions)):
+        index = start + offset
+        _, reward[index], terminated[index], truncated[index], _ = env.step(action)
+        if terminated[index] or truncated[index]:
+            finished[index] = env.episode_info()
+            env.reset()
+    return finished
+
+
+def _worker(conn, names: dict, count: int, start: int, seeds: list, env_kwargs: dict):
+    segments, arrays = _attach(names, count)
+    try:
+        envs = []
+        for offset, seed in enumerate(seeds):
+            observation = {name: arrays[name][start + offset] for name in OBSERVATION_SHAPES}
+            envs.append(Env(seed=seed, observation=observation, **env_kwargs))
+        while True:
+            command, data = conn.recv()
+            if command == "step":
+                conn.send(_run_envs(envs, arrays, start, data))
+            elif command == "reset":
+                for env in envs:
+                    env.reset()
+                conn.send(None)
+            else:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del arrays
+        for segment in segments.values():
+            segment.close()
+        conn.close()
+
+
+class VectorEnv:
+    """``num_envs`` parties indépendantes avancées d'un pas par appel.
+
+    Les parties sont réparties en blocs contigus sur ``workers`` processus
+    (par défaut un par cœur ; 0 les fait tourner dans le processus
+    courant). ``step(actions)`` renvoie ``(observations, récompenses,
+    terminés, tronqués, infos)`` : des tableaux de première dimension
+    ``num_envs``, réutilisés d'un appel à l'autre, et ``{indice: bilan}``
+    pour les parties terminées pendant ce pas, aussitôt relancées.
+    """
+
+    def __init__(self, num_envs: int, workers: int | None = None, seed: int = 0, **env_kwargs):
+        if np is None:
+            raise ImportError("L'environnement nécessite NumPy")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, num_envs)
+        self.num_envs = num_envs
+        self.action_count = len(ACTIONS)
+        seeds = [seed + i for i in range(num_envs)]
+
+        layout = {name: (shape, "float32") for name, shape in OBSERVATION_SHAPES.items()}
+        layout.update({name: ((), dtype) for name, dtype in _STEP_RESULTS.items()})
+        self._segments = {}
+        names = {}
+        arrays = {}
+        for name, (shape, dtype) in layout.items():
+            size = max(1, num_envs * int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize)
+            segment = shared_memory.SharedMemory(create=True, size=size)
+            self._segments[name] = segment
+            names[name] = (segment.name, shape, dtype)
+            arrays[name] = np.ndarray((num_envs,) + shape, dtype=dtype, buffer=segment.buf)
+            arrays[name][:] = 0
+        self.observations = {name: arrays[name] for name in OBSERVATION_SHAPES}
+        self._arrays = arrays
+
+        self._envs = []
+        self._pipes = []
+        self._processes = []
+        self._slices = []
+        if workers <= 0:
+            for index, env_seed in enumerate(seeds):
+                observation = {name: arrays[name][index] for name in OBSERVATION_SHAPES}
+                self._envs.append(Env(seed=env_seed, observation=observation, **env_kwargs))
+            self._slices.append((0, num_envs))
+            return
+
+        context = multiprocessing.get_context()
+        bounds = [round(i * num_envs / workers) for i in range(workers + 1)]
+        for start, stop in zip(bounds, bounds[1:]):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, daemon=True,
+                                      args=(child, names, num_envs, start, seeds[start:stop], env_kwargs))
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+            self._slices.append((start, stop))
+
+    def reset(self):
+        if self._envs:
+            for env in self._envs:
+                env.reset()
+        else:
+            for pipe in self._pipes:
+                pipe.send(("reset", None))
+            for pipe in self._pipes:
+                pipe.recv()
+        return self.observations, {}
+
+    def step(self, actions):
+        """``actions`` : un indice de ``ACTIONS`` par partie."""
+        actions = np.asarray(actions).tolist()
+        if self._envs:
+            infos = _run_envs(self._envs, self._arrays, 0, actions)
+        else:
+            for pipe, (start, stop) in zip(self._pipes, self._slices):
+                pipe.send(("step", actions[start:stop]))
+            infos = {}
+            for pipe in self._pipes:
+                infos.update(pipe.recv())
+        arrays = self._arrays
+        return self.observations, arrays["reward"], arrays["terminated"], arrays["truncated"], infos
+
+    def close(self):
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for pipe in self._pipes:
+            pipe.close()
+        self._pipes = []
+        self._processes = []
+        self.observations = {}
+        self._arrays = {}
+        for segment in self._segments.values():
+            segment.close()
+            segment.unlink()
+        self._segments = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Débit de l'environnement vectorisé")
+    parser.add_argument("--envs", type=int, default=64, help="nombre de parties")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processus (un par cœur par défaut, 0 : sans processus)")
+    parser.add_argument("--steps", type=int, default=1000, help="pas par partie")
+    parser.add_argument("--frame-skip", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Politique aléatoire sans bombe atomique : tirée au hasard, elle noie le moteur sous les lasers
+    rng = np.random.default_rng(args.seed)
+    actions = np.array([index for index, inputs in enumerate(ACTIONS) if not inputs.atomic])
+    with VectorEnv(args.envs, args.workers, args.seed, frame_skip=args.frame_skip) as env:
+        env.reset()
+        episodes = []
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            _, _, _, _, infos = env.step(rng.choice(actions, args.envs))
+            episodes.extend(infos.values())
+        elapsed = time.perf_counter() - start
+
+    steps = args.envs * args.steps
+    print(f"{steps} pas en {elapsed:.2f} s : {steps / elapsed:.0f} pas/s, "
+          f"{steps * args.frame_skip / elapsed:.0f} ticks/s")
+    if episodes:
+        scores = [episode["score"] for episode in episodes]
+        print(f"{len(episodes)} parties terminées, score moyen {sum(scores) / len(scores):.0f}")
+
+
+if __name__ == "__main__":
+    main()
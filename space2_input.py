@@ -0,0 +1,128 @@
+"""État du clavier et latence des entrées de Space Invaders 2.0.
+
+Les événements du clavier ne font que tenir à jour l'ensemble des touches
+enfoncées ; la boucle le lit une fois par tick (``poll``). Une touche
+tenue produit donc un déplacement continu et un tir répété au rythme du
+moteur, sans dépendre de la répétition automatique du système ni remplir
+la file d'événements de Tk.
+
+Sous X11, la répétition automatique envoie des paires relâchement/appui :
+un relâchement n'est appliqué qu'au ``poll`` suivant, et un nouvel appui
+arrivé entre-temps l'annule.
+
+``InputLatency`` mesure, pour chaque nouvel appui, le temps écoulé jusqu'à
+l'affichage de la première image qui en tient compte.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from space2_profiler import PERCENTILES, percentile
+
+LATENCY_WINDOW = 200
+
+
+class InputLatency:
+    """Latence appui -> image affichée des ``window`` derniers appuis.
+
+    Un appui passe par trois temps : ``pressed`` à son arrivée, ``consumed``
+    quand un tick le lit, ``presented`` quand l'image qui suit ce tick est
+    affichée. Si l'événement porte l'heure X (``event.time``, en ms), son
+    attente dans la file du système est estimée par rapport à l'attente la
+    plus courte observée, et ajoutée.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW, clock=time.perf_counter):
+        self.clock = clock
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self._waiting = []
+        self._in_flight = []
+        self._base_offset = None
+
+    def pressed(self, event_time: int | None = None):
+        now = self.clock()
+        if event_time is not None:
+            offset = now - event_time / 1000
+            if self._base_offset is None or offset < self._base_offset:
+                self._base_offset = offset
+            now -= offset - self._base_offset
+        self._waiting.append(now)
+
+    def consumed(self):
+        self._in_flight.extend(self._waiting)
+        self._waiting.clear()
+
+    def presented(self):
+        if not self._in_flight:
+            return
+        now = self.clock()
+        for stamp in self._in_flight:
+            self.samples.append(now - stamp)
+        self.count += len(self._in_flight)
+        self._in_flight.clear()
+
+    def summary(self) -> dict:
+        """``{"p50": ms, "p95": ms, "p99": ms, "max": ms}`` sur la fenêtre."""
+        values = sorted(self.samples)
+        stats = {f"p{p}": percentile(values, p) * 1000 for p in PERCENTILES}
+        stats["max"] = values[-1] * 1000 if values else 0.0
+        return stats
+
+    def format_line(self) -> str:
+        stats = self.summary()
+        return (f"{'latence entrée':<16}{stats['p50']:>7.1f}{stats['p95']:>7.1f}{stats['p99']:>7.1f}"
+                f"  max {stats['max']:.1f} ({self.count} appuis)")
+
+
+class KeyState:
+    """Touches enfoncées, traduites en actions par ``bindings`` (touche -> action).
+
+    ``poll()`` renvoie ``(tenues, appuyées)`` : les actions dont une touche
+    est enfoncée (ou l'a été depuis le dernier ``poll``, pour ne pas perdre
+    un appui bref) et celles qui ont reçu un nouvel appui.
+    """
+
+    def __init__(self, bindings: dict, latency: InputLatency | None = None):
+        self.bindings = bindings
+        self.latency = latency
+        self.down = set()
+        self._pressed = set()
+        self._released = set()
+
+    def press(self, key: str, event_time: int | None = None):
+        if key not in self.bindings:
+            return
+        if key in self._released:
+            # Paire relâchement/appui de la répétition automatique
+            self._released.discard(key)
+            return
+        if key in self.down:
+            return
+        self.down.add(key)
+        self._pressed.add(key)
+        if self.latency is not None:
+            self.latency.pressed(event_time)
+
+    def release(self, key: str):
+        if key in self.down:
+            self._released.add(key)
+
+    def poll(self) -> tuple:
+        bindings = self.bindings
+        held = {bindings[key] for key in self.down}
+        pressed = {bindings[key] for key in self._pressed}
+        self.down -= self._released
+        self._released.clear()
+        self._pressed.clear()
+        if self.latency is not None:
+            self.latency.consumed()
+        return held, pressed
+
+    def clear(self):
+        """Oublie les touches enfoncées (perte du focus, par exemple)."""
+        self.down.clear()
+        self._pressed.clear()
+        self._released.clear()
@@ -0,0 +1,78 @@
+"""Boucle à pas de temps fixe pour Space Invaders 2.0.
+
+La simulation avance toujours par ticks de même durée, quel que soit le
+temps pris par le rendu : une image lente est rattrapée par plusieurs
+ticks (dans la limite de ``max_catch_up``), une image rapide n'en exécute
+aucun. Au-delà de la limite, les ticks en retard sont abandonnés et
+comptés plutôt que de faire boule de neige.
+"""
+
+from __future__ import annotations
+
+import time
+
+
+class FixedTimestepLoop:
+    def __init__(self, tick_rate: float = 60, max_catch_up: int = 5, clock=time.perf_counter):
+        self.dt = 1 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+
+        self.ticks = 0
+        self.frames = 0
+        self.dropped_ticks = 0
+        # Fréquences mesurées sur la dernière fenêtre d'une seconde
+        self.tick_rate = 0.0
+        self.render_rate = 0.0
+
+        self._accumulator = 0.0
+        self._last = clock()
+        self._window_start = self._last
+        self._window_ticks = 0
+        self._window_frames = 0
+
+    def reset(self):
+        """Oublie le temps écoulé, par exemple après une pause volontaire."""
+        self._last = self.clock()
+        self._accumulator = 0.0
+
+    def advance(self) -> int:
+        """Nombre de ticks à exécuter maintenant."""
+        now = self.clock()
+        self._accumulator += now - self._last
+        self._last = now
+
+        due = int(self._accumulator / self.dt)
+        self._accumulator -= due * self.dt
+        if due > self.max_catch_up:
+            self.dropped_ticks += due - self.max_catch_up
+            due = self.max_catch_up
+
+        self.ticks += due
+        self._window_ticks += due
+        return due
+
+    def frame_rendered(self):
+        self.frames += 1
+        self._window_frames += 1
+        now = self.clock()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.tick_rate = self._window_ticks / elapsed
+            self.render_rate = self._window_frames / elapsed
+            self._window_start = now
+            self._window_ticks = 0
+            self._window_frames = 0
+
+    def idle_time(self) -> float:
+        """Temps restant avant le prochain tick, à dormir pour ne pas tourner à vide."""
+        return max(0.0, self.dt - self._accumulator - (self.clock() - self._last))
+
+    def stats(self) -> dict:
+        return {
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "dropped_ticks": self.dropped_ticks,
+            "tick_rate": self.tick_rate,
+            "render_rate": self.render_rate,
+        }
@@ -0,0 +1,167 @@
+"""Particules d'explosion stockées en tableaux parallèles.
+
+Une explosion ne crée plus d'objets : ses particules occupent des lignes
+consécutives de colonnes ``x``, ``y``, ``dx``... de capacité fixe, avancées
+toutes ensemble à chaque tick (vectorisé si NumPy est présent) puis
+dessinées d'un seul passage par le front end.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PARTICLE_CAPACITY = 2048
+# Durées en secondes, vitesses en pixels par seconde
+PARTICLE_LIFE = 0.3
+PARTICLE_SPEED_MIN = 180
+PARTICLE_SPEED_MAX = 360
+# Fraction de vitesse conservée après une seconde (0.92 par image à 60 FPS)
+PARTICLE_DRAG = 0.92 ** 60
+FLASH_LIFE = 0.1
+FLASH_GROWTH = 300
+FLASH_COLOR = "#FFFFFF"
+
+_COLUMNS = ("x", "y", "prev_x", "prev_y", "dx", "dy", "speed", "life", "width", "color")
+_INT_COLUMNS = ("width", "color")
+_EPSILON = 1e-9
+
+
+def _column(kind: str, capacity: int, use_numpy: bool):
+    if use_numpy:
+        return np.zeros(capacity, dtype=np.int32 if kind == "i" else np.float64)
+    return array(kind, bytes(capacity * array(kind).itemsize))
+
+
+class ParticleSystem:
+    """Toutes les particules vivantes, dans ``count`` premières lignes.
+
+    ``color`` est un indice dans ``palette``. Une fois la capacité atteinte,
+    les nouvelles particules sont ignorées et comptées dans ``dropped``.
+    Les flashs blancs, un par explosion, vivent dans ``flashes`` sous forme
+    de listes ``[x, y, life]``.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, use_numpy: bool | None = None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        self.use_numpy = use_numpy
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.palette = []
+        self._color_index = {}
+        self.flashes = []
+        for name in _COLUMNS:
+            setattr(self, name, _column("i" if name in _INT_COLUMNS else "d", capacity, use_numpy))
+
+    def clear(self):
+        self.count = 0
+        self.flashes = []
+
+    def color_index(self, color: str) -> int:
+        index = self._color_index.get(color)
+        if index is None:
+            index = self._color_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def emit(self, x: float, y: float, color: str, count: int, rng: random.Random):
+        """Ajoute une explosion de ``count`` particules et son flash."""
+        color = self.color_index(color)
+        self.flashes.append([x, y, PARTICLE_LIFE])
+        for i in range(count):
+            angle = math.radians((360 / count) * i + rng.uniform(-15, 15))
+            speed = rng.uniform(PARTICLE_SPEED_MIN, PARTICLE_SPEED_MAX)
+            width = rng.randint(2, 4)
+            n = self.count
+            if n >= self.capacity:
+                self.dropped += 1
+                continue
+            self.x[n] = self.prev_x[n] = x
+            self.y[n] = self.prev_y[n] = y
+            self.dx[n] = math.cos(angle)
+            self.dy[n] = math.sin(angle)
+            self.speed[n] = speed
+            self.life[n] = PARTICLE_LIFE
+            self.width[n] = width
+            self.color[n] = color
+            self.count = n + 1
+
+    def step(self, dt: float):
+        """Vieillit puis avance toutes les particules de ``dt`` secondes."""
+        self.flashes = [[x, y, life - dt] for x, y, life in self.flashes if life - dt > _EPSILON]
+        drag = PARTICLE_DRAG ** dt
+        if self.use_numpy:
+            self._step_numpy(dt, drag)
+        else:
+            self._step_python(dt, drag)
+
+    def _step_numpy(self, dt: float, drag: float):
+        n = self.count
+        if not n:
+            return
+        self.life[:n] -= dt
+        alive = np.flatnonzero(self.life[:n] > _EPSILON)
+        if len(alive) < n:
+            m = len(alive)
+            for name in _COLUMNS:
+                column = getattr(self, name)
+                column[:m] = column[alive]
+            n = self.count = m
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.dx[:n] * self.speed[:n] * dt
+        self.y[:n] += self.dy[:n] * self.speed[:n] * dt
+        self.speed[:n] *= drag
+
+    def _step_python(self, dt: float, drag: float):
+        x, y, prev_x, prev_y = self.x, self.y, self.prev_x, self.prev_y
+        dx, dy, speed, life = self.dx, self.dy, self.speed, self.life
+        width, color = self.width, self.color
+        kept = 0
+        for i in range(self.count):
+            remaining = life[i] - dt
+            if remaining <= _EPSILON:
+                continue
+            if kept != i:
+                dx[kept] = dx[i]
+                dy[kept] = dy[i]
+                width[kept] = width[i]
+                color[kept] = color[i]
+            s = speed[i]
+            life[kept] = remaining
+            prev_x[kept] = x[i]
+            prev_y[kept] = y[i]
+            x[kept] = x[i] + dx[i] * s * dt
+            y[kept] = y[i] + dy[i] * s * dt
+            speed[kept] = s * drag
+            kept += 1
+        self.count = kept
+
+    def visible(self):
+        """Itère sur les particules à dessiner : (x0, y0, x1, y1, taille du point,
+        épaisseur, couleur). Les particules qui viennent de naître attendent
+        leur premier déplacement."""
+        palette = self.palette
+        life = self.life
+        for i in range(self.count):
+            remaining = float(life[i])
+            if remaining >= PARTICLE_LIFE:
+                continue
+            # Le point rétrécit d'un pixel toutes les 50 ms
+            yield (float(self.prev_x[i]), float(self.prev_y[i]), float(self.x[i]), float(self.y[i]),
+                   max(1, int(remaining * 20 + _EPSILON)), int(self.width[i]), palette[self.color[i]])
+
+    def visible_flashes(self):
+        """Itère sur les flashs à dessiner : (x, y, diamètre)."""
+        for x, y, life in self.flashes:
+            size = (life - (PARTICLE_LIFE - FLASH_LIFE)) * FLASH_GROWTH
+            if size > _EPSILON and life < PARTICLE_LIFE:
+                yield x, y, round(size)
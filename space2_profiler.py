@@ -0,0 +1,135 @@
+"""Profilage image par image de Space Invaders 2.0.
+
+Chaque étape de la boucle principale appelle ``lap(nom)`` en sortant :
+le temps écoulé depuis l'appel précédent lui est attribué. Un seul appel
+à l'horloge par étape, aucune allocation : l'instrumentation reste active
+en permanence. À la fin de l'image, ``end_frame`` range les durées et les
+compteurs d'entités dans des fenêtres glissantes (p50/p95/p99) et, si un
+fichier est ouvert, y ajoute une ligne CSV ou JSONL.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections import deque
+
+PROFILE_WINDOW = 300
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Percentile au rang le plus proche d'une liste déjà triée."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    """Durées par étape et compteurs d'entités des ``window`` dernières images.
+
+    ``stages`` et ``counters`` fixent l'ordre des colonnes et doivent porter
+    des noms distincts ; une étape inconnue passée à ``lap`` lève ``KeyError``.
+    """
+
+    def __init__(self, stages, counters=(), window: int = PROFILE_WINDOW, clock=time.perf_counter):
+        self.stages = tuple(stages)
+        self.counters = tuple(counters)
+        names = self.stages + self.counters + ("frame", "frame_ms")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Noms de colonnes en double: {names}")
+        self.clock = clock
+        self.frames = 0
+
+        self._index = {name: i for i, name in enumerate(self.stages)}
+        self._current = [0.0] * len(self.stages)
+        self.history = [deque(maxlen=window) for _ in self.stages]
+        self.frame_times = deque(maxlen=window)
+        self.counts = {name: deque(maxlen=window) for name in self.counters}
+
+        self._last = clock()
+        self._file = None
+        self._writer = None
+
+    def lap(self, stage: str):
+        now = self.clock()
+        self._current[self._index[stage]] += now - self._last
+        self._last = now
+
+    def skip(self):
+        """Ignore le temps écoulé depuis la dernière étape (attente, pause)."""
+        self._last = self.clock()
+
+    def end_frame(self, counts: dict | None = None):
+        """Clôt l'image en cours ; ``counts`` associe un compteur à sa valeur."""
+        current = self._current
+        for column, value in zip(self.history, current):
+            column.append(value)
+        total = sum(current)
+        self.frame_times.append(total)
+        counts = counts or {}
+        for name in self.counters:
+            self.counts[name].append(counts.get(name, 0))
+        self.frames += 1
+
+        if self._file is not None:
+            self._write_row(current, total, counts)
+        self._current = [0.0] * len(self.stages)
+
+    # ------------------ Statistiques ------------------
+
+    def summary(self) -> dict:
+        """``{étape: {"p50": ms, "p95": ms, "p99": ms, "mean": ms}}``, plus
+        ``"frame"`` pour la somme des étapes."""
+        result = {}
+        columns = list(zip(self.stages, self.history)) + [("frame", self.frame_times)]
+        for name, column in columns:
+            values = sorted(column)
+            stats = {f"p{p}": percentile(values, p) * 1000 for p in PERCENTILES}
+            stats["mean"] = sum(values) / len(values) * 1000 if values else 0.0
+            result[name] = stats
+        return result
+
+    def count_summary(self) -> dict:
+        """``{compteur: (dernière valeur, maximum sur la fenêtre)}``."""
+        return {name: (values[-1] if values else 0, max(values, default=0))
+                for name, values in self.counts.items()}
+
+    def format_overlay(self) -> str:
+        lines = [f"{'étape':<16}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<16}{stats['p50']:>7.2f}{stats['p95']:>7.2f}{stats['p99']:>7.2f}")
+        for name, (last, peak) in self.count_summary().items():
+            lines.append(f"{name:<16}{last:>7}{'max':>7}{peak:>7}")
+        return "\n".join(lines)
+
+    # ------------------ Export ------------------
+
+    def open_dump(self, path: str):
+        """Ajoute une ligne par image à ``path`` : JSONL si le nom finit par
+        ``.jsonl``, CSV sinon. Les durées sont en millisecondes."""
+        self._file = open(path, "w", newline="")
+        if path.endswith(".jsonl"):
+            self._writer = None
+        else:
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["frame", *self.stages, "frame_ms", *self.counters])
+
+    def _write_row(self, current: list, total: float, counts: dict):
+        if self._writer is not None:
+            self._writer.writerow([self.frames, *(f"{value * 1000:.4f}" for value in current),
+                                   f"{total * 1000:.4f}", *(counts.get(name, 0) for name in self.counters)])
+            return
+        row = {"frame": self.frames}
+        row.update({name: round(value * 1000, 4) for name, value in zip(self.stages, current)})
+        row["frame_ms"] = round(total * 1000, 4)
+        row.update({name: counts.get(name, 0) for name in self.counters})
+        self._file.write(json.dumps(row) + "\n")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
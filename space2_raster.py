@@ -0,0 +1,415 @@
+"""Rendu hors écran de Space Invaders 2.0 : images sans X ni Tk.
+
+Chaque image est tramée dans un tampon d'octets en mémoire, un octet par
+pixel indiquant une couleur de la palette (256 couleurs au plus, le jeu
+en utilise quelques dizaines). Les images partent sur le disque dès
+qu'elles sont produites : suite de PPM ou de PNG, ou GIF animé écrit
+image par image. La mémoire reste constante quelle que soit la durée.
+
+Les textes (HUD, messages) ne sont pas tramés : seule la scène l'est.
+
+    python3 space2.py --export capture.gif --seed 1 --export-frames 600
+    python3 space2.py --export images/frame.png --replay partie.s2r
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import struct
+import zlib
+
+from space2_engine import (
+    COLOR_BOSS,
+    COLOR_PLAYER,
+    COLOR_PLAYER_SHIELD,
+    ENEMY_LASER_LENGTH,
+    LASER_LENGTH,
+    sweep_inputs,
+)
+from space2_particles import FLASH_COLOR
+from space2_visuals import (
+    BOSS_PULSE_SPEED,
+    COLOR_BG,
+    COLOR_GRID,
+    ENEMY_LASER_TRAIL,
+    HEALTH_BAR_BACK,
+    HEALTH_BAR_HEIGHT,
+    HEALTH_BAR_WIDTH,
+    LASER_TRAIL,
+    STAR_COUNT,
+    TRIANGLE,
+    TWINKLE_SPEED,
+    boss_pulse,
+    health_color,
+    shape_coords,
+    shield_radius,
+    twinkle_brightness,
+)
+
+NAMED_COLORS = {"white": "#FFFFFF"}
+
+
+# ---------------------- Tampon ----------------------
+
+class Raster:
+    """Image indexée ``width`` x ``height``, origine en haut à gauche."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height)
+        self.palette = []
+        self._index = {}
+        self._rows = []
+
+    def color(self, color: str) -> int:
+        index = self._index.get(color)
+        if index is None:
+            if len(self.palette) >= 256:
+                raise ValueError("Plus de 256 couleurs dans la palette")
+            value = NAMED_COLORS.get(color, color).lstrip("#")
+            self.palette.append(bytes.fromhex(value))
+            index = self._index[color] = len(self.palette) - 1
+            self._rows.append(bytes([index]) * self.width)
+        return index
+
+    def fill(self, color: int):
+        self.pixels[:] = self._rows[color] * self.height
+
+    def span(self, row: int, x0: float, x1: float, color: int):
+        """Remplit les pixels dont le centre est entre ``x0`` et ``x1``."""
+        if not 0 <= row < self.height:
+            return
+        start = max(0, math.ceil(x0 - 0.5))
+        end = min(self.width, math.floor(x1 - 0.5) + 1)
+        if end > start:
+            offset = row * self.width
+            self.pixels[offset + start:offset + end] = self._rows[color][:end - start]
+
+    def _rows_between(self, y0: float, y1: float):
+        return range(max(0, math.ceil(y0 - 0.5)), min(self.height, math.floor(y1 - 0.5) + 1))
+
+    def rectangle(self, x0: float, y0: float, x1: float, y1: float, color: int):
+        for row in self._rows_between(min(y0, y1), max(y0, y1)):
+            self.span(row, min(x0, x1), max(x0, x1), color)
+
+    def polygon(self, coords: list, color: int):
+        """Polygone plein (règle pair-impair), ``coords`` à plat : x0, y0, x1..."""
+        xs = coords[0::2]
+        ys = coords[1::2]
+        edges = list(zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]))
+        for row in self._rows_between(min(ys), max(ys)):
+            yc = row + 0.5
+            cuts = sorted(x0 + (yc - y0) * (x1 - x0) / (y1 - y0)
+                          for x0, y0, x1, y1 in edges if (y0 <= yc < y1) or (y1 <= yc < y0))
+            for i in range(0, len(cuts) - 1, 2):
+                self.span(row, cuts[i], cuts[i + 1], color)
+
+    def disc(self, cx: float, cy: float, radius: float, color: int):
+        for row in self._rows_between(cy - radius, cy + radius):
+            dy = row + 0.5 - cy
+            half = math.sqrt(max(0.0, radius * radius - dy * dy))
+            self.span(row, cx - half, cx + half, color)
+
+    def ring(self, cx: float, cy: float, radius: float, width: float, color: int):
+        outer = radius + width / 2
+        inner = radius - width / 2
+        for row in self._rows_between(cy - outer, cy + outer):
+            dy = row + 0.5 - cy
+            half = math.sqrt(max(0.0, outer * outer - dy * dy))
+            if abs(dy) < inner:
+                hole = math.sqrt(inner * inner - dy * dy)
+                self.span(row, cx - half, cx - hole, color)
+                self.span(row, cx + hole, cx + half, color)
+            else:
+                self.span(row, cx - half, cx + half, color)
+
+    def line(self, x0: float, y0: float, x1: float, y1: float, width: float, color: int):
+        """Trait épais à bouts ronds, comme les traits de turtle."""
+        radius = max(width, 1) / 2
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length > 0:
+            nx = -(y1 - y0) / length * radius
+            ny = (x1 - x0) / length * radius
+            self.polygon([x0 + nx, y0 + ny, x1 + nx, y1 + ny, x1 - nx, y1 - ny, x0 - nx, y0 - ny], color)
+        self.disc(x0, y0, radius, color)
+        self.disc(x1, y1, radius, color)
+
+    def rgb(self) -> bytes:
+        """Pixels en RGB 24 bits."""
+        palette = self.palette + [b"\0\0\0"] * (256 - len(self.palette))
+        out = bytearray(len(self.pixels) * 3)
+        for channel in range(3):
+            table = bytes(entry[channel] for entry in palette)
+            out[channel::3] = self.pixels.translate(table)
+        return bytes(out)
+
+
+# ---------------------- Scène ----------------------
+
+class RasterRenderer:
+    """Trame l'état de ``game`` à l'échelle ``scale`` (1 = un pixel par unité)."""
+
+    def __init__(self, game, shapes: dict, scale: float = 1.0, laser_trail: float = LASER_TRAIL,
+                 enemy_laser_trail: float = ENEMY_LASER_TRAIL, seed: int = 0):
+        self.game = game
+        self.shapes = dict(shapes, triangle=TRIANGLE)
+        self.scale = scale
+        self.laser_trail = laser_trail
+        self.enemy_laser_trail = enemy_laser_trail
+        width = round((game.right - game.left) * scale)
+        height = round((game.top - game.bottom) * scale)
+        self.raster = Raster(width, height)
+
+        rng = random.Random(seed)
+        self.stars = []
+        for _ in range(STAR_COUNT):
+            x = rng.randint(int(game.left) + 10, int(game.right) - 10)
+            y = rng.randint(int(game.floor_level) + 20, int(game.top) - 20)
+            self.stars.append((x, y, rng.randint(1, 3), rng.uniform(0, 2 * math.pi), rng.uniform(0.5, 2)))
+
+    def _point(self, x: float, y: float):
+        return (x - self.game.left) * self.scale, (self.game.top - y) * self.scale
+
+    def _shape(self, name: str, x: float, y: float, heading: float = 0.0, size: float = 1.0) -> list:
+        # ``shape_coords`` donne des coordonnées canevas (origine au centre, y vers le bas)
+        coords = shape_coords(self.shapes[name], x, y, heading, size)
+        game = self.game
+        scale = self.scale
+        coords[0::2] = [(cx - game.left) * scale for cx in coords[0::2]]
+        coords[1::2] = [(cy + game.top) * scale for cy in coords[1::2]]
+        return coords
+
+    def render(self) -> Raster:
+        game = self.game
+        raster = self.raster
+        color = raster.color
+        scale = self.scale
+        point = self._point
+
+        raster.fill(color(COLOR_BG))
+
+        grid = color(COLOR_GRID)
+        for i in range(6):
+            _, y = point(0, game.top - 30 - 70 * i)
+            raster.line(10 * scale, y, (game.right - game.left - 10) * scale, y, scale, grid)
+
+        for x, y, size, phase, speed in self.stars:
+            brightness = twinkle_brightness(phase + game.time * TWINKLE_SPEED * speed)
+            grey = int(brightness * 15) * 17
+            px, py = point(x, y)
+            raster.disc(px, py, size * scale / 2, color(f"#{grey:02x}{grey:02x}{grey:02x}"))
+
+        for laser in game.lasers:
+            x0, y0 = point(laser.x, laser.y - self.laser_trail)
+            x1, y1 = point(laser.x, laser.y + LASER_LENGTH)
+            raster.line(x0, y0, x1, y1, laser.width * scale, color(laser.color))
+        for laser in game.enemy_lasers:
+            x0, y0 = point(laser.x, laser.y + self.enemy_laser_trail)
+            x1, y1 = point(laser.x, laser.y - ENEMY_LASER_LENGTH)
+            raster.line(x0, y0, x1, y1, laser.width * scale, color(laser.color))
+
+        particles = game.particles
+        for x, y, size in particles.visible_flashes():
+            px, py = point(x, y)
+            raster.disc(px, py, size * scale / 2, color(FLASH_COLOR))
+        for x0, y0, x1, y1, size, width, particle_color in particles.visible():
+            index = color(particle_color)
+            px0, py0 = point(x0, y0)
+            px1, py1 = point(x1, y1)
+            raster.line(px0, py0, px1, py1, width * scale, index)
+            raster.disc(px1, py1, size * scale / 2, index)
+
+        for alien in game.aliens:
+            raster.polygon(self._shape(alien.shape, alien.x, alien.y), color(alien.color))
+
+        boss = game.boss
+        if boss and boss.active:
+            pulse = boss_pulse(BOSS_PULSE_SPEED * game.time)
+            boss_color = color("white" if boss.flash else COLOR_BOSS)
+            raster.polygon(self._shape("boss_shape", boss.x, boss.y, 0, pulse), boss_color)
+            x0, y0 = point(boss.x - HEALTH_BAR_WIDTH / 2, boss.y + 50)
+            x1, y1 = point(boss.x + HEALTH_BAR_WIDTH / 2, boss.y + 50 + HEALTH_BAR_HEIGHT)
+            raster.rectangle(x0, y0, x1, y1, color(HEALTH_BAR_BACK))
+            health, max_health = boss.health, boss.max_health
+            bar = health_color(health, max_health)
+            raster.rectangle(x0, y0, x0 + max(0, health / max_health) * HEALTH_BAR_WIDTH * scale, y1, color(bar))
+
+        for powerup in game.powerups:
+            raster.polygon(self._shape("powerup_shape", powerup.x, powerup.y, powerup.angle, 1.2),
+                           color(powerup.color))
+
+        if game.shield_active:
+            radius = shield_radius(game.time)
+            px, py = point(game.player_x, game.player_y - 25 + radius)
+            raster.ring(px, py, radius * scale, 2 * scale, color(COLOR_PLAYER_SHIELD))
+        raster.polygon(self._shape("triangle", game.player_x, game.player_y, 90, 1.6), color(COLOR_PLAYER))
+        return raster
+
+
+# ---------------------- Fichiers ----------------------
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_ppm(raster: Raster) -> bytes:
+    return b"P6\n%d %d\n255\n" % (raster.width, raster.height) + raster.rgb()
+
+
+def encode_png(raster: Raster) -> bytes:
+    """PNG à palette (type 3), une ligne non filtrée par rangée."""
+    width, height = raster.width, raster.height
+    rows = bytearray((width + 1) * height)
+    for row in range(height):
+        start = row * (width + 1) + 1
+        rows[start:start + width] = raster.pixels[row * width:(row + 1) * width]
+    header = struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"PLTE", b"".join(raster.palette))
+            + _png_chunk(b"IDAT", zlib.compress(bytes(rows), 6))
+            + _png_chunk(b"IEND", b""))
+
+
+def lzw_encode(pixels: bytes, min_code_size: int = 8) -> bytes:
+    """Compression LZW de GIF, codes de longueur variable en petit-boutiste."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    buffer = 0
+    count = 0
+    size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+
+    def emit(code):
+        nonlocal buffer, count
+        buffer |= code << count
+        count += size
+        while count >= 8:
+            out.append(buffer & 0xFF)
+            buffer >>= 8
+            count -= 8
+
+    emit(clear)
+    prefix = pixels[0]
+    for byte in pixels[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << size) and size < 12:
+                size += 1
+        else:
+            emit(clear)
+            table.clear()
+            next_code = end + 1
+            size = min_code_size + 1
+        prefix = byte
+    emit(prefix)
+    emit(end)
+    if count:
+        out.append(buffer & 0xFF)
+    return bytes(out)
+
+
+class GifWriter:
+    """GIF animé en boucle, écrit image par image avec une palette locale."""
+
+    def __init__(self, path: str, width: int, height: int, delay_cs: int):
+        self.file = open(path, "wb")
+        self.delay_cs = delay_cs
+        self.frames = 0
+        self.file.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+        # Extension NETSCAPE2.0 : lecture en boucle
+        self.file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def write(self, raster: Raster):
+        palette = b"".join(raster.palette).ljust(256 * 3, b"\0")
+        data = lzw_encode(bytes(raster.pixels))
+        out = bytearray(b"\x21\xf9\x04\x00" + struct.pack("<H", self.delay_cs) + b"\x00\x00")
+        out += b"\x2c" + struct.pack("<HHHHB", 0, 0, raster.width, raster.height, 0x87) + palette
+        out.append(8)
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            out.append(len(block))
+            out += block
+        out.append(0)
+        self.file.write(out)
+        self.frames += 1
+
+    def close(self):
+        self.file.write(b"\x3b")
+        self.file.close()
+
+
+class SequenceWriter:
+    """Une image par fichier ; ``pattern`` contient un champ ``%d``."""
+
+    def __init__(self, pattern: str, encode):
+        self.pattern = pattern
+        self.encode = encode
+        self.frames = 0
+
+    def write(self, raster: Raster):
+        with open(self.pattern % self.frames, "wb") as image:
+            image.write(self.encode(raster))
+        self.frames += 1
+
+    def close(self):
+        pass
+
+
+def open_writer(path: str, width: int, height: int, fps: float):
+    """Écrivain choisi selon l'extension : ``.gif``, ``.png`` ou ``.ppm``.
+
+    Pour une suite d'images, ``path`` peut contenir un champ ``%d`` ; sans
+    lui, le numéro est ajouté avant l'extension (``frame_00000.png``...).
+    """
+    root, dot, extension = path.rpartition(".")
+    extension = extension.lower()
+    if extension == "gif":
+        return GifWriter(path, width, height, max(2, round(100 / fps)))
+    if extension not in ("png", "ppm"):
+        raise ValueError(f"Format d'export inconnu: {path!r} (gif, png ou ppm)")
+    if "%" not in path:
+        path = f"{root}_%05d.{extension}"
+    return SequenceWriter(path, encode_png if extension == "png" else encode_ppm)
+
+
+# ---------------------- Export ----------------------
+
+def export(game, path: str, shapes: dict, frames: int, every: int = 2, scale: float = 0.5,
+           inputs=None, laser_trail: float = LASER_TRAIL,
+           enemy_laser_trail: float = ENEMY_LASER_TRAIL) -> int:
+    """Fait avancer ``game`` et enregistre une image tous les ``every`` ticks.
+
+    ``inputs`` itère sur les entrées de chaque tick (un rejeu, par exemple) ;
+    sans lui, ``sweep_inputs`` joue. S'arrête après ``frames`` images ou à la
+    fin des entrées, et renvoie le nombre d'images écrites.
+    """
+    renderer = RasterRenderer(game, shapes, scale, laser_trail, enemy_laser_trail,
+                              seed=game.seed or 0)
+    raster = renderer.raster
+    writer = open_writer(path, raster.width, raster.height, game.tick_rate / every)
+    if inputs is None:
+        inputs = (sweep_inputs(tick, restart=True) for tick in itertools.count())
+    try:
+        written = 0
+        for tick, current in enumerate(inputs):
+            if written >= frames:
+                break
+            game.step(current)
+            if tick % every == 0:
+                writer.write(renderer.render())
+                written += 1
+    finally:
+        writer.close()
+    return written
@@ -0,0 +1,337 @@
+"""Enregistrement et rejeu déterministe des parties de Space Invaders 2.0.
+
+Une partie est entièrement déterminée par sa graine, la taille du terrain
+et les entrées de chaque tick : il suffit de les enregistrer pour la
+rejouer sans fenêtre, aussi vite que possible, et retrouver exactement le
+même état à chaque tick.
+
+Format (petit, écrit au fil de l'eau) ::
+
+    b"S2RP" version   varint(taille) en-tête JSON
+    enregistrement*   varint(ticks depuis le précédent) drapeaux [move] [crc]
+
+Seuls les ticks porteurs d'une entrée ou d'un point de contrôle sont
+écrits. ``drapeaux`` combine ``SHOOT``, ``ATOMIC``, ``PAUSE``, ``RESTART``,
+``MOVE`` (suivi du déplacement en varint zigzag), ``STEER_LEFT`` et
+``STEER_RIGHT`` (touche tenue) et ``CHECKPOINT`` (suivi du CRC32 de l'état
+après le tick, sur 4 octets). Un enregistrement aux
+drapeaux nuls marque la fin ; un fichier tronqué se rejoue jusqu'à son
+dernier enregistrement complet.
+
+    python3 space2.py --record partie.s2r
+    python3 space2_replay.py partie.s2r
+    python3 space2_replay.py --check      # enregistrement puis rejeu de contrôle
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import zlib
+
+from space2_engine import NO_INPUT, Game, Inputs, sweep_inputs
+from space2_profiler import percentile
+from space2_scores import ScoreBoard
+
+MAGIC = b"S2RP"
+# 2 : lasers, aliens et power-ups retirés par échange (ordre différent)
+VERSION = 2
+# Un point de contrôle toutes les secondes de jeu (à 60 ticks/s)
+CHECKPOINT_INTERVAL = 60
+
+SHOOT = 1
+ATOMIC = 2
+PAUSE = 4
+RESTART = 8
+MOVE = 16
+CHECKPOINT = 32
+STEER_LEFT = 64
+STEER_RIGHT = 128
+
+# Partie de contrôle de --check : terrain, graine, durée et record déjà au journal
+CHECK_SIZE = (1200, 800)
+CHECK_SEED = 7
+CHECK_TICKS = 3600
+CHECK_RECORD = 12345
+
+
+class ReplayDivergence(RuntimeError):
+    """Le rejeu ne retrouve pas l'état enregistré."""
+
+    def __init__(self, tick: int, expected: int, actual: int):
+        super().__init__(f"état différent au tick {tick}: attendu {expected:08x}, obtenu {actual:08x}")
+        self.tick = tick
+
+
+def state_digest(game: Game) -> int:
+    """CRC32 de tout ce qui détermine la suite de la partie."""
+    boss = game.boss
+    state = (
+        game.tick, game.state, game.score, game.high_score, game.lives, game.level,
+        game.combo, game.player_x,
+        game.shield_timer, game.rapid_timer, game.triple_timer,
+        game.formation.offset_x, game.formation.offset_y, game.formation.direction,
+        [(alien.row, alien.col) for alien in game.aliens],
+        [(laser.x, laser.y) for laser in game.lasers],
+        [(laser.x, laser.y) for laser in game.enemy_lasers],
+        [(powerup.x, powerup.y, powerup.type) for powerup in game.powerups],
+        (boss.x, boss.health) if boss else None,
+        game.particles.count,
+        game.rng.getstate(),
+    )
+    return zlib.crc32(repr(state).encode())
+
+
+# ---------------------- Encodage ----------------------
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(stream) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise EOFError
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _flags(inputs: Inputs) -> int:
+    return ((SHOOT if inputs.shoot else 0) | (ATOMIC if inputs.atomic else 0)
+            | (PAUSE if inputs.pause else 0) | (RESTART if inputs.restart else 0)
+            | (MOVE if inputs.move else 0)
+            | (STEER_LEFT if inputs.steer < 0 else STEER_RIGHT if inputs.steer > 0 else 0))
+
+
+# ---------------------- Enregistrement ----------------------
+
+class Recorder:
+    """Fait avancer ``game`` et écrit ses entrées dans ``path``.
+
+    ``game`` doit être neuf et avoir une graine : c'est elle, avec la
+    taille du terrain, qui est enregistrée dans l'en-tête.
+    """
+
+    def __init__(self, game: Game, path: str, checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        if game.seed is None:
+            raise ValueError("Une partie enregistrée doit avoir une graine")
+        self.game = game
+        self.checkpoint_interval = checkpoint_interval
+        self.last_tick = game.tick
+        self.file = open(path, "wb")
+
+        header = json.dumps({
+            "seed": game.seed,
+            "width": game.right - game.left,
+            "height": game.top - game.bottom,
+            "tick_rate": game.tick_rate,
+            "collision_mode": game.collision_mode,
+            "fire_mode": game.fire_mode,
+            "checkpoint_interval": checkpoint_interval,
+        }).encode()
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        _write_varint(out, len(header))
+        out += header
+        self.file.write(out)
+
+    def step(self, inputs: Inputs = NO_INPUT):
+        game = self.game
+        game.step(inputs)
+        flags = _flags(inputs)
+        if game.tick % self.checkpoint_interval == 0:
+            flags |= CHECKPOINT
+        if not flags:
+            return
+
+        out = bytearray()
+        _write_varint(out, game.tick - self.last_tick)
+        out.append(flags)
+        if flags & MOVE:
+            _write_varint(out, _zigzag(inputs.move))
+        if flags & CHECKPOINT:
+            out += state_digest(game).to_bytes(4, "little")
+        self.file.write(out)
+        self.last_tick = game.tick
+
+    def close(self):
+        if self.file.closed:
+            return
+        out = bytearray()
+        _write_varint(out, self.game.tick - self.last_tick)
+        out.append(0)
+        self.file.write(out)
+        self.file.close()
+
+
+# ---------------------- Rejeu ----------------------
+
+def read_header(stream) -> dict:
+    if stream.read(4) != MAGIC:
+        raise ValueError("Ce fichier n'est pas un enregistrement Space Invaders 2.0")
+    version = stream.read(1)
+    if not version or version[0] != VERSION:
+        raise ValueError(f"Version d'enregistrement non gérée: {version!r}")
+    return json.loads(stream.read(_read_varint(stream)))
+
+
+def read_records(stream):
+    """Itère sur les enregistrements : (tick, entrées, CRC ou None).
+
+    Le dernier, aux drapeaux nuls, porte des entrées vides et marque la
+    fin de la partie ; un fichier tronqué s'arrête simplement plus tôt.
+    """
+    tick = 0
+    while True:
+        try:
+            tick += _read_varint(stream)
+            flags = stream.read(1)
+            if not flags:
+                return
+            flags = flags[0]
+            move = _unzigzag(_read_varint(stream)) if flags & MOVE else 0
+            digest = None
+            if flags & CHECKPOINT:
+                data = stream.read(4)
+                if len(data) < 4:
+                    return
+                digest = int.from_bytes(data, "little")
+        except EOFError:
+            return
+        steer = -1 if flags & STEER_LEFT else 1 if flags & STEER_RIGHT else 0
+        inputs = Inputs(move, bool(flags & SHOOT), bool(flags & ATOMIC),
+                        bool(flags & PAUSE), bool(flags & RESTART), steer)
+        yield tick, inputs, digest
+        if not flags:
+            return
+
+
+def tick_inputs(stream):
+    """Itère tick par tick sur (entrées, CRC ou None), ticks vides compris."""
+    current = 0
+    for tick, inputs, digest in read_records(stream):
+        end = digest is None and not _flags(inputs)
+        while current < tick - 1 or (end and current < tick):
+            current += 1
+            yield NO_INPUT, None
+        if end:
+            return
+        current = tick
+        yield inputs, digest
+
+
+def game_from_header(header: dict) -> Game:
+    return Game(header["width"], header["height"], seed=header["seed"],
+                collision_mode=header["collision_mode"], tick_rate=header["tick_rate"],
+                fire_mode=header.get("fire_mode", "roll"))
+
+
+def replay(path: str, verify: bool = True, durations: list | None = None) -> Game:
+    """Rejoue ``path`` sans fenêtre et renvoie la partie dans son état final.
+
+    Chaque point de contrôle est comparé à l'état rejoué : au premier écart,
+    ``ReplayDivergence`` indique le tick fautif. Si ``durations`` est une
+    liste, la durée de chaque ``step`` y est ajoutée.
+    """
+    clock = time.perf_counter
+    with open(path, "rb") as stream:
+        game = game_from_header(read_header(stream))
+        step = game.step
+        for inputs, digest in tick_inputs(stream):
+            if durations is None:
+                step(inputs)
+            else:
+                start = clock()
+                step(inputs)
+                durations.append(clock() - start)
+            if verify and digest is not None:
+                actual = state_digest(game)
+                if actual != digest:
+                    raise ReplayDivergence(game.tick, digest, actual)
+    return game
+
+
+def round_trip_check(directory: str, ticks: int = CHECK_TICKS) -> Game:
+    """Enregistre une partie scriptée comme ``space2.py --record``, avec un
+    journal de scores non vide chargé au démarrage et complété à chaque fin
+    de partie, puis la rejoue en vérifiant chaque point de contrôle.
+
+    Le journal ne doit rien changer à l'état du moteur : au premier écart,
+    ``ReplayDivergence`` indique le tick fautif.
+    """
+    scores_path = os.path.join(directory, "scores")
+    previous = ScoreBoard(scores_path)
+    previous.add(CHECK_RECORD, 9, 600.0)
+    previous.close()
+
+    path = os.path.join(directory, "partie.s2r")
+    scores = ScoreBoard(scores_path)
+    game = Game(*CHECK_SIZE, seed=CHECK_SEED)
+    recorder = Recorder(game, path)
+    for tick in range(ticks):
+        recorder.step(sweep_inputs(tick, restart=True))
+        if ("gameover",) in game.events:
+            scores.add(game.score, game.level, game.time)
+    recorder.close()
+    scores.close()
+
+    replayed = replay(path)
+    expected, actual = state_digest(game), state_digest(replayed)
+    if expected != actual:
+        raise ReplayDivergence(replayed.tick, expected, actual)
+    return replayed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rejoue une partie enregistrée sans fenêtre")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--no-verify", action="store_true", help="ignore les points de contrôle")
+    parser.add_argument("--slowest", type=int, default=5, help="nombre de ticks les plus lents à lister")
+    parser.add_argument("--check", action="store_true",
+                        help="enregistre puis rejoue une partie scriptée (journal de scores non vide)")
+    args = parser.parse_args()
+
+    if args.check:
+        with tempfile.TemporaryDirectory(prefix="space2_check_") as directory:
+            game = round_trip_check(directory)
+        print(f"rejeu conforme : {game.tick} ticks, score {game.score}, niveau {game.level}")
+        return
+    if args.path is None:
+        parser.error("indiquer un enregistrement, ou --check")
+
+    durations = []
+    start = time.perf_counter()
+    game = replay(args.path, verify=not args.no_verify, durations=durations)
+    elapsed = time.perf_counter() - start
+
+    values = sorted(durations)
+    print(f"{game.tick} ticks en {elapsed:.2f} s ({game.tick / elapsed:.0f} ticks/s)")
+    print(f"score {game.score}, niveau {game.level}, état {game.state}")
+    print("tick (µs): " + "  ".join(f"p{p} {percentile(values, p) * 1e6:.1f}" for p in (50, 95, 99))
+          + f"  max {values[-1] * 1e6 if values else 0.0:.1f}")
+    slowest = sorted(range(len(durations)), key=durations.__getitem__, reverse=True)[:args.slowest]
+    for index in slowest:
+        print(f"  tick {index + 1}: {durations[index] * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
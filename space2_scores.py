@@ -0,0 +1,231 @@
+"""Meilleurs scores de Space Invaders 2.0, conservés d'un lancement à l'autre.
+
+Chaque partie terminée ajoute une ligne à un journal texte, sans jamais
+réécrire les précédentes ::
+
+    crc32 score niveau durée date
+
+Le CRC32 (8 chiffres hexadécimaux) couvre le reste de la ligne : une ligne
+tronquée par un arrêt brutal ou abîmée est ignorée à la lecture, les autres
+restent valables. Quand le journal dépasse ``COMPACT_AFTER`` lignes, il est
+réécrit avec les seuls ``TOP_K`` meilleurs scores dans un fichier voisin,
+qui remplace l'ancien d'un coup (``os.replace``) : on lit toujours soit
+l'ancien journal, soit le nouveau.
+
+En mémoire, ``ScoreBoard`` garde un tas des ``TOP_K`` meilleurs scores :
+le menu et l'écran de fin lisent le tableau sans relire le fichier. Les
+écritures (ajout, ``fsync``, compaction) passent par un fil dédié : un disque
+lent ne retarde jamais une image.
+
+    python3 space2_scores.py              # tableau et état du journal
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import os
+import queue
+import threading
+import time
+import zlib
+
+SCORES_PATH = os.path.join(os.path.expanduser("~"), ".space2_scores")
+TOP_K = 10
+# Lignes au-delà desquelles le journal est réduit à ses TOP_K meilleures
+COMPACT_AFTER = 200
+
+
+class Score:
+    """Une partie terminée ; à score égal, la plus ancienne est devant."""
+
+    __slots__ = ("score", "level", "seconds", "date")
+
+    def __init__(self, score: int, level: int, seconds: float, date: int):
+        self.score = score
+        self.level = level
+        self.seconds = seconds
+        self.date = date
+
+    def __lt__(self, other: Score) -> bool:
+        return (self.score, -self.date) < (other.score, -other.date)
+
+    def encode(self) -> bytes:
+        payload = f"{self.score} {self.level} {self.seconds:.1f} {self.date}".encode()
+        return b"%08x %s\n" % (zlib.crc32(payload), payload)
+
+    @classmethod
+    def decode(cls, line: bytes) -> Score | None:
+        """La partie d'une ligne complète, ou None si elle est abîmée."""
+        if not line.endswith(b"\n"):
+            return None
+        checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            score, level, seconds, date = payload.split()
+            return cls(int(score), int(level), float(seconds), int(date))
+        except ValueError:
+            return None
+
+
+def _push(heap: list, entry: Score, capacity: int):
+    if len(heap) < capacity:
+        heapq.heappush(heap, entry)
+    elif heap[0] < entry:
+        heapq.heapreplace(heap, entry)
+
+
+class ScoreBoard:
+    """Les ``capacity`` meilleurs scores de ``path``.
+
+    ``add`` met le tableau à jour tout de suite et confie l'écriture au fil
+    d'écriture, lancé au premier ajout ; ``close`` attend qu'elle soit faite.
+    Une erreur d'écriture est affichée une fois : le tableau reste juste en
+    mémoire pour la session.
+    """
+
+    def __init__(self, path: str = SCORES_PATH, capacity: int = TOP_K, compact_after: int = COMPACT_AFTER):
+        self.path = path
+        self.capacity = capacity
+        self.compact_after = compact_after
+        self.lines = 0
+        self.damaged = 0
+        self.compactions = 0
+        self._heap = []
+        self._table = []
+        self._ends_cleanly = True
+        self._queue = queue.Queue()
+        self._thread = None
+        self._failed = False
+        self.load()
+
+    def load(self):
+        self._heap = []
+        self.lines = 0
+        self.damaged = 0
+        try:
+            with open(self.path, "rb") as stream:
+                lines = stream.readlines()
+        except FileNotFoundError:
+            lines = []
+        for line in lines:
+            entry = Score.decode(line)
+            if entry is None:
+                self.damaged += 1
+                continue
+            self.lines += 1
+            _push(self._heap, entry, self.capacity)
+        # Une dernière ligne tronquée ne doit pas se coller à la suivante
+        self._ends_cleanly = not lines or lines[-1].endswith(b"\n")
+        self._table = sorted(self._heap, reverse=True)
+
+    # ------------------ Lecture ------------------
+
+    def table(self) -> list:
+        """Les meilleurs scores, du premier au dernier."""
+        return self._table
+
+    def best(self) -> int:
+        return self._table[0].score if self._table else 0
+
+    # ------------------ Écriture ------------------
+
+    def add(self, score: int, level: int, seconds: float, date: int | None = None) -> int | None:
+        """Enregistre une partie et renvoie son rang (1 pour la meilleure),
+        ou None si elle n'entre pas dans le tableau."""
+        entry = Score(score, level, round(seconds, 1), int(time.time()) if date is None else date)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_loop, args=(list(self._heap),),
+                                            name="space2-scores", daemon=True)
+            self._thread.start()
+        self._queue.put(entry)
+        _push(self._heap, entry, self.capacity)
+        self._table = sorted(self._heap, reverse=True)
+        for rank, ranked in enumerate(self._table, 1):
+            if ranked is entry:
+                return rank
+        return None
+
+    def close(self, timeout: float = 2.0):
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _write_loop(self, written: list):
+        """Fil d'écriture ; ``written`` est son propre tas des meilleures
+        lignes déjà écrites, seule source de la compaction."""
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            if self._failed:
+                continue
+            _push(written, entry, self.capacity)
+            try:
+                self._append(entry)
+                if self.lines > self.compact_after:
+                    self._compact(written)
+            except OSError as e:
+                self._failed = True
+                print(f"Erreur lors de l'enregistrement des scores: {e}")
+
+    def _append(self, entry: Score):
+        data = entry.encode()
+        if not self._ends_cleanly:
+            data = b"\n" + data
+        with open(self.path, "ab") as stream:
+            stream.write(data)
+            stream.flush()
+            os.fsync(stream.fileno())
+        self._ends_cleanly = True
+        self.lines += 1
+
+    def _compact(self, written: list):
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as stream:
+            stream.write(b"".join(entry.encode() for entry in sorted(written, reverse=True)))
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, self.path)
+        _sync_directory(os.path.dirname(os.path.abspath(self.path)))
+        self.lines = len(written)
+        self.compactions += 1
+
+
+def _sync_directory(directory: str):
+    """Rend le renommage durable (sans effet là où un dossier ne s'ouvre pas)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def format_table(entries: list) -> list:
+    """Une ligne de texte par score : rang, score, niveau, durée et date."""
+    return [f"{rank:>2}. {entry.score:>7}  niv. {entry.level:<3}"
+            f"{int(entry.seconds) // 60:>3}:{int(entry.seconds) % 60:02d}  "
+            f"{time.strftime('%d/%m/%Y', time.localtime(entry.date))}"
+            for rank, entry in enumerate(entries, 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Meilleurs scores de Space Invaders 2.0")
+    parser.add_argument("path", nargs="?", default=SCORES_PATH, help="journal des scores")
+    args = parser.parse_args()
+
+    board = ScoreBoard(args.path)
+    for line in format_table(board.table()) or ["(aucun score)"]:
+        print(line)
+    print(f"{board.lines} lignes valides, {board.damaged} abîmées")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""Balayage de paramètres d'équilibrage de Space Invaders 2.0, sans fenêtre.
+
+Chaque jeu de constantes (voir ``Tuning``) est joué sur plusieurs
+graines par un joueur automatique, parties réparties sur tous les cœurs.
+Le tableau final donne, par jeu de constantes, le niveau atteint, le
+score et le temps de survie. ``--alien-fire`` ajoute le mode de tir des
+aliens au balayage, pour comparer la difficulté des deux modes.
+
+    python3 space2_sweep.py --set alien_shoot_rate=0.36,0.5,0.7 --set alien_step=90,120
+    python3 space2_sweep.py --set boss_health_per_level=10,15 --seeds 50 --player scripted --json
+    python3 space2_sweep.py --alien-fire roll scheduled --seeds 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import time
+
+from space2_engine import (
+    ENEMY_LASER_SPEED,
+    FIRE_MODES,
+    GUTTER,
+    HIT_RADIUS_PLAYER,
+    PLAYER_STEER_SPEED,
+    Game,
+    Inputs,
+    Tuning,
+    sweep_inputs,
+)
+from space2_profiler import percentile
+
+WIDTH = 1536
+HEIGHT = 972
+
+# Durée maximale d'une partie, en secondes de jeu : au-delà, le joueur a survécu
+MAX_GAME_SECONDS = 600
+# Lasers ennemis pris en compte par le bot : hauteur au-dessus du joueur,
+# distance de sécurité et nombre de ticks de déplacement envisagés de chaque
+# côté. Le bot glisse comme une touche tenue (PLAYER_STEER_SPEED), pas plus
+# vite qu'un joueur.
+DODGE_HEIGHT = 160
+DODGE_MARGIN = HIT_RADIUS_PLAYER + 4
+DODGE_STEPS = 10
+
+
+# ---------------------- Joueurs ----------------------
+
+def scripted_player(game: Game) -> Inputs:
+    return sweep_inputs(game.tick)
+
+
+def _hits(game: Game, threats: list, steps: int) -> int:
+    """Lasers de ``threats`` qui toucheraient le joueur s'il glissait pendant
+    ``steps`` ticks (signés) avant de s'arrêter."""
+    direction = 1 if steps > 0 else -1
+    fall = ENEMY_LASER_SPEED * game.dt
+    glide = PLAYER_STEER_SPEED * game.dt
+    hits = 0
+    for laser_x, height in threats:
+        for tick in range(1, int((height + DODGE_MARGIN) / fall) + 2):
+            x = game.player_x + direction * min(tick, abs(steps)) * glide
+            if math.hypot(x - laser_x, height - tick * fall) < DODGE_MARGIN:
+                hits += 1
+                break
+    return hits
+
+
+def bot_player(game: Game) -> Inputs:
+    """Va vers l'alien le plus bas (ou le boss) par le chemin le plus court
+    qu'aucun laser ennemi proche ne coupe."""
+    x = game.player_x
+    threats = [(laser.x, laser.y - game.player_y) for laser in game.enemy_lasers
+               if -DODGE_MARGIN < laser.y - game.player_y < DODGE_HEIGHT]
+
+    boss = game.boss
+    if boss and boss.active:
+        target = boss.x
+    elif game.aliens:
+        target = min(game.aliens, key=lambda alien: (alien.y, abs(alien.x - x))).x
+    else:
+        target = x
+
+    glide = PLAYER_STEER_SPEED * game.dt
+    best = None
+    for steps in range(-DODGE_STEPS, DODGE_STEPS + 1):
+        end_x = x + steps * glide
+        if not game.left + GUTTER < end_x < game.right - GUTTER:
+            continue
+        key = (_hits(game, threats, steps) if threats else 0, abs(target - end_x) // glide, abs(steps))
+        if best is None or key < best[0]:
+            best = (key, steps)
+    steps = best[1] if best else 0
+    return Inputs(steer=(steps > 0) - (steps < 0), shoot=True)
+
+
+PLAYERS = {"bot": bot_player, "scripted": scripted_player}
+
+
+# ---------------------- Parties ----------------------
+
+def play(job: tuple) -> dict:
+    """Une partie jusqu'à la mort ou ``max_seconds`` : ``job`` vaut
+    ``(indice du jeu de constantes, constantes, graine, joueur, max_seconds)``.
+    La constante ``alien_fire`` choisit le mode de tir des aliens."""
+    index, overrides, seed, player, max_seconds = job
+    overrides = dict(overrides)
+    fire_mode = overrides.pop("alien_fire", "roll")
+    game = Game(WIDTH, HEIGHT, seed=seed, collision_mode="grid", tuning=Tuning(**overrides),
+                fire_mode=fire_mode)
+    game.start()
+    choose = PLAYERS[player]
+    max_ticks = round(max_seconds * game.tick_rate)
+    while game.state == "playing" and game.tick < max_ticks:
+        game.step(choose(game))
+    dead = game.state == "gameover"
+    return {"index": index, "seed": seed, "level": game.level, "score": game.score,
+            "dead": dead, "seconds": game.time}
+
+
+def parameter_sets(grid: dict) -> list:
+    """Produit cartésien ``{nom: [valeurs]}`` -> liste de ``{nom: valeur}``."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def sweep(sets: list, seeds: int, player: str = "bot", workers: int | None = None,
+          max_seconds: float = MAX_GAME_SECONDS, first_seed: int = 0) -> list:
+    """Joue chaque jeu de constantes sur ``seeds`` graines et agrège les parties.
+
+    Les mêmes graines servent à tous les jeux de constantes : les écarts
+    viennent des constantes, pas du tirage.
+    """
+    jobs = [(index, overrides, first_seed + seed, player, max_seconds)
+            for index, overrides in enumerate(sets) for seed in range(seeds)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        games = list(map(play, jobs))
+    else:
+        with multiprocessing.get_context().Pool(workers) as pool:
+            games = list(pool.imap_unordered(play, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+
+    rows = []
+    for index, overrides in enumerate(sets):
+        played = [game for game in games if game["index"] == index]
+        levels = sorted(game["level"] for game in played)
+        scores = sorted(game["score"] for game in played)
+        deaths = sorted(game["seconds"] for game in played if game["dead"])
+        rows.append({
+            "params": overrides,
+            "games": len(played),
+            "level_mean": sum(levels) / len(levels),
+            "level_p50": percentile(levels, 50),
+            "level_max": levels[-1],
+            "score_mean": sum(scores) / len(scores),
+            "score_p50": percentile(scores, 50),
+            # Temps de survie des parties perdues ; les autres ont tenu max_seconds
+            "death_p50_s": percentile(deaths, 50) if deaths else None,
+            "survived": 1 - len(deaths) / len(played),
+        })
+    return rows
+
+
+def print_sweep(rows: list):
+    names = list(rows[0]["params"]) if rows else []
+    width = max([len(name) for name in names] + [8]) + 2
+    print("".join(f"{name:>{width}}" for name in names)
+          + f"{'niveau':>9}{'p50':>5}{'max':>5}{'score':>9}{'p50':>8}{'mort p50':>10}{'survie':>8}")
+    for row in rows:
+        death = f"{row['death_p50_s']:.0f} s" if row["death_p50_s"] is not None else "-"
+        print("".join(f"{value:>{width}}" for value in row["params"].values())
+              + f"{row['level_mean']:>9.2f}{row['level_p50']:>5}{row['level_max']:>5}"
+              f"{row['score_mean']:>9.0f}{row['score_p50']:>8}{death:>10}{row['survived']:>8.0%}")
+
+
+def parse_setting(text: str) -> tuple:
+    """``nom=v1,v2`` -> ``(nom, [v1, v2])`` en nombres."""
+    name, _, values = text.partition("=")
+    if name not in Tuning.__slots__ or not values:
+        raise argparse.ArgumentTypeError(
+            f"attendu nom=valeur[,valeur...] avec nom parmi {', '.join(Tuning.__slots__)}")
+    try:
+        return name, [int(value) if value.lstrip("-").isdigit() else float(value)
+                      for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valeur non numérique dans {text!r}") from None
+
+
+def positive_int(text: str) -> int:
+    """Entier d'au moins 1 : sans partie, les moyennes n'ont pas de sens."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"entier attendu, pas {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"au moins 1 attendu, pas {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balayage de constantes d'équilibrage")
+    parser.add_argument("--set", type=parse_setting, action="append", default=[], metavar="NOM=V1,V2",
+                        help="valeurs à essayer pour une constante de Tuning (une fois par constante)")
+    parser.add_argument("--alien-fire", nargs="+", choices=FIRE_MODES, metavar="MODE",
+                        help=f"modes de tir des aliens à comparer ({', '.join(FIRE_MODES)})")
+    parser.add_argument("--seeds", type=positive_int, default=20, help="parties par jeu de constantes")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--player", choices=sorted(PLAYERS), default="bot")
+    parser.add_argument("--workers", type=int, default=None, help="processus (un par cœur par défaut)")
+    parser.add_argument("--max-seconds", type=float, default=MAX_GAME_SECONDS,
+                        help="durée de jeu au-delà de laquelle une partie est arrêtée")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    grid = {}
+    for name, values in args.set:
+        if name in grid:
+            parser.error(f"--set {name} donné plusieurs fois : réunir les valeurs en {name}=v1,v2")
+        grid[name] = values
+    if args.alien_fire:
+        grid["alien_fire"] = args.alien_fire
+    sets = parameter_sets(grid)
+    start = time.perf_counter()
+    rows = sweep(sets, args.seeds, args.player, args.workers, args.max_seconds, args.first_seed)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps({"defaults": Tuning().as_dict(), "player": args.player,
+                          "seeds": args.seeds, "results": rows}, indent=2))
+    else:
+        print_sweep(rows)
+        print(f"{len(sets) * args.seeds} parties en {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Apparence commune aux rendus de Space Invaders 2.0.
+
+Les tortues (``space2.py``), le canevas (``space2_canvas.py``) et la trame
+hors écran (``space2_raster.py``) dessinent la même image : formes,
+couleurs du décor, barre de vie et pulsations sont définies ici une seule
+fois. Chaque rendu n'y ajoute que sa propre horloge : ``time.time()`` à
+l'écran, ``game.time`` pour l'export.
+"""
+
+from __future__ import annotations
+
+import math
+
+from space2_engine import DEFAULT_TICK_RATE, ENEMY_LASER_SPEED, LASER_SPEED
+
+# ---------------------- Décor ----------------------
+COLOR_BG = "#0A0E2A"
+COLOR_GRID = "#15204B"
+
+STAR_COUNT = 80
+# Vitesse angulaire du scintillement (rad/s), multipliée par celle de l'étoile
+TWINKLE_SPEED = 3
+
+# Traînée des lasers : la distance parcourue en une image à 60 FPS
+LASER_TRAIL = LASER_SPEED / DEFAULT_TICK_RATE
+ENEMY_LASER_TRAIL = ENEMY_LASER_SPEED / DEFAULT_TICK_RATE
+
+# ---------------------- Boss ----------------------
+HEALTH_BAR_WIDTH = 150
+HEALTH_BAR_HEIGHT = 12
+HEALTH_BAR_BACK = "#333333"
+# Vitesse angulaire de la pulsation du boss (rad/s)
+BOSS_PULSE_SPEED = 4
+
+# ---------------------- Formes ----------------------
+
+# Forme "triangle" prédéfinie de turtle, utilisée pour le joueur
+TRIANGLE = ((10, -5.77), (0, 11.55), (-10, -5.77))
+
+# Les aliens gardent le cap par défaut de turtle (vers la droite) : l'axe y
+# de leurs formes est tourné vers la droite de l'écran.
+SHAPES = {
+    "alien1": (
+        (-10, 8), (-8, 12), (-6, 12), (-4, 8), (-2, 12), (2, 12), (4, 8),
+        (6, 12), (8, 12), (10, 8), (12, 4), (10, 0), (12, -4), (8, -8),
+        (4, -4), (2, -8), (-2, -8), (-4, -4), (-8, -8), (-12, -4),
+        (-10, 0), (-12, 4)
+    ),
+    "alien2": (
+        (-8, 10), (-4, 12), (0, 12), (4, 12), (8, 10), (10, 6), (10, 2),
+        (8, -2), (10, -6), (8, -10), (6, -8), (4, -12), (2, -8), (0, -6),
+        (-2, -8), (-4, -12), (-6, -8), (-8, -10), (-10, -6), (-8, -2),
+        (-10, 2), (-10, 6)
+    ),
+    "alien3": (
+        (0, 12), (4, 8), (8, 8), (10, 4), (12, 0), (10, -4), (6, -8),
+        (2, -8), (0, -12), (-2, -8), (-6, -8), (-10, -4), (-12, 0),
+        (-10, 4), (-8, 8), (-4, 8)
+    ),
+    # Forme du boss
+    "boss_shape": (
+        (0, 25), (15, 20), (25, 10), (30, 0), (25, -10), (20, -20),
+        (10, -25), (5, -20), (0, -25), (-5, -20), (-10, -25), (-20, -20),
+        (-25, -10), (-30, 0), (-25, 10), (-15, 20)
+    ),
+    # Forme power-up
+    "powerup_shape": (
+        (0, 10), (3, 3), (10, 0), (3, -3), (0, -10), (-3, -3), (-10, 0), (-3, 3)
+    ),
+}
+
+
+def shape_coords(points, x: float, y: float, heading: float = 0.0, scale: float = 1.0) -> list:
+    """Coordonnées canevas d'une forme turtle posée en (x, y).
+
+    Comme turtle, l'axe y de la forme pointe dans la direction ``heading``
+    (en degrés) et ``scale`` vaut ``shapesize(scale, scale)``.
+    """
+    cos_h = math.cos(math.radians(heading))
+    sin_h = math.sin(math.radians(heading))
+    coords = []
+    for px, py in points:
+        px *= scale
+        py *= scale
+        coords.append(x + sin_h * px + cos_h * py)
+        coords.append(-(y - cos_h * px + sin_h * py))
+    return coords
+
+
+# ---------------------- Animations ----------------------
+
+def twinkle_brightness(phase: float) -> float:
+    """Luminosité d'une étoile (0.2 à 1) à la phase ``phase`` de son scintillement."""
+    return max(0.2, min(1.0, 0.6 + 0.5 * math.sin(phase)))
+
+
+def boss_pulse(phase: float) -> float:
+    """Échelle de la forme du boss ; ``phase`` vaut ``BOSS_PULSE_SPEED * t``."""
+    return 1.8 + 0.3 * math.sin(phase)
+
+
+def shield_radius(t: float) -> float:
+    """Rayon du bouclier du joueur à l'instant ``t`` (s)."""
+    return 25 + 3 * math.sin(t * 8)
+
+
+def health_color(health: float, max_health: float) -> str:
+    """Couleur de la barre de vie : verte, puis jaune sous la moitié, rouge sous le quart."""
+    if health > max_health * 0.5:
+        return "#00FF00"
+    if health > max_health * 0.25:
+        return "#FFFF00"
+    return "#FF0000"
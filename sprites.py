@@ -0,0 +1,86 @@
+"""Recyclage des sprites turtle entre entités de courte durée.
+
+Créer une ``turtle.Turtle`` coûte cher et chaque tortue créée reste pour
+toujours dans la liste de l'écran, que chaque ``update()`` parcourt :
+``hideturtle()`` et ``clear()`` la rendent invisible mais pas gratuite.
+turtle n'offre aucun moyen public d'en retirer une : les entités
+nombreuses et éphémères (tirs, aliens, boss) passent donc par un
+``SpritePool`` qui recycle leurs tortues au lieu d'en créer de nouvelles.
+Le nombre de tortues reste ainsi borné par la taille des pools.
+"""
+
+from __future__ import annotations
+
+
+def sync_sprites(sprites: dict, entities, create, draw, release):
+    """Aligne les sprites sur les entités ; ``create`` peut renvoyer None
+    (pool épuisé), l'entité sera alors dessinée à un rendu suivant.
+
+    ``entities`` est un ``EntityStore`` (ou une liste vide pour tout
+    relâcher) : ``entity in entities`` y coûte O(1), sans ensemble
+    temporaire à chaque rendu.
+    """
+    for entity in list(sprites):
+        if entity not in entities:
+            release(sprites.pop(entity))
+    for entity in entities:
+        sprite = sprites.get(entity)
+        if sprite is None:
+            sprite = create(entity)
+            if sprite is None:
+                continue
+            sprites[entity] = sprite
+        draw(entity, sprite)
+
+
+class SpritePool:
+    """Réserve bornée de sprites prêts à l'emploi.
+
+    ``factory()`` construit un sprite caché ; ``reset(sprite)`` le remet
+    dans cet état quand il revient au pool. Au-delà de ``capacity`` sprites
+    en service, ``acquire`` renvoie ``None`` et compte un épuisement :
+    l'appelant réessaiera au rendu suivant.
+    """
+
+    def __init__(self, factory, reset, capacity: int, prefill: int = 0):
+        self.factory = factory
+        self.reset = reset
+        self.capacity = capacity
+        self.free = []
+        self.size = 0
+        self.in_use = 0
+        self.allocations_avoided = 0
+        self.exhausted = 0
+        self.prefill(prefill)
+
+    def prefill(self, count: int):
+        """Construit des sprites libres jusqu'à en avoir ``count`` au total."""
+        while self.size < min(count, self.capacity):
+            self.free.append(self.factory())
+            self.size += 1
+
+    def acquire(self):
+        if self.free:
+            self.allocations_avoided += 1
+            sprite = self.free.pop()
+        elif self.size < self.capacity:
+            sprite = self.factory()
+            self.size += 1
+        else:
+            self.exhausted += 1
+            return None
+        self.in_use += 1
+        return sprite
+
+    def release(self, sprite):
+        self.reset(sprite)
+        self.in_use -= 1
+        self.free.append(sprite)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "allocations_avoided": self.allocations_avoided,
+            "exhausted": self.exhausted,
+        }